@@ -189,12 +189,12 @@ def per_vertex_divergence(
     dot1 = np.einsum("ij,ij->i", X, e1)  # (F,)
     dot2 = np.einsum("ij,ij->i", X, e2)  # (F,)
 
-    # Cotangent contributions (cotans[f, i] is cotan of angle at vertex i)
-    # For vertex i: contrib = cotan[k] * dot(X, e_i) + cotan[j] * dot(X, -e_k)
-    # where j = (i+1)%3, k = (i+2)%3
-    contrib0 = (cotans[:, 2] * dot0 + cotans[:, 1] * (-dot2)) / 2.0
-    contrib1 = (cotans[:, 0] * dot1 + cotans[:, 2] * (-dot0)) / 2.0
-    contrib2 = (cotans[:, 1] * dot2 + cotans[:, 0] * (-dot1)) / 2.0
+    # Cotangent contributions (cotans[f, i] is 1/2 * cotan of angle at vertex i, 'Geodesics in Heat', Crane 2013)
+    # For vertex i, each outgoing edge (i -> j) is weighted by the cotan of the angle opposite to it:
+    # contrib = cotan[k] * dot(X, v_j - v_i) + cotan[j] * dot(X, v_k - v_i), where j = (i+1)%3, k = (i+2)%3
+    contrib0 = cotans[:, 2] * (-dot2) + cotans[:, 1] * dot1
+    contrib1 = cotans[:, 0] * (-dot0) + cotans[:, 2] * dot2
+    contrib2 = cotans[:, 1] * (-dot1) + cotans[:, 0] * dot0
 
     # Accumulate to vertices
     div_X = np.zeros(n_vertices, dtype=np.float64)
@@ -205,6 +205,67 @@ def per_vertex_divergence(
     return div_X
 
 
+def ring_critical_points(
+    scalar_field: NDArray[np.float64],
+    ring_offsets: NDArray[np.intp],
+    ring_indices: NDArray[np.intp],
+) -> tuple[NDArray[np.intp], NDArray[np.intp], NDArray[np.intp]]:
+    """Classify the vertices as minima, maxima and saddles from the sign changes around their one-ring.
+
+    The one-ring of each vertex is closed by repeating its first neighbor. Neighbors with the same value
+    as the vertex are skipped, and the sign changes of (center - neighbor) are counted between consecutive
+    neighbors. No sign change makes an extreme point, an even number of more than two makes a saddle.
+
+    Parameters
+    ----------
+    scalar_field : ndarray (V,)
+        Scalar value per vertex.
+    ring_offsets : ndarray (V + 1,)
+        CSR offsets of the ordered one-rings.
+    ring_indices : ndarray (R,)
+        CSR neighbor indices of the ordered one-rings.
+
+    Returns
+    -------
+    minima : ndarray
+        Indices of the minima, in ascending order.
+    maxima : ndarray
+        Indices of the maxima, in ascending order.
+    saddles : ndarray
+        Indices of the saddles, in ascending order.
+    """
+    n_vertices = len(ring_offsets) - 1
+    counts = np.diff(ring_offsets)
+    has_ring = counts > 0
+
+    # closed rings: every non-empty ring followed by its first neighbor
+    closed_counts = counts + has_ring
+    closed_offsets = np.zeros(n_vertices + 1, dtype=np.intp)
+    np.cumsum(closed_counts, out=closed_offsets[1:])
+    ring_centers = np.repeat(np.arange(n_vertices), counts)
+    closed_ring = np.empty(closed_offsets[-1], dtype=np.intp)
+    closed_ring[np.arange(len(ring_indices)) + (closed_offsets[:-1] - ring_offsets[:-1])[ring_centers]] = ring_indices
+    first_neighbors = ring_indices[ring_offsets[:-1][has_ring]]
+    closed_ring[closed_offsets[1:][has_ring] - 1] = first_neighbors
+
+    centers = np.repeat(np.arange(n_vertices), closed_counts)
+    diffs = scalar_field[centers] - scalar_field[closed_ring]
+    keep = np.abs(diffs) > 0.0
+    diffs, centers = diffs[keep], centers[keep]
+    changes = (diffs[1:] * diffs[:-1] < 0) & (centers[1:] == centers[:-1])
+    sign_changes = np.bincount(centers[1:][changes], minlength=n_vertices)
+
+    extreme = np.zeros(n_vertices, dtype=bool)
+    extreme[has_ring] = sign_changes[has_ring] == 0
+    above_first = np.zeros(n_vertices, dtype=bool)
+    above_first[has_ring] = scalar_field[has_ring] > scalar_field[first_neighbors]
+
+    minima = np.flatnonzero(extreme & ~above_first)
+    maxima = np.flatnonzero(extreme & above_first)
+    saddles = np.flatnonzero((sign_changes > 2) & (sign_changes % 2 == 0))
+    return minima, maxima, saddles
+
+
 def vectorized_distances(
     points1: NDArray[np.float64],
     points2: NDArray[np.float64],
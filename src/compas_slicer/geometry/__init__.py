@@ -1,7 +1,9 @@
 """Core geometric entities: Layer, Path, and PrintPoint."""
 
+from .columnar_printpoints import *  # noqa: F401 E402 F403
 from .layer import *  # noqa: F401 E402 F403
 from .path import *  # noqa: F401 F403
+from .path_array import *  # noqa: F401 E402 F403
 from .print_point import *  # noqa: F401 E402 F403
 from .printpoints_collection import *  # noqa: F401 E402 F403
 
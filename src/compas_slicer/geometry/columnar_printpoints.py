@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+from compas.data import Data
+from compas.geometry import Frame, Point, Vector
+from numpy.typing import NDArray
+
+import compas_slicer.utilities.utils as utils
+from compas_slicer.geometry.print_point import PrintPoint
+from compas_slicer.geometry.printpoints_collection import PrintLayer, PrintPath, PrintPointsCollection
+
+__all__ = ["ColumnarPrintPointsCollection", "PrintPointView", "PrintPathView", "PrintLayerView"]
+
+# extruder toggles are stored as int8, with this value standing for None (not assigned)
+TOGGLE_UNASSIGNED = -1
+
+
+def _nullable_float_column(name: str, doc: str) -> property:
+    """Property of a PrintPointView backed by a float column, where NaN stands for None."""
+
+    def getter(self: PrintPointView) -> float | None:
+        value = getattr(self._collection, name)[self._index]
+        return None if np.isnan(value) else float(value)
+
+    def setter(self: PrintPointView, value: float | None) -> None:
+        getattr(self._collection, name)[self._index] = np.nan if value is None else value
+
+    return property(getter, setter, doc=doc)
+
+
+def _vector_column(name: str, doc: str) -> property:
+    """Property of a PrintPointView backed by an (N, 3) column, returned as a new Vector."""
+
+    def getter(self: PrintPointView) -> Vector:
+        return Vector(*getattr(self._collection, name)[self._index].tolist())
+
+    def setter(self: PrintPointView, value: Any) -> None:
+        getattr(self._collection, name)[self._index] = np.asarray(value, dtype=np.float64)
+
+    return property(getter, setter, doc=doc)
+
+
+class PrintPointView:
+    """Lightweight proxy for one printpoint of a :class:`ColumnarPrintPointsCollection`.
+
+    Exposes the same attributes as :class:`PrintPoint`; reading creates compas objects on demand and
+    assigning writes to the columns of the collection. Note that modifying a returned Point or
+    Vector in place does not change the collection; assign it instead.
+    """
+
+    __slots__ = ("_collection", "_index")
+
+    def __init__(self, collection: ColumnarPrintPointsCollection, index: int) -> None:
+        self._collection = collection
+        self._index = index
+
+    def __repr__(self) -> str:
+        x, y, z = self._collection.positions[self._index]
+        return f"<PrintPointView at ({x:.2f}, {y:.2f}, {z:.2f})>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PrintPointView):
+            return NotImplemented
+        return self._collection is other._collection and self._index == other._index
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def index(self) -> int:
+        """Flat index of the printpoint in the columns of the collection."""
+        return self._index
+
+    @property
+    def pt(self) -> Point:
+        """Position of the printpoint."""
+        return Point(*self._collection.positions[self._index].tolist())
+
+    @pt.setter
+    def pt(self, value: Any) -> None:
+        self._collection.positions[self._index] = np.asarray(value, dtype=np.float64)
+
+    mesh_normal = _vector_column("mesh_normals", "Normal of the mesh at this printpoint.")
+    up_vector = _vector_column("up_vectors", "Vector in up direction.")
+    velocity = _nullable_float_column("velocities", "Velocity for printing, in mm/s.")
+    wait_time = _nullable_float_column("wait_times", "Time in seconds to wait at this printpoint.")
+    blend_radius = _nullable_float_column("blend_radii", "Blend radius in mm.")
+    distance_to_support = _nullable_float_column("distances_to_support", "Distance to support.")
+
+    @property
+    def layer_height(self) -> float:
+        """The distance between the point on this layer and the previous layer."""
+        return float(self._collection.layer_heights[self._index])
+
+    @layer_height.setter
+    def layer_height(self, value: float) -> None:
+        self._collection.layer_heights[self._index] = value
+
+    @property
+    def extruder_toggle(self) -> bool | None:
+        """True if extruder should be on, False if off, None if not assigned."""
+        value = self._collection.extruder_toggles[self._index]
+        return None if value == TOGGLE_UNASSIGNED else bool(value)
+
+    @extruder_toggle.setter
+    def extruder_toggle(self, value: bool | None) -> None:
+        self._collection.extruder_toggles[self._index] = TOGGLE_UNASSIGNED if value is None else int(value)
+
+    @property
+    def is_feasible(self) -> bool:
+        """Whether this printpoint is feasible."""
+        return bool(self._collection.is_feasible[self._index])
+
+    @is_feasible.setter
+    def is_feasible(self, value: bool) -> None:
+        self._collection.is_feasible[self._index] = value
+
+    @property
+    def closest_support_pt(self) -> Point | None:
+        """Closest support point, if assigned."""
+        pt = self._collection.closest_support_pts[self._index]
+        return None if np.isnan(pt[0]) else Point(*pt.tolist())
+
+    @closest_support_pt.setter
+    def closest_support_pt(self, value: Any) -> None:
+        self._collection.closest_support_pts[self._index] = np.nan if value is None else np.asarray(value)
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Additional attributes of the printpoint, stored sparsely in the collection."""
+        return self._collection.attributes.setdefault(self._index, {})
+
+    @attributes.setter
+    def attributes(self, value: dict[str, Any]) -> None:
+        self._collection.attributes[self._index] = value
+
+    @property
+    def frame(self) -> Frame:
+        """Frame with x-axis pointing up, y-axis towards the mesh normal, computed when accessed."""
+        frame = self._collection.frames.get(self._index)
+        return frame if frame is not None else self.get_frame()
+
+    @frame.setter
+    def frame(self, value: Frame | None) -> None:
+        if value is None:
+            self._collection.frames.pop(self._index, None)
+        else:
+            self._collection.frames[self._index] = value
+
+    def get_frame(self) -> Frame:
+        """Returns a Frame with x-axis pointing up, y-axis towards mesh normal."""
+        return PrintPoint(
+            pt=self.pt, layer_height=self.layer_height, mesh_normal=self.mesh_normal, up_vector=self.up_vector
+        ).frame
+
+    def to_printpoint(self) -> PrintPoint:
+        """Returns a standalone PrintPoint with the attributes of this view."""
+        printpoint = PrintPoint(
+            pt=self.pt,
+            layer_height=self.layer_height,
+            mesh_normal=self.mesh_normal,
+            up_vector=self.up_vector,
+            extruder_toggle=self.extruder_toggle,
+            velocity=self.velocity,
+            wait_time=self.wait_time,
+            blend_radius=self.blend_radius,
+            closest_support_pt=self.closest_support_pt,
+            distance_to_support=self.distance_to_support,
+            is_feasible=self.is_feasible,
+            attributes=dict(self._collection.attributes.get(self._index, {})),
+        )
+        printpoint.frame = self._collection.frames.get(self._index)
+        return printpoint
+
+    @property
+    def __data__(self) -> dict[str, Any]:
+        return self.to_printpoint().__data__
+
+    def to_data(self) -> dict[str, Any]:
+        """Returns a dictionary of structured data representing the printpoint."""
+        return self.__data__
+
+
+class PrintPathView:
+    """Read-only view on the printpoints of one path of a :class:`ColumnarPrintPointsCollection`."""
+
+    __slots__ = ("_collection", "_start", "_stop")
+
+    def __init__(self, collection: ColumnarPrintPointsCollection, start: int, stop: int) -> None:
+        self._collection = collection
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[PrintPointView]:
+        return (PrintPointView(self._collection, i) for i in range(self._start, self._stop))
+
+    def __getitem__(self, index: int) -> PrintPointView:
+        n = len(self)
+        if not -n <= index < n:
+            raise IndexError("printpoint index out of range")
+        return PrintPointView(self._collection, self._start + index % n)
+
+    def __repr__(self) -> str:
+        return f"<PrintPathView with {len(self)} points>"
+
+    @property
+    def printpoints(self) -> tuple[PrintPointView, ...]:
+        """The printpoints of the path, as an immutable sequence of views."""
+        return tuple(self)
+
+    @property
+    def indices(self) -> slice:
+        """Slice of the path in the columns of the collection."""
+        return slice(self._start, self._stop)
+
+    @property
+    def positions(self) -> NDArray[np.float64]:
+        """Positions of the printpoints of the path, as a view on the collection column."""
+        return self._collection.positions[self._start : self._stop]
+
+
+class PrintLayerView:
+    """Read-only view on the paths of one layer of a :class:`ColumnarPrintPointsCollection`."""
+
+    __slots__ = ("_collection", "_layer_index")
+
+    def __init__(self, collection: ColumnarPrintPointsCollection, layer_index: int) -> None:
+        self._collection = collection
+        self._layer_index = layer_index
+
+    def __len__(self) -> int:
+        layer_offsets = self._collection.layer_offsets
+        return int(layer_offsets[self._layer_index + 1] - layer_offsets[self._layer_index])
+
+    def __iter__(self) -> Iterator[PrintPathView]:
+        return (self[j] for j in range(len(self)))
+
+    def __getitem__(self, index: int) -> PrintPathView:
+        n = len(self)
+        if not -n <= index < n:
+            raise IndexError("path index out of range")
+        path_index = int(self._collection.layer_offsets[self._layer_index]) + index % n
+        path_offsets = self._collection.path_offsets
+        return PrintPathView(self._collection, int(path_offsets[path_index]), int(path_offsets[path_index + 1]))
+
+    def __repr__(self) -> str:
+        return f"<PrintLayerView with {len(self)} paths>"
+
+    @property
+    def paths(self) -> tuple[PrintPathView, ...]:
+        """The paths of the layer, as an immutable sequence of views."""
+        return tuple(self)
+
+
+class ColumnarPrintPointsCollection(PrintPointsCollection):
+    """A PrintPointsCollection that stores the printpoint attributes as contiguous arrays.
+
+    Every attribute of the printpoints is a column with one row per printpoint, in printing order.
+    Layers and paths are described by offset arrays. Indexing and iterating return lightweight
+    :class:`PrintPointView` proxies, so the collection can be used like a PrintPointsCollection,
+    while print organization utilities can operate on whole columns at once.
+
+    The number of layers and paths is fixed. Only :meth:`remove_printpoints` changes the number of
+    printpoints, and it invalidates the existing views. Use :meth:`to_collection` for operations that
+    add printpoints, or add or remove layers and paths.
+
+    Attributes
+    ----------
+    positions : ndarray (N, 3)
+        Printpoint positions.
+    mesh_normals : ndarray (N, 3)
+        Mesh normals at the printpoints.
+    up_vectors : ndarray (N, 3)
+        Up vectors of the printpoints.
+    layer_heights : ndarray (N,)
+        Layer heights of the printpoints.
+    velocities, wait_times, blend_radii, distances_to_support : ndarray (N,)
+        Optional float attributes, NaN where not assigned.
+    extruder_toggles : ndarray (N,) of int8
+        1 (on), 0 (off) or -1 (not assigned).
+    is_feasible : ndarray (N,) of bool
+        Feasibility of the printpoints.
+    closest_support_pts : ndarray (N, 3)
+        Closest support points, NaN where not assigned.
+    path_offsets : ndarray (P + 1,)
+        Index of the first printpoint of every path, followed by N.
+    layer_offsets : ndarray (L + 1,)
+        Index of the first path of every layer, followed by P.
+    attributes : dict[int, dict]
+        Additional attributes, per flat printpoint index.
+    frames : dict[int, Frame]
+        Explicitly assigned frames, per flat printpoint index. All other frames are computed on access.
+    """
+
+    def __init__(
+        self,
+        positions: NDArray[np.float64],
+        mesh_normals: NDArray[np.float64],
+        layer_heights: NDArray[np.float64] | float,
+        path_offsets: NDArray[np.intp],
+        layer_offsets: NDArray[np.intp],
+        up_vectors: NDArray[np.float64] | None = None,
+    ) -> None:
+        Data.__init__(self)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape((-1, 3))
+        n = len(self.positions)
+        self.mesh_normals = np.asarray(mesh_normals, dtype=np.float64).reshape((n, 3))
+        if up_vectors is None:
+            self.up_vectors = np.tile([0.0, 0.0, 1.0], (n, 1))
+        else:
+            self.up_vectors = np.asarray(up_vectors, dtype=np.float64).reshape((n, 3))
+        self.layer_heights = np.broadcast_to(np.asarray(layer_heights, dtype=np.float64), (n,)).copy()
+        self.path_offsets = np.asarray(path_offsets, dtype=np.intp)
+        self.layer_offsets = np.asarray(layer_offsets, dtype=np.intp)
+        if self.path_offsets[-1] != n or self.layer_offsets[-1] != len(self.path_offsets) - 1:
+            raise ValueError("The offsets do not match the number of printpoints and paths.")
+
+        self.velocities = np.full(n, np.nan)
+        self.wait_times = np.full(n, np.nan)
+        self.blend_radii = np.full(n, np.nan)
+        self.distances_to_support = np.full(n, np.nan)
+        self.extruder_toggles = np.full(n, TOGGLE_UNASSIGNED, dtype=np.int8)
+        self.is_feasible = np.ones(n, dtype=bool)
+        self.closest_support_pts = np.full((n, 3), np.nan)
+        self.attributes: dict[int, dict[str, Any]] = {}
+        self.frames: dict[int, Frame] = {}
+
+    @classmethod
+    def from_collection(cls, collection: PrintPointsCollection) -> ColumnarPrintPointsCollection:
+        """Creates a columnar collection from a PrintPointsCollection of PrintPoints."""
+        printpoints = list(collection.iter_printpoints())
+        path_lengths = [len(path) for layer in collection for path in layer]
+        path_offsets = np.concatenate([[0], np.cumsum(path_lengths, dtype=np.intp)])
+        layer_offsets = np.concatenate([[0], np.cumsum([len(layer) for layer in collection], dtype=np.intp)])
+
+        columnar = cls(
+            positions=np.array([ppt.pt for ppt in printpoints], dtype=np.float64),
+            mesh_normals=np.array([ppt.mesh_normal for ppt in printpoints], dtype=np.float64),
+            layer_heights=np.array([ppt.layer_height for ppt in printpoints], dtype=np.float64),
+            path_offsets=path_offsets,
+            layer_offsets=layer_offsets,
+            up_vectors=np.array([ppt.up_vector for ppt in printpoints], dtype=np.float64),
+        )
+        for i, ppt in enumerate(printpoints):
+            view = PrintPointView(columnar, i)
+            view.extruder_toggle = ppt.extruder_toggle
+            view.velocity = ppt.velocity
+            view.wait_time = ppt.wait_time
+            view.blend_radius = ppt.blend_radius
+            view.closest_support_pt = ppt.closest_support_pt
+            view.distance_to_support = ppt.distance_to_support
+            view.is_feasible = ppt.is_feasible
+            if ppt.attributes:
+                columnar.attributes[i] = ppt.attributes
+            if ppt._frame is not None:  # only the assigned frames, the others are computed when accessed
+                columnar.frames[i] = ppt._frame
+        return columnar
+
+    def to_collection(self) -> PrintPointsCollection:
+        """Returns a PrintPointsCollection with standalone PrintPoints."""
+        return PrintPointsCollection(
+            layers=[
+                PrintLayer(paths=[PrintPath(printpoints=[ppt.to_printpoint() for ppt in path]) for path in layer])
+                for layer in self
+            ]
+        )
+
+    # The views provide the attributes and methods of the PrintLayer, PrintPath and PrintPoint objects that they
+    # stand for, without subclassing them, so the methods that return views are marked as overrides for mypy.
+
+    @property
+    def layers(self) -> tuple[PrintLayerView, ...]:  # type: ignore[override]
+        """The layers of the collection, as an immutable sequence of views."""
+        return tuple(PrintLayerView(self, i) for i in range(self.number_of_layers))
+
+    def __len__(self) -> int:
+        return self.number_of_layers
+
+    def __iter__(self) -> Iterator[PrintLayerView]:  # type: ignore[override]
+        return (PrintLayerView(self, i) for i in range(self.number_of_layers))
+
+    def __getitem__(self, index: int) -> PrintLayerView:  # type: ignore[override]
+        n = self.number_of_layers
+        if not -n <= index < n:
+            raise IndexError("layer index out of range")
+        return PrintLayerView(self, index % n)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ColumnarPrintPointsCollection with {self.number_of_layers} layers, "
+            f"{self.number_of_paths} paths, {self.number_of_printpoints} points>"
+        )
+
+    @property
+    def number_of_layers(self) -> int:
+        """Number of layers."""
+        return len(self.layer_offsets) - 1
+
+    @property
+    def number_of_paths(self) -> int:
+        """Total number of paths across all layers."""
+        return len(self.path_offsets) - 1
+
+    @property
+    def number_of_printpoints(self) -> int:
+        """Total number of print points."""
+        return len(self.positions)
+
+    @property
+    def layer_indices(self) -> NDArray[np.intp]:
+        """Layer index of every printpoint."""
+        points_per_layer = np.diff(self.path_offsets[self.layer_offsets])
+        return np.repeat(np.arange(self.number_of_layers), points_per_layer)
+
+    def frame_axes(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Returns the x and y axes of the computed frames of all printpoints, without creating Frames.
+
+        Frames that were assigned explicitly (see :attr:`frames`) are not taken into account.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray]
+            (N, 3) x axes and (N, 3) y axes.
+
+        """
+        return utils.get_printpoints_frame_axes(self.up_vectors, self.mesh_normals)
+
+    def iter_printpoints(self) -> Iterator[PrintPointView]:  # type: ignore[override]
+        """Iterate over all printpoints in the collection.
+
+        Yields
+        ------
+        PrintPointView
+            A view on each printpoint in the collection.
+
+        """
+        return (PrintPointView(self, i) for i in range(self.number_of_printpoints))
+
+    def iter_with_indices(self) -> Iterator[tuple[PrintPointView, int, int, int]]:  # type: ignore[override]
+        """Iterate over printpoints with their indices.
+
+        Yields
+        ------
+        tuple[PrintPointView, int, int, int]
+            Tuple of (printpoint, layer_index, path_index, point_index).
+
+        """
+        for i in range(self.number_of_layers):
+            for j in range(int(self.layer_offsets[i + 1] - self.layer_offsets[i])):
+                path_index = int(self.layer_offsets[i]) + j
+                start = int(self.path_offsets[path_index])
+                for k in range(int(self.path_offsets[path_index + 1]) - start):
+                    yield PrintPointView(self, start + k), i, j, k
+
+    def get_printpoint(self, layer_idx: int, path_idx: int, pp_idx: int) -> PrintPointView:  # type: ignore[override]
+        """Get a specific printpoint by indices.
+
+        Parameters
+        ----------
+        layer_idx : int
+            Layer index.
+        path_idx : int
+            Path index within the layer.
+        pp_idx : int
+            Printpoint index within the path.
+
+        Returns
+        -------
+        PrintPointView
+            A view on the requested printpoint.
+
+        """
+        return self[layer_idx][path_idx][pp_idx]
+
+    def number_of_paths_on_layer(self, layer_idx: int) -> int:
+        """Get the number of paths in a specific layer.
+
+        Parameters
+        ----------
+        layer_idx : int
+            Layer index.
+
+        Returns
+        -------
+        int
+            Number of paths in the layer.
+
+        """
+        return len(self[layer_idx])
+
+    def remove_printpoints(self, indices: NDArray[np.intp] | list[int]) -> None:
+        """Removes printpoints from all columns, given their flat indices.
+
+        Paths keep their place in the offset arrays, even if all their printpoints are removed.
+        Views created before the removal are invalidated.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            Flat indices of the printpoints to remove.
+
+        """
+        indices = np.unique(np.asarray(indices, dtype=np.intp))
+        if len(indices) == 0:
+            return
+        n = self.number_of_printpoints
+        for name in (
+            "positions",
+            "mesh_normals",
+            "up_vectors",
+            "layer_heights",
+            "velocities",
+            "wait_times",
+            "blend_radii",
+            "distances_to_support",
+            "extruder_toggles",
+            "is_feasible",
+            "closest_support_pts",
+        ):
+            setattr(self, name, np.delete(getattr(self, name), indices, axis=0))
+
+        # new index of every kept printpoint, and new start of every path
+        new_index = np.cumsum(np.isin(np.arange(n), indices, invert=True)) - 1
+        self.path_offsets = self.path_offsets - np.searchsorted(indices, self.path_offsets)
+        removed = set(indices.tolist())
+        self.attributes = {int(new_index[i]): v for i, v in self.attributes.items() if i not in removed}
+        self.frames = {int(new_index[i]): v for i, v in self.frames.items() if i not in removed}
+
+    @property
+    def __data__(self) -> dict[str, Any]:
+        return self.to_collection().__data__
+
+    @classmethod
+    def __from_data__(cls, data: dict[str, Any]) -> ColumnarPrintPointsCollection:
+        return cls.from_collection(PrintPointsCollection.__from_data__(data))
@@ -8,6 +8,7 @@ from compas.data import Data
 from loguru import logger
 
 import compas_slicer.utilities.utils as utils
+from compas_slicer._numpy_ops import min_distances_to_set
 from compas_slicer.geometry.path import Path
 
 if TYPE_CHECKING:
@@ -77,12 +78,11 @@ class Layer(Data):
             raise ValueError("Cannot calculate z_bounds because the list of paths is empty.")
 
         # Vectorized z extraction
-        all_z = []
-        for path in self.paths:
-            for pt in path.points:
-                all_z.append(pt[2])
+        all_z = np.concatenate(
+            [np.asarray(path.points, dtype=np.float64).reshape((-1, 3))[:, 2] for path in self.paths]
+        )
 
-        self.min_max_z_height = (min(all_z), max(all_z))
+        self.min_max_z_height = (float(all_z.min()), float(all_z.max()))
 
     @property
     def __data__(self) -> dict[str, Any]:
@@ -165,7 +165,13 @@ class VerticalLayer(Layer):
         """Add path to self.paths list."""
         self.paths.append(path)
         self.compute_head_centroid()
-        self.calculate_z_bounds()
+        min_z, max_z = self.min_max_z_height
+        if len(self.paths) > 1 and min_z is not None and max_z is not None:
+            # extend the z bounds of the previous paths with the new path
+            path_z = np.asarray(path.points, dtype=np.float64).reshape((-1, 3))[:, 2]
+            self.min_max_z_height = (min(min_z, float(path_z.min())), max(max_z, float(path_z.max())))
+        else:
+            self.calculate_z_bounds()
 
     def compute_head_centroid(self) -> None:
         """Find the centroid of all the points of the last path."""
@@ -238,6 +244,10 @@ class VerticalLayersManager:
     proximity of the centroids of the paths. If the input paths don't fit
     in any vertical layer, then a new vertical layer is created.
 
+    The head centroids of the vertical layers are indexed in a uniform grid that is updated whenever a head
+    moves, so only the heads near each new path are searched for the closest one, and the distances between
+    the path and the head path of the candidate layer are found with a KD-tree.
+
     Attributes
     ----------
     layers : list[VerticalLayer]
@@ -253,48 +263,92 @@ class VerticalLayersManager:
         self.layers: list[VerticalLayer] = [VerticalLayer(id=0)]
         self.avg_layer_height = avg_layer_height
         self.max_paths_per_layer = max_paths_per_layer
+        self._head_grid = _CentroidGrid(5 * avg_layer_height)
+        self._head_points: dict[int, NDArray] = {}  # points of the head path of each layer
 
     def add(self, path: Path) -> None:
         """Add a path to the appropriate vertical layer."""
         selected_layer: VerticalLayer | None = None
+        selected_index = 0
 
         # Find an eligible layer for path
         if len(self.layers[0].paths) == 0:
             selected_layer = self.layers[0]
         else:
-            centroid = np.mean(np.array(path.points), axis=0)
-            other_centroids = get_vertical_layers_centroids_list(self.layers)
-            candidate_layer = self.layers[utils.get_closest_pt_index(centroid, other_centroids)]
-
-            threshold_max_centroid_dist = 5 * self.avg_layer_height
-            if np.linalg.norm(candidate_layer.head_centroid - centroid) < threshold_max_centroid_dist:
-                if self.max_paths_per_layer:
-                    if len(candidate_layer.paths) < self.max_paths_per_layer:
+            pts = np.array(path.points, dtype=np.float64)
+            centroid = np.mean(pts, axis=0)
+            # only the heads within the threshold can be selected, and they are all in the neighboring cells
+            candidate_indices = self._head_grid.query(centroid)
+            if candidate_indices:
+                other_centroids = get_vertical_layers_centroids_list([self.layers[i] for i in candidate_indices])
+                selected_index = candidate_indices[utils.get_closest_pt_index(centroid, other_centroids)]
+                candidate_layer = self.layers[selected_index]
+
+                threshold_max_centroid_dist = 5 * self.avg_layer_height
+                if np.linalg.norm(candidate_layer.head_centroid - centroid) < threshold_max_centroid_dist:
+                    if self.max_paths_per_layer:
+                        if len(candidate_layer.paths) < self.max_paths_per_layer:
+                            selected_layer = candidate_layer
+                    else:
                         selected_layer = candidate_layer
-                else:
-                    selected_layer = candidate_layer
 
-                if selected_layer:
-                    # Check that actual distance between layers is acceptable
-                    pts_selected_layer = np.array(candidate_layer.paths[-1].points)
-                    pts = np.array(path.points)
+                    if selected_layer:
+                        # Check that actual distance between layers is acceptable
+                        dists = min_distances_to_set(pts, self._head_points[selected_index])
+                        min_dist, max_dist = np.min(dists), np.max(dists)
 
-                    min_dist = float("inf")
-                    max_dist = 0.0
-                    for pt in pts:
-                        pt_array = np.tile(pt, (pts_selected_layer.shape[0], 1))
-                        dists = np.linalg.norm(pts_selected_layer - pt_array, axis=1)
-                        min_dist = min(np.min(dists), min_dist)
-                        max_dist = max(np.min(dists), max_dist)
-
-                    if min_dist > 3.0 * self.avg_layer_height or max_dist > 8.0 * self.avg_layer_height:
-                        selected_layer = None
+                        if min_dist > 3.0 * self.avg_layer_height or max_dist > 8.0 * self.avg_layer_height:
+                            selected_layer = None
 
             if not selected_layer:
                 selected_layer = VerticalLayer(id=self.layers[-1].id + 1)
+                selected_index = len(self.layers)
                 self.layers.append(selected_layer)
 
         selected_layer.append_(path)
+        if selected_layer.head_centroid is not None:  # always set by append_
+            self._head_grid.move(selected_index, selected_layer.head_centroid)
+        self._head_points[selected_index] = np.array(path.points, dtype=np.float64)
+
+
+class _CentroidGrid:
+    """Uniform grid of the head centroids of vertical layers, updated when a head moves.
+
+    The cells are slightly larger than the search radius, so all the centroids within the radius of a point
+    are in its cell or in one of the 26 neighboring cells.
+    """
+
+    def __init__(self, radius: float) -> None:
+        self.cell_size = radius * (1 + 1e-6)
+        self.cells: dict[tuple[int, ...], list[int]] = {}
+        self.layer_cells: dict[int, tuple[int, ...]] = {}
+
+    def cell(self, pt: NDArray) -> tuple[int, ...]:
+        return tuple(int(c) for c in np.floor(np.asarray(pt, dtype=np.float64) / self.cell_size))
+
+    def move(self, index: int, pt: NDArray) -> None:
+        """Moves the centroid of the layer index to pt, or adds it if it is not in the grid."""
+        new_cell = self.cell(pt) if self.cell_size > 0 and np.all(np.isfinite(pt)) else None
+        old_cell = self.layer_cells.pop(index, None)
+        if old_cell is not None:
+            self.cells[old_cell].remove(index)
+        if new_cell is not None:
+            self.cells.setdefault(new_cell, []).append(index)
+            self.layer_cells[index] = new_cell
+
+    def query(self, pt: NDArray) -> list[int]:
+        """Returns the sorted indices of the layers whose centroids are in the cell of pt or its neighbors."""
+        if not (self.cell_size > 0 and np.all(np.isfinite(pt))):
+            return []
+        i, j, k = self.cell(pt)
+        indices = [
+            index
+            for di in (-1, 0, 1)
+            for dj in (-1, 0, 1)
+            for dk in (-1, 0, 1)
+            for index in self.cells.get((i + di, j + dj, k + dk), ())
+        ]
+        return sorted(indices)
 
 
 def get_vertical_layers_centroids_list(vert_layers: list[VerticalLayer]) -> list[NDArray]:
@@ -313,4 +367,9 @@ def get_vertical_layers_centroids_list(vert_layers: list[VerticalLayer]) -> list
         List of head centroids.
 
     """
-    return [vert_layer.head_centroid for vert_layer in vert_layers]
+    centroids = []
+    for vert_layer in vert_layers:
+        if vert_layer.head_centroid is None:
+            raise ValueError(f"Vertical layer {vert_layer.id} has no paths, so it has no head centroid.")
+        centroids.append(vert_layer.head_centroid)
+    return centroids
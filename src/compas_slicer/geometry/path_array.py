@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, MutableSequence
+from typing import Any, cast, overload
+
+import numpy as np
+from compas.data import Data
+from compas.geometry import Point
+from numpy.typing import NDArray
+
+from compas_slicer.geometry.path import Path
+
+__all__ = ["PathArray", "PathPoint", "PointsView"]
+
+
+class PathArray(Path):
+    """A Path that stores its points as an (N, 3) float64 array.
+
+    The array is the source of truth, which avoids one compas Point object per point. The ``points``
+    attribute is a lazy :class:`PointsView` on the array, so that PathArray can be used everywhere a
+    Path is expected. ``np.asarray(path.points)`` returns the array itself without copying.
+
+    The items of ``points`` are :class:`PathPoint` objects bound to their index, so that modifying them
+    in place, e.g. ``path.points[i].z = z`` or ``path.points[i][2] += dz``, writes to the array. A point
+    is not updated by later writes to the array, and after inserting, deleting or reordering points it
+    still writes to its old index.
+
+    Attributes
+    ----------
+    coords : ndarray (N, 3)
+        Coordinates of the points of the path.
+    is_closed : bool
+        True if the Path is a closed curve, False if the Path is open.
+        If the path is closed, the first and the last point are identical.
+
+    """
+
+    def __init__(self, coords: NDArray[np.float64] | Iterable[Any], is_closed: bool = False) -> None:
+        Data.__init__(self)
+        self.coords = coords
+        self.is_closed = is_closed
+        if len(self.coords) == 0:
+            raise TypeError("coords must be a non-empty (N, 3) array")
+
+    def __repr__(self) -> str:
+        return f"<PathArray with {len(self.coords)} points>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathArray):
+            return NotImplemented
+        return self.is_closed == other.is_closed and np.array_equal(self.coords, other.coords)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def coords(self) -> NDArray[np.float64]:
+        return self._coords
+
+    @coords.setter
+    def coords(self, value: NDArray[np.float64] | Iterable[Any]) -> None:
+        # arrays given by the caller are not copied here, but on the first write to a single point
+        owned = not hasattr(value, "__array__")
+        self._set_coords(np.asarray(value, dtype=np.float64).reshape((-1, 3)), owned)
+
+    def _set_coords(self, coords: NDArray[np.float64], owned: bool) -> None:
+        """Sets the array of the points; owned is True if no other object holds a reference to its memory."""
+        self._coords = coords
+        self._owns_coords = owned
+
+    def _writeable_coords(self) -> NDArray[np.float64]:
+        """Returns the array of the points, copied once if it is shared, so that it can be written in place."""
+        if not self._owns_coords or not self._coords.flags.writeable:
+            self._set_coords(self._coords.copy(), owned=True)
+        return self._coords
+
+    @property
+    def points(self) -> list[Point]:
+        """Lazy list-like view of the points, creating compas Points only when items are accessed.
+
+        The view is typed as the list of Points of :attr:`Path.points`, whose interface it implements.
+        """
+        return cast("list[Point]", PointsView(self))
+
+    @points.setter
+    def points(self, value: Iterable[Any]) -> None:
+        self.coords = np.asarray(value, dtype=np.float64)
+
+    @classmethod
+    def from_path(cls, path: Path) -> PathArray:
+        """Creates a PathArray from a Path."""
+        return cls(np.asarray(path.points, dtype=np.float64), is_closed=path.is_closed)
+
+    def to_path(self) -> Path:
+        """Returns a Path with a list of compas Points."""
+        return Path(points=[Point(*p) for p in self.coords.tolist()], is_closed=self.is_closed)
+
+    def sliced(self, start: int | None = None, stop: int | None = None, step: int | None = None) -> PathArray:
+        """Returns an open PathArray on a part of the points, sharing memory with this one."""
+        self._owns_coords = False
+        return PathArray(self.coords[start:stop:step], is_closed=False)
+
+    def reversed(self) -> PathArray:
+        """Returns a PathArray with the reversed points, sharing memory with this one."""
+        self._owns_coords = False
+        return PathArray(self.coords[::-1], is_closed=self.is_closed)
+
+    def reverse(self) -> None:
+        """Reverses the direction of the path in place, without copying the points."""
+        self._coords = self._coords[::-1]
+
+    def roll(self, shift: int) -> None:
+        """Rolls the points of the path in place, e.g. to move the seam of a closed path.
+
+        For closed paths whose first and last points are identical, the duplicate point is kept at
+        the end, so that the new first point is the old point at index -shift.
+
+        Parameters
+        ----------
+        shift : int
+            Number of places by which the points are shifted, as in numpy.roll.
+        """
+        if self.is_closed and len(self._coords) > 1 and np.array_equal(self._coords[0], self._coords[-1]):
+            rolled = np.roll(self._coords[:-1], shift, axis=0)
+            self._set_coords(np.vstack([rolled, rolled[:1]]), owned=True)
+        else:
+            self._set_coords(np.roll(self._coords, shift, axis=0), owned=True)
+
+    @property
+    def __data__(self) -> dict[str, Any]:
+        return {
+            "points": self.coords.tolist(),
+            "is_closed": self.is_closed,
+        }
+
+    @classmethod
+    def __from_data__(cls, data: dict[str, Any]) -> PathArray:
+        points_data = data["points"]
+        # Handle both list format and legacy dict format
+        if isinstance(points_data, dict):
+            points_data = [points_data[key] for key in sorted(points_data.keys(), key=lambda x: int(x))]
+        return cls(np.array(points_data, dtype=np.float64), is_closed=data["is_closed"])
+
+
+class PathPoint(Point):
+    """A compas Point of a :class:`PathArray` that writes changes of its coordinates to the array of the path.
+
+    The coordinates are read from the array when the point is created.
+
+    Attributes
+    ----------
+    path : PathArray
+        The path of the point.
+    index : int
+        The index of the point in the array of the path.
+
+    """
+
+    def __init__(self, path: PathArray, index: int) -> None:
+        self.path: PathArray | None = None  # no writes while the coordinates are initialized
+        self.index = range(len(path.coords))[index]
+        super().__init__(*path.coords[self.index].tolist())
+        self.path = path
+
+    @classmethod
+    def __from_data__(cls, data: list[float]) -> Point:
+        # copies and deserialized points are not bound to a path
+        return Point(*data)
+
+    def _write(self, axis: int, value: float) -> None:
+        if self.path is not None:
+            self.path._writeable_coords()[self.index, axis] = value
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._x = float(x)
+        self._write(0, self._x)
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._y = float(y)
+        self._write(1, self._y)
+
+    @property
+    def z(self) -> float:
+        return self._z
+
+    @z.setter
+    def z(self, z: float) -> None:
+        self._z = float(z)
+        self._write(2, self._z)
+
+
+class PointsView(MutableSequence):
+    """List-like view on the points of a :class:`PathArray`.
+
+    Items are returned as new :class:`PathPoint` objects, which write changes of their coordinates
+    to the array of the path. Assigning, inserting, deleting and reversing items also write through
+    to the array of the path.
+    """
+
+    def __init__(self, path: PathArray) -> None:
+        self._path = path
+
+    def __repr__(self) -> str:
+        return f"<PointsView with {len(self)} points>"
+
+    def __len__(self) -> int:
+        return len(self._path.coords)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> NDArray[Any]:
+        coords = self._path.coords
+        if dtype is not None and np.dtype(dtype) != coords.dtype:
+            return coords.astype(dtype)
+        return coords.copy() if copy else coords
+
+    @overload
+    def __getitem__(self, index: int) -> Point: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Point]: ...
+
+    def __getitem__(self, index: int | slice) -> Point | list[Point]:
+        if isinstance(index, slice):
+            return [PathPoint(self._path, i) for i in range(len(self))[index]]
+        return PathPoint(self._path, index)
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            points = self._path.coords.tolist()
+            points[index] = [list(p) for p in value]
+            self._path.coords = points
+        else:
+            self._path._writeable_coords()[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        self._path._set_coords(np.delete(self._path.coords, index, axis=0), owned=True)
+
+    def insert(self, index: int, value: Any) -> None:
+        coords = self._path.coords
+        if index < 0:
+            index = max(0, len(coords) + index)
+        coords = np.insert(coords, min(index, len(coords)), np.asarray(value, dtype=np.float64), axis=0)
+        self._path._set_coords(coords, owned=True)
+
+    def reverse(self) -> None:
+        self._path.reverse()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointsView):
+            return np.array_equal(self._path.coords, other._path.coords)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
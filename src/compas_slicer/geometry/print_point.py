@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Any
 
 from compas.data import Data
@@ -27,6 +27,7 @@ class PrintPoint(Data):
         Vector in up direction.
     frame : Frame
         Frame with x-axis pointing up, y-axis pointing towards the mesh normal.
+        Unless a frame is given or assigned, it is computed from the current attributes when accessed.
     extruder_toggle : bool | None
         True if extruder should be on, False if off.
     velocity : float | None
@@ -50,7 +51,7 @@ class PrintPoint(Data):
     layer_height: float
     mesh_normal: Vector
     up_vector: Vector = field(default_factory=lambda: Vector(0, 0, 1))
-    frame: Frame | None = field(default=None)
+    frame: InitVar[Frame | None] = None
     extruder_toggle: bool | None = None
     velocity: float | None = None
     wait_time: float | None = None
@@ -59,17 +60,18 @@ class PrintPoint(Data):
     distance_to_support: float | None = None
     is_feasible: bool = True
     attributes: dict[str, Any] = field(default_factory=dict)
+    _frame: Frame | None = field(default=None, init=False, repr=False)
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, frame: Frame | None) -> None:
         super().__init__()  # Initialize Data base class
+        # without a frame argument, the dataclass passes the frame property below as the default
+        self._frame = frame if isinstance(frame, Frame) else None
         if not isinstance(self.pt, Point):
             raise TypeError("pt must be a compas.geometry.Point")
         if not isinstance(self.mesh_normal, Vector):
             raise TypeError("mesh_normal must be a compas.geometry.Vector")
         if not self.layer_height:
             raise ValueError("layer_height must be provided")
-        if self.frame is None:
-            self.frame = self._compute_frame()
 
     def __repr__(self) -> str:
         x, y, z = self.pt[0], self.pt[1], self.pt[2]
@@ -92,6 +94,20 @@ class PrintPoint(Data):
         """Returns a Frame with x-axis pointing up, y-axis towards mesh normal."""
         return self._compute_frame()
 
+    # the property replaces the frame init argument on the class, __post_init__ stores the argument in _frame
+    @property  # type: ignore[misc]
+    def frame(self) -> Frame:  # noqa: F811
+        """Frame with x-axis pointing up, y-axis towards mesh normal.
+
+        Unless a frame is given or assigned, it is computed from the current attributes when accessed.
+        Assign None to go back to the computed frame.
+        """
+        return self._frame if self._frame is not None else self._compute_frame()
+
+    @frame.setter
+    def frame(self, frame: Frame | None) -> None:
+        self._frame = frame
+
     @property
     def __data__(self) -> dict[str, Any]:
         return {
@@ -99,7 +115,7 @@ class PrintPoint(Data):
             "layer_height": self.layer_height,
             "mesh_normal": self.mesh_normal.__data__,
             "up_vector": self.up_vector.__data__,
-            "frame": self.frame.__data__ if self.frame else None,
+            "frame": self.frame.__data__,
             "extruder_toggle": self.extruder_toggle,
             "velocity": self.velocity,
             "wait_time": self.wait_time,
@@ -120,12 +136,11 @@ class PrintPoint(Data):
         if data.get("frame"):
             frame = Frame.__from_data__(data["frame"])  # type: ignore[assignment]
 
-        return cls(
+        printpoint = cls(
             pt=Point.__from_data__(data["pt"]),
             layer_height=data["layer_height"],
             mesh_normal=Vector.__from_data__(data["mesh_normal"]),
             up_vector=Vector.__from_data__(data["up_vector"]),
-            frame=frame,
             extruder_toggle=data.get("extruder_toggle"),
             velocity=data.get("velocity"),
             wait_time=data.get("wait_time"),
@@ -135,6 +150,10 @@ class PrintPoint(Data):
             is_feasible=data.get("is_feasible", True),
             attributes=data.get("attributes", {}),
         )
+        # the serialized frame is kept only if it was assigned, a computed frame stays computed
+        if frame is not None and frame != printpoint.frame:
+            printpoint.frame = frame
+        return printpoint
 
     def to_data(self) -> dict[str, Any]:
         """Returns a dictionary of structured data representing the PrintPoint.
@@ -6,11 +6,14 @@ import numpy as np
 from compas.geometry import Point
 from loguru import logger
 
+from compas_slicer.geometry.path_array import PathArray
+
 if TYPE_CHECKING:
+    from compas_slicer.geometry import Layer
     from compas_slicer.slicers import BaseSlicer
 
 
-__all__ = ["seams_align"]
+__all__ = ["seams_align", "seams_align_layer"]
 
 AlignWith = Literal["next_path", "origin", "x_axis", "y_axis"]
 
@@ -35,84 +38,121 @@ def seams_align(slicer: BaseSlicer, align_with: AlignWith | Point = "next_path")
     logger.info(f"Aligning seams to: {align_with}")
 
     for i, layer in enumerate(slicer.layers):
-        for j, path in enumerate(layer.paths):
-            if align_with == "next_path":
-                pt_to_align_with = None  # make sure aligning point is cleared
-
-                #  determines the correct point to align the current path with
-                if len(layer.paths) == 1 and i == 0:
-                    #  if ONE PATH and FIRST LAYER
-                    #  >>> align with second layer
-                    pt_to_align_with = slicer.layers[i + 1].paths[0].points[0]
-                if len(layer.paths) == 1 and i != 0:
-                    last_path_index = len(slicer.layers[i - 1].paths) - 1
-                    #  if ONE PATH and NOT FIRST LAYER
-                    #  >>> align with previous layer
-                    pt_to_align_with = slicer.layers[i - 1].paths[last_path_index].points[-1]
-                if len(layer.paths) != 1 and i == 0 and j == 0:
-                    #  if MULTIPLE PATHS and FIRST LAYER and FIRST PATH
-                    #  >>> align with second path of first layer
-                    pt_to_align_with = slicer.layers[i].paths[i + 1].points[-1]
-                if len(layer.paths) != 1 and j != 0:
-                    #  if MULTIPLE PATHS and NOT FIRST PATH
-                    #  >>> align with previous path
-                    pt_to_align_with = slicer.layers[i].paths[j - 1].points[-1]
-                if len(layer.paths) != 1 and i != 0 and j == 0:
-                    #  if MULTIPLE PATHS and NOT FIRST LAYER and FIRST PATH
-                    #  >>> align with first path of previous layer
-                    last_path_index = len(slicer.layers[i - 1].paths) - 1
-                    pt_to_align_with = slicer.layers[i - 1].paths[last_path_index].points[-1]
-
-            elif align_with == "origin":
-                pt_to_align_with = Point(0, 0, 0)
-            elif align_with == "x_axis":
-                pt_to_align_with = Point(2**32, 0, 0)
-            elif align_with == "y_axis":
-                pt_to_align_with = Point(0, 2**32, 0)
-            elif isinstance(align_with, Point):
-                pt_to_align_with = align_with
-            else:
-                raise NameError("Unknown align_with : " + str(align_with))
-
-            # CLOSED PATHS
-            if path.is_closed:
-                #  get the points of the current layer and path
-                path_to_change = layer.paths[j].points
-
-                # check if start- and end-points are the same point
-                if path_to_change[0] == path_to_change[-1]:
-                    first_last_point_the_same = True
-                    # if they are, remove the last point
-                    path_to_change.pop(-1)
-                else:
-                    first_last_point_the_same = False
-
-                #  computes distance between pt_to_align_with and the current path points (vectorized)
-                ref = np.asarray(pt_to_align_with, dtype=np.float64)
-                pts = np.asarray(path_to_change, dtype=np.float64)
-                distances = np.linalg.norm(pts - ref, axis=1)
-                #  gets the index of the closest point
-                new_start_index = int(np.argmin(distances))
-                #  shifts the list by the distance determined
-                shift_list = path_to_change[new_start_index:] + path_to_change[:new_start_index]
-
-                if first_last_point_the_same:
-                    shift_list = shift_list + [shift_list[0]]
-
-                layer.paths[j].points = shift_list
+        prev_path_end = slicer.layers[i - 1].paths[-1].points[-1] if i > 0 else None
+        next_path_start = slicer.layers[i + 1].paths[0].points[0] if i + 1 < len(slicer.layers) else None
+        seams_align_layer(layer, align_with, prev_path_end, next_path_start)
 
-            else:
-                # OPEN PATHS
-                path_to_change = layer.paths[j].points
 
-                # get the distance between the align point and the start/end point (vectorized)
-                ref = np.asarray(pt_to_align_with, dtype=np.float64)
-                d_start = np.linalg.norm(np.asarray(path_to_change[0]) - ref)
-                d_end = np.linalg.norm(np.asarray(path_to_change[-1]) - ref)
+def seams_align_layer(
+    layer: Layer,
+    align_with: AlignWith | Point = "next_path",
+    prev_path_end: Point | None = None,
+    next_path_start: Point | None = None,
+) -> None:
+    """Aligns the seams of the paths of a single layer, see :func:`seams_align`.
 
-                # if closer to end point > reverse list
-                if d_start > d_end:
-                    layer.paths[j].points.reverse()
+    Parameters
+    ----------
+    layer: :class:`compas_slicer.geometry.Layer`
+        The layer whose paths are aligned.
+    align_with: str or :class:`compas.geometry.Point`
+        Direction to orient the seams in, see :func:`seams_align`.
+    prev_path_end: :class:`compas.geometry.Point` | None
+        Last point of the last path of the previous layer, None for the first layer.
+        Only used when aligning with 'next_path'.
+    next_path_start: :class:`compas.geometry.Point` | None
+        First point of the first path of the next layer, None for the last layer.
+        Only used when aligning with 'next_path'.
+
+    """
+    for j, path in enumerate(layer.paths):
+        if align_with == "next_path":
+            pt_to_align_with = None  # make sure aligning point is cleared
+
+            #  determines the correct point to align the current path with
+            if len(layer.paths) == 1 and prev_path_end is None:
+                #  if ONE PATH and FIRST LAYER
+                #  >>> align with second layer
+                pt_to_align_with = next_path_start
+            if len(layer.paths) == 1 and prev_path_end is not None:
+                #  if ONE PATH and NOT FIRST LAYER
+                #  >>> align with previous layer
+                pt_to_align_with = prev_path_end
+            if len(layer.paths) != 1 and prev_path_end is None and j == 0:
+                #  if MULTIPLE PATHS and FIRST LAYER and FIRST PATH
+                #  >>> align with second path of first layer
+                pt_to_align_with = layer.paths[1].points[-1]
+            if len(layer.paths) != 1 and j != 0:
+                #  if MULTIPLE PATHS and NOT FIRST PATH
+                #  >>> align with previous path
+                pt_to_align_with = layer.paths[j - 1].points[-1]
+            if len(layer.paths) != 1 and prev_path_end is not None and j == 0:
+                #  if MULTIPLE PATHS and NOT FIRST LAYER and FIRST PATH
+                #  >>> align with first path of previous layer
+                pt_to_align_with = prev_path_end
+
+            if pt_to_align_with is None:
+                #  a single layer with a single path has nothing to align with
+                continue
+
+        elif align_with == "origin":
+            pt_to_align_with = Point(0, 0, 0)
+        elif align_with == "x_axis":
+            pt_to_align_with = Point(2**32, 0, 0)
+        elif align_with == "y_axis":
+            pt_to_align_with = Point(0, 2**32, 0)
+        elif isinstance(align_with, Point):
+            pt_to_align_with = align_with
+        else:
+            raise NameError("Unknown align_with : " + str(align_with))
+
+        # CLOSED PATHS, array-backed
+        if path.is_closed and isinstance(path, PathArray):
+            coords = path.coords
+            unique_coords = coords[:-1] if len(coords) > 1 and np.array_equal(coords[0], coords[-1]) else coords
+            ref = np.asarray(pt_to_align_with, dtype=np.float64)
+            new_start_index = int(np.argmin(np.linalg.norm(unique_coords - ref, axis=1)))
+            path.roll(-new_start_index)
+
+        # CLOSED PATHS
+        elif path.is_closed:
+            #  get the points of the current layer and path
+            path_to_change = layer.paths[j].points
+
+            # check if start- and end-points are the same point
+            if path_to_change[0] == path_to_change[-1]:
+                first_last_point_the_same = True
+                # if they are, remove the last point
+                path_to_change.pop(-1)
+            else:
+                first_last_point_the_same = False
+
+            #  computes distance between pt_to_align_with and the current path points (vectorized)
+            ref = np.asarray(pt_to_align_with, dtype=np.float64)
+            pts = np.asarray(path_to_change, dtype=np.float64)
+            distances = np.linalg.norm(pts - ref, axis=1)
+            #  gets the index of the closest point
+            new_start_index = int(np.argmin(distances))
+            #  shifts the list by the distance determined
+            shift_list = path_to_change[new_start_index:] + path_to_change[:new_start_index]
+
+            if first_last_point_the_same:
+                shift_list = shift_list + [shift_list[0]]
+
+            layer.paths[j].points = shift_list
+
+        else:
+            # OPEN PATHS
+            path_to_change = layer.paths[j].points
+
+            # get the distance between the align point and the start/end point (vectorized)
+            ref = np.asarray(pt_to_align_with, dtype=np.float64)
+            d_start = np.linalg.norm(np.asarray(path_to_change[0]) - ref)
+            d_end = np.linalg.norm(np.asarray(path_to_change[-1]) - ref)
+
+            # if closer to end point > reverse list
+            if d_start > d_end:
+                layer.paths[j].points.reverse()
 
 
 if __name__ == "__main__":
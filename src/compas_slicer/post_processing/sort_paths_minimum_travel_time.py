@@ -6,6 +6,8 @@ import numpy as np
 from compas.geometry import Point
 from loguru import logger
 
+from compas_slicer.geometry.path_array import PathArray
+
 if TYPE_CHECKING:
     from compas_slicer.geometry import Path as SlicerPath
     from compas_slicer.slicers import BaseSlicer
@@ -51,7 +53,11 @@ def adjust_seam_to_closest_pos(ref_point: Point, path: SlicerPath) -> None:
 
     # TODO: flip orientation to reduce angular velocity
 
-    if path.is_closed:  # if path is closed
+    if path.is_closed and isinstance(path, PathArray):  # closed, array-backed path
+        pts = path.coords[:-1]
+        closest_point = int(np.argmin(np.linalg.norm(pts - np.asarray(ref_point, dtype=np.float64), axis=1)))
+        path.coords = np.vstack([pts[closest_point:], pts[:closest_point], pts[closest_point : closest_point + 1]])
+    elif path.is_closed:  # if path is closed
         # remove first point
         path.points.pop(-1)
         #  calculate distances from ref_point to vertices of path (vectorized)
@@ -37,9 +37,9 @@ def spiralize_contours(slicer: PlanarSlicer) -> None:
         if len(layer.paths) == 1:
             for path in layer.paths:
                 d = slicer.layer_height / (len(path.points) - 1)
-                for i, _point in enumerate(path.points):
+                for i, point in enumerate(path.points):
                     # add the distance to move to the z value and create new points
-                    path.points[i][2] += d * i
+                    path.points[i] = Point(point[0], point[1], point[2] + d * i)
 
                 # project all points of path back on the mesh surface
                 _, projected_pts = pull_pts_to_mesh_faces(slicer.mesh, path.points)
@@ -6,10 +6,11 @@ from typing import TYPE_CHECKING
 from compas.geometry import Point, dot_vectors, normalize_vector, subtract_vectors
 
 if TYPE_CHECKING:
+    from compas_slicer.geometry import Layer
     from compas_slicer.slicers import BaseSlicer
 
 
-__all__ = ["unify_paths_orientation"]
+__all__ = ["unify_paths_orientation", "unify_layer_paths_orientation"]
 
 
 def unify_paths_orientation(slicer: BaseSlicer) -> None:
@@ -23,15 +24,29 @@ def unify_paths_orientation(slicer: BaseSlicer) -> None:
     """
 
     for i, layer in enumerate(slicer.layers):
-        for j, path in enumerate(layer.paths):
-            reference_points = None  # find reference points for each path, if possible
-            if j > 0:
-                reference_points = layer.paths[j - 1].points
-            elif i > 0 and j == 0:
-                reference_points = slicer.layers[i - 1].paths[0].points
-
-            if reference_points:  # then reorient current pts based on reference
-                path.points = match_paths_orientations(path.points, reference_points, path.is_closed)
+        unify_layer_paths_orientation(layer, slicer.layers[i - 1] if i > 0 else None)
+
+
+def unify_layer_paths_orientation(layer: Layer, prev_layer: Layer | None = None) -> None:
+    """
+    Unifies the orientation of the paths of a single layer, see :func:`unify_paths_orientation`.
+
+    Parameters
+    ----------
+    layer: :class:`compas_slicer.geometry.Layer`
+        The layer whose paths are reoriented.
+    prev_layer: :class:`compas_slicer.geometry.Layer` | None
+        The previous (already unified) layer, None for the first layer.
+    """
+    for j, path in enumerate(layer.paths):
+        reference_points = None  # find reference points for each path, if possible
+        if j > 0:
+            reference_points = layer.paths[j - 1].points
+        elif prev_layer is not None and j == 0:
+            reference_points = prev_layer.paths[0].points
+
+        if reference_points:  # then reorient current pts based on reference
+            path.points = match_paths_orientations(path.points, reference_points, path.is_closed)
 
 
 def match_paths_orientations(pts: list[Point], reference_points: list[Point], is_closed: bool) -> list[Point]:
@@ -8,12 +8,16 @@ from loguru import logger
 from numpy.typing import NDArray
 
 import compas_slicer.utilities as utils
+from compas_slicer._numpy_ops import ring_critical_points
 from compas_slicer.pre_processing.preprocessing_utils import (
     get_face_gradient_from_scalar_field,
     get_vertex_gradient_from_face_gradient,
 )
+from compas_slicer.utilities.scalar_field import ScalarField
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from compas.datastructures import Mesh
 
 
@@ -23,22 +27,31 @@ __all__ = ["GradientEvaluation"]
 class GradientEvaluation:
     """
     Evaluation of the gradient of the scalar function of the mesh.
-    The scalar function should be stored as a vertex attribute on every vertex, with key='scalar_field'
+    The scalar function is given as a :class:`compas_slicer.utilities.ScalarField` (or one value per vertex).
+    If it is not given, it should be stored as a vertex attribute on every vertex, with key='scalar_field'
 
     Attributes
     ----------
     mesh: :class: 'compas.datastructures.Mesh'
     DATA_PATH: str, path to the data folder
+    scalar_field: :class: 'compas_slicer.utilities.ScalarField', the scalar function of the mesh.
 
     """
 
-    def __init__(self, mesh: Mesh, DATA_PATH: str | FilePath) -> None:
-        for v_key, data in mesh.vertices(data=True):
-            if "scalar_field" not in data:
-                raise ValueError(f"Vertex {v_key} does not have the attribute 'scalar_field'")
+    def __init__(
+        self,
+        mesh: Mesh,
+        DATA_PATH: str | FilePath,
+        scalar_field: ScalarField | Sequence[float] | NDArray | None = None,
+    ) -> None:
+        if scalar_field is None:
+            scalar_field = ScalarField.from_mesh_attribute(mesh, "scalar_field")
+        elif not isinstance(scalar_field, ScalarField):
+            scalar_field = ScalarField(mesh, scalar_field)
 
         logger.info("Gradient evaluation")
         self.mesh = mesh
+        self.scalar_field = scalar_field
         self.DATA_PATH = DATA_PATH
         self.OUTPUT_PATH = utils.get_output_directory(DATA_PATH)
 
@@ -53,59 +66,24 @@ class GradientEvaluation:
 
     def compute_gradient(self) -> None:
         """Computes the gradient on the faces and the vertices."""
-        u_v = [self.mesh.vertex[vkey]["scalar_field"] for vkey in self.mesh.vertices()]
-        self.face_gradient = get_face_gradient_from_scalar_field(self.mesh, u_v)
+        self.face_gradient = get_face_gradient_from_scalar_field(self.mesh, self.scalar_field.values)
         self.vertex_gradient = get_vertex_gradient_from_face_gradient(self.mesh, self.face_gradient)
 
     def compute_gradient_norm(self) -> None:
         """Computes the norm of the gradient."""
         logger.info("Computing norm of gradient")
-        f_g = np.array([self.face_gradient[i] for i, fkey in enumerate(self.mesh.faces())])
-        v_g = np.array([self.vertex_gradient[i] for i, vkey in enumerate(self.mesh.vertices())])
-        self.face_gradient_norm = list(np.linalg.norm(f_g, axis=1))
-        self.vertex_gradient_norm = list(np.linalg.norm(v_g, axis=1))
+        self.face_gradient_norm = list(np.linalg.norm(np.asarray(self.face_gradient), axis=1))
+        self.vertex_gradient_norm = list(np.linalg.norm(np.asarray(self.vertex_gradient), axis=1))
 
     def find_critical_points(self) -> None:
         """Finds minima, maxima and saddle points of the scalar function on the mesh."""
-        for vkey, data in self.mesh.vertices(data=True):
-            current_v = data["scalar_field"]
-            neighbors = self.mesh.vertex_neighbors(vkey, ordered=True)
-            values = []
-            if len(neighbors) > 0:
-                neighbors.append(neighbors[0])
-                for n in neighbors:
-                    v = self.mesh.vertex_attributes(n)["scalar_field"]
-                    if abs(v - current_v) > 0.0:
-                        values.append(current_v - v)
-                sgc = count_sign_changes(values)
-
-                if sgc == 0:  # extreme point
-                    if current_v > self.mesh.vertex_attributes(neighbors[0])["scalar_field"]:
-                        self.maxima.append(vkey)
-                    else:
-                        self.minima.append(vkey)
-                if sgc == 2:  # regular point
-                    pass
-                if sgc > 2 and sgc % 2 == 0:
-                    self.saddles.append(vkey)
-
-
-#####################################
-# --- Helpers
-
-
-def count_sign_changes(values: list[float]) -> int:
-    """Returns the number of sign changes in a list of values."""
-    count = 0
-    prev_v: float = 0.0
-    for i, v in enumerate(values):
-        if i == 0:
-            prev_v = v
-        else:
-            if prev_v * v < 0:
-                count += 1
-            prev_v = v
-    return count
+        mesh_arrays = self.scalar_field.mesh_arrays
+        ring_offsets, ring_indices = mesh_arrays.vertex_rings
+        minima, maxima, saddles = ring_critical_points(self.scalar_field.values, ring_offsets, ring_indices)
+        vertex_keys = np.asarray(mesh_arrays.vertex_keys)
+        self.minima = vertex_keys[minima].tolist()
+        self.maxima = vertex_keys[maxima].tolist()
+        self.saddles = vertex_keys[saddles].tolist()
 
 
 if __name__ == "__main__":
@@ -3,13 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from compas.datastructures import Mesh
 from loguru import logger
 
 import compas_slicer.utilities as utils
 from compas_slicer.config import InterpolationConfig
 from compas_slicer.pre_processing.gradient_evaluation import GradientEvaluation
-from compas_slicer.pre_processing.preprocessing_utils import assign_interpolation_distance_to_mesh_vertices
+from compas_slicer.pre_processing.preprocessing_utils import LaplacianSmoother, get_interpolation_distances
 from compas_slicer.pre_processing.preprocessing_utils import region_split as rs
 from compas_slicer.pre_processing.preprocessing_utils import topological_sorting as topo_sort
 from compas_slicer.pre_processing.preprocessing_utils.compound_target import CompoundTarget
@@ -20,6 +21,8 @@ from compas_slicer.pre_processing.preprocessing_utils.mesh_attributes_handling i
 )
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from compas_slicer.pre_processing.preprocessing_utils.topological_sorting import MeshDirectedGraph
 
 
@@ -97,19 +100,26 @@ class InterpolationSlicingPreprocessor:
         self.target_LOW.save_distances("distances_LOW.json")
         self.target_HIGH.save_distances("distances_HIGH.json")
 
-    def targets_laplacian_smoothing(self, iterations: int, strength: float) -> None:
+    def targets_laplacian_smoothing(self, iterations: int, strength: float, implicit: bool = False) -> None:
         """
         Smooth geodesic distances of targets. Saves again the distances to json.
+        Both targets share the operators of one LaplacianSmoother.
 
         Parameters
         ----------
         iterations: int
         strength: float
+        implicit: bool, if True, backward Euler steps instead of explicit steps.
         """
         if self.target_LOW is None or self.target_HIGH is None:
             raise RuntimeError("Targets not initialized. Call create_compound_targets() first.")
-        self.target_LOW.laplacian_smoothing(iterations=iterations, strength=strength)
-        self.target_HIGH.laplacian_smoothing(iterations=iterations, strength=strength)
+        smoother = LaplacianSmoother(self.mesh)
+        self.target_LOW.laplacian_smoothing(
+            iterations=iterations, strength=strength, implicit=implicit, smoother=smoother
+        )
+        self.target_HIGH.laplacian_smoothing(
+            iterations=iterations, strength=strength, implicit=implicit, smoother=smoother
+        )
         self.target_LOW.save_distances("distances_LOW.json")
         self.target_HIGH.save_distances("distances_HIGH.json")
 
@@ -132,10 +142,11 @@ class InterpolationSlicingPreprocessor:
             raise RuntimeError("Targets not initialized. Call create_compound_targets() first.")
         if self.target_LOW.VN != target_1.VN:
             raise ValueError("Preprocessor does not match targets: vertex count mismatch.")
-        assign_interpolation_distance_to_mesh_vertices(
-            self.mesh, weight=0.5, target_LOW=self.target_LOW, target_HIGH=self.target_HIGH
+        scalar_field = utils.ScalarField(
+            self.mesh, get_interpolation_distances(weight=0.5, target_LOW=self.target_LOW, target_HIGH=self.target_HIGH)
         )
-        g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH)
+        scalar_field.to_mesh_attribute("scalar_field")  # for visualization
+        g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH, scalar_field)
         g_evaluation.compute_gradient()
         g_evaluation.compute_gradient_norm()
 
@@ -163,6 +174,7 @@ class InterpolationSlicingPreprocessor:
         separate_neighborhoods: bool = True,
         topological_sorting: bool = True,
         save_split_meshes: bool = True,
+        use_checkpoints: bool = True,
     ) -> None:
         """
         Splits the mesh on the saddle points. This process can take a long time.
@@ -171,66 +183,172 @@ class InterpolationSlicingPreprocessor:
         iso-contour
         2) Separate mesh neighborhoods  from cuts
         3) Topological sorting of split meshes to determine their connectivity and sequence.
-        4) Finally resulting meshes are saved to json.
+        4) Finally resulting meshes are saved to obj and json.
+
+        The meshes are handed from one part to the next in memory. With use_checkpoints, the result of each of the
+        parts (1)-(3) is stored in a CheckpointStore in the output folder, keyed by a hash of the mesh, its
+        boundaries, the config and the distances of the targets, and a part whose inputs are unchanged is loaded
+        instead of recomputed. After part (1), the targets are assigned to the mesh with cuts, with the distances
+        stored in its checkpoint if the part is loaded, so loading a part leaves the same state as computing it.
 
-        The intermediary outputs are saved to json, so if you don'weight want to be recomputing the entire thing every
-        time, you can turn the respective processes to false.
+        Parameters
+        ----------
+        cut_mesh: bool
+            If False, the cuts are not created. The mesh is used as the mesh with cuts if it has 'cut' vertex
+            attributes, otherwise the mesh with cuts of a previous run is loaded from mesh_with_cuts.json.
+        separate_neighborhoods: bool
+            If False, the mesh with cuts is not split, and the split meshes are left unchanged.
+        topological_sorting: bool
+            If False, the split meshes are not sorted and their boundaries are not assigned.
+        save_split_meshes: bool
+            If True, the split meshes are saved to split_mesh_{i}.obj and split_mesh_{i}.json.
+        use_checkpoints: bool
+            If True, the results of the parts are loaded from and saved to the checkpoint store.
         """
 
         logger.info("--- Mesh region splitting")
+        output_path = Path(self.OUTPUT_PATH)
+        checkpoints = utils.CheckpointStore(output_path / "checkpoints") if use_checkpoints else None
 
         if cut_mesh:  # (1)
-            self.mesh.update_default_vertex_attributes({"cut": 0})
-            mesh_splitter = rs.MeshSplitter(self.mesh, self.target_LOW, self.target_HIGH, self.DATA_PATH)
-            mesh_splitter.run()
-
-            self.mesh = mesh_splitter.mesh
-            logger.info("Completed Region splitting")
-            logger.info(f"Region split cut indices: {mesh_splitter.cut_indices}")
-            # save results to json
-            output_path = Path(self.OUTPUT_PATH)
+            key = utils.checkpoint_key("cut", self._region_split_key(), rs.T_SEARCH_RESOLUTION, rs.HIT_THRESHOLD)
+            arrays = checkpoints.load("cut", key) if checkpoints else None
+            if arrays is not None:
+                self.mesh = utils.meshes_from_arrays(arrays)[0]
+                self._assign_targets_to_mesh(arrays)
+            else:
+                self.mesh.update_default_vertex_attributes({"cut": 0})
+                mesh_splitter = rs.MeshSplitter(self.mesh, self.target_LOW, self.target_HIGH, self.DATA_PATH)
+                mesh_splitter.run()
+
+                self.mesh = mesh_splitter.mesh
+                logger.info("Completed Region splitting")
+                logger.info(f"Region split cut indices: {mesh_splitter.cut_indices}")
+                self._assign_targets_to_mesh()
+                if checkpoints:
+                    arrays = utils.meshes_to_arrays([self.mesh])
+                    for name, target in self._targets():
+                        arrays[f"{name}_distances"] = target.get_all_distances_array()
+                    checkpoints.save("cut", key, arrays)
+            # save results to obj and json
             self.mesh.to_obj(str(output_path / "mesh_with_cuts.obj"))
             self.mesh.to_json(str(output_path / "mesh_with_cuts.json"))
             logger.info(f"Saving to Obj and Json: {output_path / 'mesh_with_cuts.json'}")
+        else:
+            if not _has_vertex_attribute(self.mesh, "cut"):
+                # the mesh is the input mesh of a previous run, continue from the mesh with cuts of that run
+                mesh_with_cuts_path = output_path / "mesh_with_cuts.json"
+                if not mesh_with_cuts_path.exists():
+                    raise ValueError(
+                        f"The mesh has no 'cut' vertex attribute and there is no {mesh_with_cuts_path} to load. "
+                        "Run region_split with cut_mesh=True first."
+                    )
+                logger.info(f"Loading the mesh with cuts from {mesh_with_cuts_path}")
+                self.mesh = Mesh.from_json(str(mesh_with_cuts_path))
+            key = utils.checkpoint_key("cut", utils.meshes_to_arrays([self.mesh]))
 
         if separate_neighborhoods:  # (2)
             logger.info("--- Separating mesh disconnected components")
-            self.mesh = Mesh.from_json(str(Path(self.OUTPUT_PATH) / "mesh_with_cuts.json"))
-            region_split_cut_indices = get_existing_cut_indices(self.mesh)
-
-            # save results to json
-            utils.save_to_json(
-                get_vertices_that_belong_to_cuts(self.mesh, region_split_cut_indices),
-                self.OUTPUT_PATH,
-                "vertices_on_cuts.json",
-            )
-
-            self.split_meshes = rs.separate_disconnected_components(
-                self.mesh, attr="cut", values=region_split_cut_indices, OUTPUT_PATH=self.OUTPUT_PATH
-            )
+            key = utils.checkpoint_key("separate", key)
+            arrays = checkpoints.load("separate", key) if checkpoints else None
+            if arrays is not None:
+                self.split_meshes = utils.meshes_from_arrays(arrays)
+            else:
+                region_split_cut_indices = get_existing_cut_indices(self.mesh)
+
+                # save results to json
+                utils.save_to_json(
+                    get_vertices_that_belong_to_cuts(self.mesh, region_split_cut_indices),
+                    self.OUTPUT_PATH,
+                    "vertices_on_cuts.json",
+                )
+
+                self.split_meshes = rs.separate_disconnected_components(
+                    self.mesh, attr="cut", values=region_split_cut_indices, OUTPUT_PATH=self.OUTPUT_PATH
+                )
+                if checkpoints:
+                    checkpoints.save("separate", key, utils.meshes_to_arrays(self.split_meshes))
             logger.info(f"Created {len(self.split_meshes)} split meshes.")
 
         if topological_sorting:  # (3)
             logger.info("--- Topological sort of meshes directed graph to determine print order")
-            graph = topo_sort.MeshDirectedGraph(self.split_meshes, self.DATA_PATH)
-            all_orders = graph.get_all_topological_orders()
-            selected_order = all_orders[0]
-            logger.info(f"selected_order: {selected_order}")  # TODO: improve the way an order is selected
-            self.cleanup_mesh_attributes_based_on_selected_order(selected_order, graph)
-
-            # reorder split_meshes based on selected order
-            self.split_meshes = [self.split_meshes[i] for i in selected_order]
+            key = utils.checkpoint_key("sort", key)
+            arrays = checkpoints.load("sort", key) if checkpoints else None
+            if arrays is not None:
+                self.split_meshes = utils.meshes_from_arrays(arrays)
+                logger.info(f"selected_order: {arrays['selected_order'].tolist()}")
+            else:
+                graph = topo_sort.MeshDirectedGraph(self.split_meshes, self.DATA_PATH)
+                # the first topological order, found without enumerating all orders
+                selected_order = next(graph.iter_topological_orders(), None)
+                if selected_order is None:
+                    raise ValueError("The split meshes have no topological order, their directed graph has a cycle.")
+                logger.info(f"selected_order: {selected_order}")  # TODO: improve the way an order is selected
+                self.cleanup_mesh_attributes_based_on_selected_order(selected_order, graph)
+
+                # reorder split_meshes based on selected order
+                self.split_meshes = [self.split_meshes[i] for i in selected_order]
+                if checkpoints:
+                    arrays = utils.meshes_to_arrays(self.split_meshes)
+                    arrays["selected_order"] = np.array(selected_order, dtype=np.int64)
+                    checkpoints.save("sort", key, arrays)
 
         # --- save split meshes
         if save_split_meshes:  # (4)
             logger.info("--- Saving resulting split meshes")
-            output_path = Path(self.OUTPUT_PATH)
             for i, m in enumerate(self.split_meshes):
                 m.to_obj(str(output_path / f"split_mesh_{i}.obj"))
                 m.to_json(str(output_path / f"split_mesh_{i}.json"))
             logger.info(f"Saving to Obj and Json: {output_path / 'split_mesh_%.obj'}")
             logger.info(f"Saved {len(self.split_meshes)} split_meshes")
 
+    def _targets(self) -> list[tuple[str, CompoundTarget]]:
+        """Returns the existing targets with their names."""
+        targets = [("target_LOW", self.target_LOW), ("target_HIGH", self.target_HIGH)]
+        return [(name, target) for name, target in targets if target is not None]
+
+    def _assign_targets_to_mesh(self, arrays: dict[str, NDArray] | None = None) -> None:
+        """
+        Assigns the targets to the mesh and updates their distances, as MeshSplitter.update_targets does.
+
+        Parameters
+        ----------
+        arrays: dict[str, NDArray] | None
+            The arrays of a checkpoint of the cut part, with the distances of the targets on the mesh.
+            If None, the distances are computed.
+        """
+        for name, target in self._targets():
+            target.assign_new_mesh(self.mesh)
+            target.find_targets_connected_components()
+            if arrays is None:
+                target.compute_geodesic_distances()
+            else:
+                target.update_distances_lists(arrays[f"{name}_distances"].tolist())
+
+    def _region_split_key(self) -> str:
+        """Returns a hash of the inputs of the region split: the mesh, its boundaries, the config and the targets."""
+        mesh_arrays = utils.get_mesh_arrays(self.mesh)
+        targets = [target for target in (self.target_LOW, self.target_HIGH) if target is not None]
+        return utils.checkpoint_key(
+            mesh_arrays.V,
+            mesh_arrays.F,
+            np.array(mesh_arrays.vertex_keys, dtype=np.int64),
+            np.array(self.mesh.vertices_attribute("boundary"), dtype=np.float64),
+            self.config.__data__,
+            [
+                (
+                    target.v_attr,
+                    target.value,
+                    target.union_method,
+                    target.union_params,
+                    target.offset,
+                    target.weight_max_per_cluster,
+                    target.get_all_distances_array(),
+                )
+                for target in targets
+            ],
+        )
+
     def cleanup_mesh_attributes_based_on_selected_order(
         self, selected_order: list[int], graph: MeshDirectedGraph
     ) -> None:
@@ -267,5 +385,10 @@ class InterpolationSlicingPreprocessor:
             )
 
 
+def _has_vertex_attribute(mesh: Mesh, name: str) -> bool:
+    """Returns True if every vertex of the mesh has the attribute, directly or as a default."""
+    return name in mesh.default_vertex_attributes or all(name in data for _vkey, data in mesh.vertices(data=True))
+
+
 if __name__ == "__main__":
     pass
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 from compas.geometry import Frame, Point, Transformation, bounding_box
 from loguru import logger
 
+from compas_slicer.utilities.mesh_arrays import invalidate_mesh_arrays
+
 if TYPE_CHECKING:
     from compas.datastructures import Mesh
 
@@ -30,6 +32,7 @@ def move_mesh_to_point(mesh: Mesh, target_point: Point) -> Mesh:
 
     T = Transformation.from_frame_to_frame(mesh_frame, target_frame)
     mesh.transform(T)
+    invalidate_mesh_arrays(mesh)
 
     logger.info(f"Mesh moved to: {target_point}")
 
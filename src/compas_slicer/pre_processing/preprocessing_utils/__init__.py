@@ -2,6 +2,7 @@ from .assign_vertex_distance import *  # noqa: F401 F403
 from .compound_target import *  # noqa: F401 F403
 from .geodesics import *  # noqa: F401 F403
 from .gradient import *  # noqa: F401 F403
+from .laplacian_smoothing import *  # noqa: F401 F403
 from .mesh_attributes_handling import *  # noqa: F401 F403
 from .region_split import *  # noqa: F401 F403
 
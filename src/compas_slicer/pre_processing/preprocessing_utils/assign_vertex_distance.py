@@ -8,7 +8,9 @@ from compas_slicer.pre_processing.preprocessing_utils.compound_target import (
     blend_union_list,
     chamfer_union_list,
     stairs_union_list,
+    union_array,
 )
+from compas_slicer.utilities.scalar_field import ScalarField
 from compas_slicer.utilities.utils import remap_unbound
 
 if TYPE_CHECKING:
@@ -17,14 +19,20 @@ if TYPE_CHECKING:
     from compas_slicer.pre_processing.preprocessing_utils.compound_target import CompoundTarget
 
 
-__all__ = ["assign_interpolation_distance_to_mesh_vertices", "assign_interpolation_distance_to_mesh_vertex"]
+__all__ = [
+    "assign_interpolation_distance_to_mesh_vertices",
+    "assign_interpolation_distance_to_mesh_vertex",
+    "get_interpolation_distances",
+    "get_interpolation_distances_grid",
+]
 
 
 def assign_interpolation_distance_to_mesh_vertices(
     mesh: Mesh, weight: float, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None
 ) -> None:
     """
-    Fills in the 'get_distance' attribute of every vertex of the mesh.
+    Fills in the 'scalar_field' attribute of every vertex of the mesh, for visualization or export.
+    To evaluate or contour the distances, use get_interpolation_distances and a ScalarField instead.
 
     Parameters
     ----------
@@ -37,15 +45,29 @@ def assign_interpolation_distance_to_mesh_vertices(
         The upper compound target.
     """
     # Vectorized computation for all vertices at once
-    distances = _compute_all_distances_vectorized(weight, target_LOW, target_HIGH)
-    for vkey, d in zip(mesh.vertices(), distances):
-        mesh.vertex[vkey]["scalar_field"] = float(d)
+    distances = get_interpolation_distances(weight, target_LOW, target_HIGH)
+    ScalarField(mesh, distances).to_mesh_attribute("scalar_field")
 
 
-def _compute_all_distances_vectorized(
+def get_interpolation_distances(
     weight: float, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None
 ) -> np.ndarray:
-    """Compute weighted distances for all vertices at once."""
+    """
+    Computes the interpolated distances of all the vertices of the mesh, without assigning them to the mesh.
+
+    Parameters
+    ----------
+    weight: float,
+        The weighting of the distances from the lower and the upper target, from 0 to 1.
+    target_LOW: :class: 'compas_slicer.pre_processing.CompoundTarget'
+        The lower compound target.
+    target_HIGH:  :class: 'compas_slicer.pre_processing.CompoundTarget'
+        The upper compound target.
+
+    Returns
+    ----------
+    np.array (dimensions : #V) one distance per vertex.
+    """
     if target_LOW and target_HIGH:
         return _get_weighted_distances_vectorized(weight, target_LOW, target_HIGH)
     elif target_LOW:
@@ -75,36 +97,55 @@ def _get_weighted_distances_vectorized(
         # Broadcast: (n_boundaries, n_vertices)
         distances = (weights[:, None] - 1) * d_low + weights[:, None] * ds_high
 
-        if target_HIGH.union_method == "min":
-            return np.min(distances, axis=0)
-        elif target_HIGH.union_method == "smooth":
-            return np.array(
-                [
-                    blend_union_list(distances[:, i].tolist(), target_HIGH.union_params[0])
-                    for i in range(distances.shape[1])
-                ]
-            )
-        elif target_HIGH.union_method == "chamfer":
-            return np.array(
-                [
-                    chamfer_union_list(distances[:, i].tolist(), target_HIGH.union_params[0])
-                    for i in range(distances.shape[1])
-                ]
-            )
-        elif target_HIGH.union_method == "stairs":
-            return np.array(
-                [
-                    stairs_union_list(
-                        distances[:, i].tolist(), target_HIGH.union_params[0], target_HIGH.union_params[1]
-                    )
-                    for i in range(distances.shape[1])
-                ]
-            )
+        return union_array(distances, target_HIGH.union_method, target_HIGH.union_params)
     else:
         d_high = target_HIGH.get_all_distances()
         return d_low * (1 - weight) - d_high * weight
 
 
+def get_interpolation_distances_grid(
+    vkeys: list[int], weights: list[float] | np.ndarray, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None
+) -> np.ndarray:
+    """
+    Computes the interpolated distances of some vertices for many weights at once, with the same results as
+    assign_interpolation_distance_to_mesh_vertex for every vertex and weight.
+
+    Parameters
+    ----------
+    vkeys: list, int, the vertex keys.
+    weights: list, float, the weightings of the distances from the lower and the upper target, from 0 to 1.
+    target_LOW: :class: 'compas_slicer.pre_processing.CompoundTarget'
+        The lower compound target.
+    target_HIGH:  :class: 'compas_slicer.pre_processing.CompoundTarget'
+        The upper compound target.
+
+    Returns
+    ----------
+    np.array (dimensions : #vkeys x #weights) the distance of every vertex for every weight.
+    """
+    weights = np.asarray(weights, dtype=np.float64)[np.newaxis, :]  # (1, n_weights)
+    if not target_LOW:
+        raise ValueError("You need to provide at least one target")
+    d_low = target_LOW.get_all_distances()[vkeys][:, np.newaxis]  # (n_vkeys, 1)
+
+    if not target_HIGH:  # then offset target
+        return d_low - weights * target_LOW.get_max_dist()
+
+    if target_HIGH.has_uneven_weights:
+        ds_high = target_HIGH.get_all_distances_array()[:, vkeys][:, :, np.newaxis]  # (n_boundaries, n_vkeys, 1)
+        if target_HIGH.number_of_boundaries > 1:
+            # remap_unbound(weight, 0, weight_max, 0, 1) for each cluster, (n_boundaries, 1, n_weights)
+            weight_max = np.array(target_HIGH.weight_max_per_cluster, dtype=np.float64)[:, np.newaxis, np.newaxis]
+            cluster_weights = weights / weight_max
+        else:
+            cluster_weights = weights[np.newaxis]
+        distances = (cluster_weights - 1) * d_low + cluster_weights * ds_high  # (n_boundaries, n_vkeys, n_weights)
+        return union_array(distances, target_HIGH.union_method, target_HIGH.union_params)
+
+    d_high = target_HIGH.get_all_distances()[vkeys][:, np.newaxis]
+    return (d_low * (1 - weights)) - (d_high * weights)
+
+
 def assign_interpolation_distance_to_mesh_vertex(
     vkey: int, weight: float, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None
 ) -> float:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import statistics
 from typing import Any, Literal
 
 import networkx as nx
@@ -12,11 +11,10 @@ from numpy.typing import NDArray
 
 import compas_slicer.utilities as utils
 from compas_slicer.pre_processing.preprocessing_utils.geodesics import (
-    get_cgal_HEAT_geodesic_distances,
-    get_custom_HEAT_geodesic_distances,
-    get_igl_EXACT_geodesic_distances,
-    get_igl_HEAT_geodesic_distances,
+    get_custom_HEAT_geodesic_distances_list,
+    get_heat_geodesic_distances_list,
 )
+from compas_slicer.pre_processing.preprocessing_utils.laplacian_smoothing import LaplacianSmoother
 
 GeodesicsMethod = Literal["exact_igl", "heat_igl", "heat_cgal", "heat"]
 UnionMethod = Literal["min", "smooth", "chamfer", "stairs"]
@@ -34,7 +32,16 @@ def _create_graph_from_mesh_vkeys(mesh: Mesh, v_keys: list[int]) -> nx.Graph:
     return G
 
 
-__all__ = ["CompoundTarget", "blend_union_list", "stairs_union_list", "chamfer_union_list"]
+__all__ = [
+    "CompoundTarget",
+    "union_array",
+    "blend_union_list",
+    "stairs_union_list",
+    "chamfer_union_list",
+    "blend_union_array",
+    "stairs_union_array",
+    "chamfer_union_array",
+]
 
 
 class CompoundTarget:
@@ -104,7 +111,11 @@ class CompoundTarget:
         self._distances_lists: list[list[float]] = []  # Shape: number_of_boundaries x number_of_vertices
         self._distances_lists_flipped: list[list[float]] = []  # Shape: number_of_vertices x number_of_boundaries
         self._np_distances_lists_flipped: NDArray[np.floating] = np.array([])
+        self._np_distances_lists: NDArray[np.floating] = np.array([])  # Shape: number_of_boundaries x #V
         self._max_dist: float | None = None  # maximum distance from target on any mesh vertex
+        # memoized union of the distances, and the union method and params it was computed with
+        self._union_distances: NDArray[np.floating] | None = None
+        self._union_distances_key: tuple[Any, ...] | None = None
 
         # compute
         self.find_targets_connected_components()
@@ -129,8 +140,7 @@ class CompoundTarget:
             raise RuntimeError("Graph node count doesn't match target vertex count.")
         self.number_of_boundaries = len(list(nx.connected_components(G)))
 
-        for _i, cp in enumerate(nx.connected_components(G)):
-            self.clustered_vkeys.append(list(cp))
+        self.clustered_vkeys = [list(cp) for cp in nx.connected_components(G)]
         logger.info(
             f"Compound target with 'boundary'={self.value}. Number of connected_components : "
             f"{len(list(nx.connected_components(G)))}"
@@ -142,17 +152,12 @@ class CompoundTarget:
         Computes the geodesic distances from each of the target's neighborhoods  to all the mesh vertices.
         Fills in the distances attributes.
         """
-        if self.geodesics_method == "exact_igl":
-            distances_lists = [get_igl_EXACT_geodesic_distances(self.mesh, vstarts) for vstarts in self.clustered_vkeys]
-        elif self.geodesics_method == "heat_igl":
-            distances_lists = [get_igl_HEAT_geodesic_distances(self.mesh, vstarts) for vstarts in self.clustered_vkeys]
-        elif self.geodesics_method == "heat_cgal":
-            distances_lists = [get_cgal_HEAT_geodesic_distances(self.mesh, vstarts) for vstarts in self.clustered_vkeys]
+        if self.geodesics_method in ("exact_igl", "heat_igl", "heat_cgal"):
+            # all clusters are solved with the same CGAL solver of the mesh
+            distances_lists = get_heat_geodesic_distances_list(self.mesh, self.clustered_vkeys)
         elif self.geodesics_method == "heat":
-            distances_lists = [
-                get_custom_HEAT_geodesic_distances(self.mesh, vstarts, str(self.OUTPUT_PATH))
-                for vstarts in self.clustered_vkeys
-            ]
+            # all clusters are solved together with the prefactored operators of the mesh
+            distances_lists = get_custom_HEAT_geodesic_distances_list(self.mesh, self.clustered_vkeys)
         else:
             raise ValueError("Unknown geodesics method : " + self.geodesics_method)
 
@@ -164,12 +169,14 @@ class CompoundTarget:
         Fills in the distances attributes.
         """
         self._distances_lists = distances_lists
-        self._distances_lists_flipped = []  # empty
-        for i in range(self.VN):
-            current_values = [self._distances_lists[list_index][i] for list_index in range(self.number_of_boundaries)]
-            self._distances_lists_flipped.append(current_values)
-        self._np_distances_lists_flipped = np.array(self._distances_lists_flipped)
-        self._max_dist = np.max(self._np_distances_lists_flipped)
+        self._np_distances_lists = np.array(distances_lists, dtype=np.float64).reshape((self.number_of_boundaries, -1))
+        self._np_distances_lists.flags.writeable = False
+        self._np_distances_lists_flipped = self._np_distances_lists.T
+        self._distances_lists_flipped = self._np_distances_lists_flipped.tolist()
+        self._max_dist = float(np.max(self._np_distances_lists))
+        # invalidate the memoized union
+        self._union_distances = None
+        self._union_distances_key = None
 
     #  --- Uneven weights
     @property
@@ -202,23 +209,21 @@ class CompoundTarget:
         Returns a list, one relative distance value per connected boundary neighborhood.
         That is the average of the distances of the vertices of that boundary neighborhood from the other_target.
         """
+        other_distances = other_target.get_all_distances()
         distances = []
         for vi_starts in self.clustered_vkeys:
-            ds = [other_target.get_distance(vi) for vi in vi_starts]
+            ds = other_distances[vi_starts]
             if avg_type == "mean":
-                distances.append(statistics.mean(ds))
+                distances.append(float(np.mean(ds)))
             else:  # 'median'
-                distances.append(statistics.median(ds))
+                distances.append(float(np.median(ds)))
         return distances
 
     def get_avg_distances_from_other_target(self, other_target: CompoundTarget) -> float:
         """
         Returns the minimum and maximum distance of the vertices of this target from the other_target
         """
-        extreme_distances = []
-        for v_index in other_target.all_target_vkeys:
-            extreme_distances.append(self.get_all_distances()[v_index])
-        return float(np.average(np.array(extreme_distances)))
+        return float(np.average(self.get_all_distances()[other_target.all_target_vkeys]))
 
     #############################
     #  --- get all distances
@@ -235,73 +240,56 @@ class CompoundTarget:
     #  --- vectorized distances (all vertices at once)
 
     def get_all_distances(self) -> np.ndarray:
-        """Return distances for all vertices as 1D array, applying union method."""
-        if self.union_method == "min":
-            return np.min(self._np_distances_lists_flipped, axis=1)
-        elif self.union_method == "smooth":
-            return np.array(
-                [blend_union_list(row.tolist(), self.union_params[0]) for row in self._np_distances_lists_flipped]
-            )
-        elif self.union_method == "chamfer":
-            return np.array(
-                [chamfer_union_list(row.tolist(), self.union_params[0]) for row in self._np_distances_lists_flipped]
-            )
-        elif self.union_method == "stairs":
-            return np.array(
-                [
-                    stairs_union_list(row.tolist(), self.union_params[0], self.union_params[1])
-                    for row in self._np_distances_lists_flipped
-                ]
-            )
-        else:
-            raise ValueError(f"Unknown union method: {self.union_method}")
+        """
+        Return distances for all vertices as 1D array, applying union method.
+        The union is memoized until the distances, the union method or the union params change; the returned
+        array is read-only.
+        """
+        key = (self.union_method, *self.union_params)
+        if self._union_distances is None or self._union_distances_key != key:
+            self._union_distances = union_array(self._np_distances_lists, self.union_method, self.union_params)
+            self._union_distances.flags.writeable = False
+            self._union_distances_key = key
+        return self._union_distances
 
     def get_all_distances_array(self) -> np.ndarray:
-        """Return raw distances as (n_boundaries, n_vertices) array."""
-        return np.array(self._distances_lists)
+        """Return raw distances as (n_boundaries, n_vertices) array (read-only)."""
+        return self._np_distances_lists
 
     #############################
     #  --- per vkey distances
 
     def get_all_distances_for_vkey(self, i: int) -> list[float]:
         """Returns distances from each cluster separately for vertex i. Smooth union doesn't play here any role."""
-        return [self._distances_lists[list_index][i] for list_index in range(self.number_of_boundaries)]
+        distances: list[float] = self._np_distances_lists[:, i].tolist()
+        return distances
 
     def get_distance(self, i: int) -> float:
         """Return get_distance for vertex with vkey i."""
-        if self.union_method == "min":
-            # --- simple union
-            return float(np.min(self._np_distances_lists_flipped[i]))
-        elif self.union_method == "smooth":
-            # --- blend (smooth) union
-            return blend_union_list(values=self._np_distances_lists_flipped[i], r=self.union_params[0])
-        elif self.union_method == "chamfer":
-            # --- blend (smooth) union
-            return chamfer_union_list(values=self._np_distances_lists_flipped[i], r=self.union_params[0])
-        elif self.union_method == "stairs":
-            # --- stairs union
-            return stairs_union_list(
-                values=self._np_distances_lists_flipped[i], r=self.union_params[0], n=self.union_params[1]
-            )
-        else:
-            raise ValueError("Unknown Union method : ", self.union_method)
+        return float(self.get_all_distances()[i])
 
     #############################
     #  --- scalar field smoothing
 
-    def laplacian_smoothing(self, iterations: int, strength: float) -> None:
-        """Smooth the distances on the mesh, using iterative laplacian smoothing."""
-        L = utils.get_mesh_cotmatrix_igl(self.mesh, fix_boundaries=True)
-        new_distances_lists = []
+    def laplacian_smoothing(
+        self, iterations: int, strength: float, implicit: bool = False, smoother: LaplacianSmoother | None = None
+    ) -> None:
+        """
+        Smooth the distances on the mesh, using laplacian smoothing of the distances of all clusters together.
+
+        Parameters
+        ----------
+        iterations: int, the number of smoothing steps.
+        strength: float, the step size of the smoothing.
+        implicit: bool, if True, backward Euler steps instead of explicit steps (see :class:`LaplacianSmoother`).
+        smoother: :class:`LaplacianSmoother`, to reuse its operators. If None, one is created for the mesh.
+        """
+        if smoother is None:
+            smoother = LaplacianSmoother(self.mesh)
 
         logger.info("Laplacian smoothing of all distances")
-        for _i, a in enumerate(self._distances_lists):
-            a = np.array(a)  # a: numpy array containing the attribute to be smoothed
-            for _ in range(iterations):  # iterative smoothing
-                a_prime = a + strength * L * a
-                a = a_prime
-            new_distances_lists.append(list(a))
-        self.update_distances_lists(new_distances_lists)
+        smoothed = smoother.smooth(self._np_distances_lists.T, iterations, strength, implicit=implicit)
+        self.update_distances_lists(smoothed.T.tolist())
 
     #############################
     #  ------ output
@@ -319,9 +307,7 @@ class CompoundTarget:
     #  ------ assign new Mesh
     def assign_new_mesh(self, mesh: Mesh) -> None:
         """When the base mesh changes, a new mesh needs to be assigned."""
-        mesh.to_json(self.OUTPUT_PATH + "/temp.obj")
-        mesh = Mesh.from_json(self.OUTPUT_PATH + "/temp.obj")
-        self.mesh = mesh
+        self.mesh = mesh.copy()
         self.VN = len(list(self.mesh.vertices()))
 
 
@@ -352,6 +338,64 @@ def chamfer_union_list(values: NDArray[np.floating] | list[float], r: float) ->
     return d_result
 
 
+####################
+#  unions on arrays
+
+
+def union_array(values: NDArray[np.floating], union_method: str, union_params: list[Any]) -> NDArray[np.floating]:
+    """
+    Returns the union of the rows of values, one per cluster, with the union method of a CompoundTarget.
+
+    Parameters
+    ----------
+    values: np.array (dimensions : #clusters x #V), the distances from each cluster.
+    union_method: str, 'min', 'smooth', 'chamfer' or 'stairs'.
+    union_params: list, the parameters of the union method (r for 'smooth' and 'chamfer', r and n for 'stairs').
+
+    Returns
+    ----------
+    np.array (dimensions : #V) the union of the distances on each vertex.
+    """
+    if union_method == "min":
+        d_min: NDArray[np.floating] = np.min(values, axis=0)
+        return d_min
+    elif union_method == "smooth":
+        return blend_union_array(values, union_params[0])
+    elif union_method == "chamfer":
+        return chamfer_union_array(values, union_params[0])
+    elif union_method == "stairs":
+        return stairs_union_array(values, union_params[0], union_params[1])
+    else:
+        raise ValueError(f"Unknown union method: {union_method}")
+
+
+def blend_union_array(values: NDArray[np.floating], r: float) -> NDArray[np.floating]:
+    """Returns the smooth union of the rows of values on each column, as blend_union_list on every column."""
+    d_result = np.full(np.shape(values)[1:], 9999999.0)  # very big number
+    for d in np.asarray(values, dtype=np.float64):
+        e = np.maximum(r - np.abs(d_result - d), 0)
+        d_result = np.minimum(d_result, d) - e * e * 0.25 / r
+    return d_result
+
+
+def stairs_union_array(values: NDArray[np.floating], r: float, n: int) -> NDArray[np.floating]:
+    """Returns the stairs union of the rows of values on each column, as stairs_union_list on every column."""
+    s = r / n
+    d_result = np.full(np.shape(values)[1:], 9999999.0)  # very big number
+    for d in np.asarray(values, dtype=np.float64):
+        u = d - r
+        d_result = np.minimum(np.minimum(d_result, d), 0.5 * (u + d_result + np.abs((u - d_result + s) % (2 * s) - s)))
+    return d_result
+
+
+def chamfer_union_array(values: NDArray[np.floating], r: float) -> NDArray[np.floating]:
+    """Returns the chamfer union of the rows of values on each column, as chamfer_union_list on every column."""
+    d_result = np.full(np.shape(values)[1:], 9999999.0)  # very big number
+    for d in np.asarray(values, dtype=np.float64):
+        d_result = np.minimum(np.minimum(d_result, d), (d_result - r + d) * math.sqrt(0.5))
+    return d_result
+
+
 ####################
 #  unions on pairs
 
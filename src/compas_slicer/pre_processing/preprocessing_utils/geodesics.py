@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import math
+import hashlib
+import weakref
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -11,19 +13,59 @@ from numpy.typing import NDArray
 import compas_slicer.utilities as utils
 from compas_slicer.pre_processing.preprocessing_utils.gradient import (
     get_face_gradient_from_scalar_field,
-    get_scalar_field_from_gradient,
-    normalize_gradient,
+    get_per_vertex_divergence,
 )
 
 if TYPE_CHECKING:
     from compas.datastructures import Mesh
+    from compas_cgal.geodesics import HeatGeodesicSolver
+
+
+__all__ = [
+    "get_heat_geodesic_distances",
+    "get_heat_geodesic_distances_list",
+    "get_heat_geodesic_solver",
+    "get_custom_HEAT_geodesic_distances",
+    "get_custom_HEAT_geodesic_distances_list",
+    "get_geodesics_solver",
+    "GeodesicsSolver",
+    "GeodesicsCache",
+]
+
+
+# CGAL heat method solvers of the most recently used meshes, keyed by a hash of their geometry
+_cgal_solver_cache: OrderedDict[str, object] = OrderedDict()
+CGAL_SOLVER_CACHE_SIZE = 4
 
 
-__all__ = ["get_heat_geodesic_distances", "get_custom_HEAT_geodesic_distances", "GeodesicsCache"]
+def get_heat_geodesic_solver(mesh: Mesh) -> HeatGeodesicSolver:
+    """
+    Returns the CGAL heat method solver of a mesh, with its precomputation.
+
+    The solvers of the most recently used meshes (see ``CGAL_SOLVER_CACHE_SIZE``) are cached, keyed by a hash
+    of the vertex coordinates and faces, so meshes with the same geometry share a solver, and a solver is never
+    reused for a mesh whose geometry differs.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh (must be triangulated).
 
+    Returns
+    -------
+    HeatGeodesicSolver
+    """
+    from compas_cgal.geodesics import HeatGeodesicSolver
 
-# CGAL heat method solver cache (for precomputation reuse)
-_cgal_solver_cache: dict[int, object] = {}
+    mesh_arrays = utils.get_mesh_arrays(mesh)
+    mesh_hash = _geometry_hash(mesh_arrays.V, mesh_arrays.F)
+    if mesh_hash in _cgal_solver_cache:
+        _cgal_solver_cache.move_to_end(mesh_hash)
+    else:
+        _cgal_solver_cache[mesh_hash] = HeatGeodesicSolver((mesh_arrays.V.tolist(), mesh_arrays.F.tolist()))
+        while len(_cgal_solver_cache) > CGAL_SOLVER_CACHE_SIZE:
+            _cgal_solver_cache.popitem(last=False)  # evict the least recently used solver
+    return _cgal_solver_cache[mesh_hash]
 
 
 def get_heat_geodesic_distances(mesh: Mesh, vertices_start: list[int]) -> NDArray[np.floating]:
@@ -31,39 +73,53 @@ def get_heat_geodesic_distances(mesh: Mesh, vertices_start: list[int]) -> NDArra
     Calculate geodesic distances using CGAL heat method.
 
     Uses compas_cgal's HeatGeodesicSolver which provides CGAL's Heat_method_3
-    implementation with intrinsic Delaunay triangulation.
+    implementation with intrinsic Delaunay triangulation. All sources are
+    solved at once, with the cached solver of the mesh (see get_heat_geodesic_solver).
 
     Parameters
     ----------
     mesh : Mesh
         A compas mesh (must be triangulated).
     vertices_start : list[int]
-        Source vertex indices.
+        Source vertex keys.
 
     Returns
     -------
     NDArray
-        Minimum distance from any source to each vertex.
+        Distance from the nearest source to each vertex.
     """
-    from compas_cgal.geodesics import HeatGeodesicSolver
+    return get_heat_geodesic_distances_list(mesh, [vertices_start])[0]
 
-    # Check if we have a cached solver for this mesh
-    mesh_hash = hash((len(list(mesh.vertices())), len(list(mesh.faces()))))
-    if mesh_hash not in _cgal_solver_cache:
-        _cgal_solver_cache.clear()  # Clear old solvers
-        V = mesh.vertices_attributes("xyz")
-        F = [mesh.face_vertices(f) for f in mesh.faces()]
-        _cgal_solver_cache[mesh_hash] = HeatGeodesicSolver((V, F))
 
-    solver = _cgal_solver_cache[mesh_hash]
+def get_heat_geodesic_distances_list(mesh: Mesh, vertices_starts: list[list[int]]) -> list[NDArray[np.floating]]:
+    """
+    Calculate the geodesic distances from several sets of sources using CGAL heat method.
 
-    # Compute distances for each source and take minimum
-    all_distances = []
-    for source in vertices_start:
-        distances = solver.solve([source])
-        all_distances.append(distances)
+    Every set of sources is solved at once, and all sets share the same cached solver of the mesh.
 
-    return np.min(np.array(all_distances), axis=0)
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh (must be triangulated).
+    vertices_starts : list[list[int]]
+        Source vertex keys of each set of sources.
+
+    Returns
+    -------
+    list[NDArray]
+        For each set of sources, the distance from its nearest source to each vertex.
+    """
+    solver = get_heat_geodesic_solver(mesh)
+    vertex_index = utils.get_mesh_arrays(mesh).vertex_index
+    return [solver.solve([vertex_index[vkey] for vkey in vertices_start]) for vertices_start in vertices_starts]
+
+
+def _geometry_hash(V: NDArray, F: NDArray) -> str:
+    """Returns a hash of the vertex coordinates and the faces of a mesh."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(V, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(F, dtype=np.int64).tobytes())
+    return digest.hexdigest()
 
 
 # Backwards compatibility aliases
@@ -76,7 +132,7 @@ class GeodesicsCache:
     """Cache for geodesic distances to avoid redundant computations.
 
     Note: This class is kept for backwards compatibility but now uses CGAL.
-    The CGAL solver has its own internal caching via _cgal_solver_cache.
+    The CGAL solvers are cached per mesh geometry by get_heat_geodesic_solver.
     """
 
     def __init__(self) -> None:
@@ -111,7 +167,7 @@ class GeodesicsCache:
 def get_custom_HEAT_geodesic_distances(
     mesh: Mesh,
     vi_sources: list[int],
-    OUTPUT_PATH: str,
+    OUTPUT_PATH: str | None = None,
     v_equalize: list[int] | None = None,
 ) -> NDArray[np.floating]:
     """Calculate geodesic distances using the custom heat method.
@@ -125,9 +181,9 @@ def get_custom_HEAT_geodesic_distances(
     mesh : Mesh
         A compas mesh (must be triangulated).
     vi_sources : list[int]
-        Source vertex indices.
-    OUTPUT_PATH : str
-        Path to save intermediate results.
+        Source vertex keys.
+    OUTPUT_PATH : str | None
+        Path to save the diffused heat to ('diffused_heat.json'). If None, nothing is saved.
     v_equalize : list[int] | None
         Vertices to equalize (for saddle point handling).
 
@@ -136,18 +192,67 @@ def get_custom_HEAT_geodesic_distances(
     NDArray
         Geodesic distance from sources to each vertex.
     """
-    geodesics_solver = GeodesicsSolver(mesh, OUTPUT_PATH)
+    geodesics_solver = get_geodesics_solver(mesh)
     u = geodesics_solver.diffuse_heat(vi_sources, v_equalize)
-    geodesic_dist = geodesics_solver.get_geodesic_distances(u, vi_sources, v_equalize)
-    return geodesic_dist
+    if OUTPUT_PATH is not None:
+        geodesics_solver.save_diffused_heat(u, OUTPUT_PATH)
+    return geodesics_solver.get_geodesic_distances(u, vi_sources, v_equalize)
+
+
+def get_custom_HEAT_geodesic_distances_list(mesh: Mesh, vi_sources_list: list[list[int]]) -> list[NDArray[np.floating]]:
+    """Calculate the geodesic distances from several sets of sources using the custom heat method.
+
+    All sets of sources share the prefactored operators of the cached solver of the mesh, and are solved
+    together as the columns of one diffusion solve and one Poisson solve.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh (must be triangulated).
+    vi_sources_list : list[list[int]]
+        Source vertex keys of each set of sources.
+
+    Returns
+    -------
+    list[NDArray]
+        For each set of sources, the geodesic distance from its sources to each vertex.
+    """
+    return list(get_geodesics_solver(mesh).solve(vi_sources_list).T)
 
 
 ######################################
 # --- GeodesicsSolver
 
-# Heat diffusion parameters for custom solver
-HEAT_DIFFUSION_ITERATIONS = 250
-DELTA = 0.1  # Time step for backward Euler
+# Time step of the heat diffusion, as a factor of the squared mean edge length (t = m * h^2 in Crane, 2013)
+HEAT_TIME_FACTOR = 1.0
+# Regularization of the Poisson operator, whose cotangent Laplacian is singular (relative to 1 / t)
+POISSON_REGULARIZATION = 1e-8
+
+# custom heat method solvers per mesh, reused while the geometry of the mesh is unchanged
+_geodesics_solver_cache: weakref.WeakKeyDictionary[Mesh, GeodesicsSolver] = weakref.WeakKeyDictionary()
+
+
+def get_geodesics_solver(mesh: Mesh) -> GeodesicsSolver:
+    """
+    Returns the custom heat method solver of a mesh, with its prefactored operators.
+
+    The solver is cached per mesh, and rebuilt when the MeshArrays of the mesh are recomputed
+    (see :func:`compas_slicer.utilities.get_mesh_arrays`). It does not keep the mesh alive.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh (must be triangulated).
+
+    Returns
+    -------
+    GeodesicsSolver
+    """
+    solver = _geodesics_solver_cache.get(mesh)
+    if solver is None or solver.mesh_arrays is not utils.get_mesh_arrays(mesh):
+        solver = GeodesicsSolver(mesh)
+        _geodesics_solver_cache[mesh] = solver
+    return solver
 
 
 class GeodesicsSolver:
@@ -155,31 +260,65 @@ class GeodesicsSolver:
     Computes custom geodesic distances. Starts from implementation of the method presented in the paper
     'Geodesics in Heat' (Crane, 2013)
 
+    The heat operator (M - tL), with the time step t derived from the mean edge length, and the Poisson
+    operator L are factorized once, so every set of sources costs one diffusion solve and one Poisson solve,
+    and several sets of sources are solved together as multiple right-hand sides.
+
     Attributes
     ----------
     mesh: :class: compas.datastructures.Mesh
-    OUTPUT_PATH: str
+    OUTPUT_PATH: str | None, the path to save the diffused heat to. If None, nothing is saved.
+    t: float, the time step of the heat diffusion.
     """
 
-    def __init__(self, mesh: Mesh, OUTPUT_PATH: str) -> None:
+    def __init__(self, mesh: Mesh, OUTPUT_PATH: str | None = None) -> None:
         logger.info("GeodesicsSolver")
-        self.mesh = mesh
         self.OUTPUT_PATH = OUTPUT_PATH
-
-        self.use_forwards_euler = True
+        self.mesh_arrays = utils.get_mesh_arrays(mesh)
 
         # Compute matrices using NumPy implementations
         self.cotans = utils.get_mesh_cotans(mesh)
         self.L = utils.get_mesh_cotmatrix(mesh, fix_boundaries=False)
         self.M = utils.get_mesh_massmatrix(mesh)
 
+        V, edges = self.mesh_arrays.V, self.mesh_arrays.edges
+        mean_edge_length = float(np.linalg.norm(V[edges[:, 1]] - V[edges[:, 0]], axis=1).mean())
+        self.t = HEAT_TIME_FACTOR * mean_edge_length**2
+
+        # Prefactor the heat operator and the (regularized) Poisson operator ONCE
+        self._heat_solver = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(self.M - self.t * self.L))
+        poisson = self.L - (POISSON_REGULARIZATION / self.t) * self.M
+        self._poisson_solver = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(poisson))
+
+    @property
+    def mesh(self) -> Mesh:
+        """The mesh, referenced weakly through its MeshArrays so that the solver cache does not keep it alive."""
+        return self.mesh_arrays.mesh
+
+    def solve(self, vi_sources_list: list[list[int]]) -> NDArray[np.floating]:
+        """
+        Finds the geodesic distances from several sets of sources, solved together as multiple right-hand sides.
+
+        Parameters
+        ----------
+        vi_sources_list: list of list, int, the vertex keys of the sources of each set
+
+        Returns
+        ----------
+        np.array (dimensions : #V x #sets) the geodesic distances from each set of sources, one per column.
+        """
+        vertex_index = self.mesh_arrays.vertex_index
+        sources = [[vertex_index[vkey] for vkey in vi_sources] for vi_sources in vi_sources_list]
+        u = self._diffuse(sources)
+        return self._integrate(u, sources)
+
     def diffuse_heat(
         self,
         vi_sources: list[int],
         v_equalize: list[int] | None = None,
     ) -> NDArray[np.floating]:
         """
-        Heat diffusion using iterative backward Euler.
+        Heat diffusion with a single backward Euler step of the prefactored heat operator.
 
         This is a custom Python implementation of the heat method. For production use,
         prefer CGAL's heat method (geodesics_method='heat_cgal') which uses intrinsic
@@ -188,63 +327,73 @@ class GeodesicsSolver:
         Parameters
         ----------
         vi_sources : list[int]
-            The vertex indices of the heat sources.
+            The vertex keys of the heat sources.
         v_equalize : list[int] | None
-            Vertex indices whose values should be equalized (for handling saddle points).
+            Vertex keys whose values should be equalized (for handling saddle points).
 
         Returns
         -------
         NDArray
             Heat distribution u, with sources at 0 and increasing away from them.
         """
-        if not v_equalize:
-            v_equalize = []
-
-        # First assign starting values (0 everywhere, 1 on the sources)
-        u0 = np.zeros(len(list(self.mesh.vertices())))
-        u0[vi_sources] = 1.0
-        u = u0
-
-        # Pre-factor the matrix ONCE outside the loop (major speedup)
-        # Using backward Euler: (M - δL)u' = M·u
-        S = self.M - DELTA * self.L
-        solver = scipy.sparse.linalg.factorized(S)
-
-        for _i in range(HEAT_DIFFUSION_ITERATIONS):
-            b = self.M * u
-            u_prime = solver(b)
-
-            if len(v_equalize) > 0:
-                u_prime[v_equalize] = np.min(u_prime[v_equalize])
-
-            u = u_prime
-            u[vi_sources] = 1.0  # enforce Dirichlet boundary: sources remain fixed
-
-        # reverse values (to make sources at 0, increasing outward)
-        u = ([np.max(u)] * len(u)) - u
-
-        utils.save_to_json([float(value) for value in u], self.OUTPUT_PATH, "diffused_heat.json")
+        vertex_index = self.mesh_arrays.vertex_index
+        u = self._diffuse([[vertex_index[vkey] for vkey in vi_sources]])[:, 0]
+        if v_equalize:
+            v_equalize = [vertex_index[vkey] for vkey in v_equalize]
+            u[v_equalize] = np.max(u[v_equalize])  # the lowest heat, once reversed
+        if self.OUTPUT_PATH is not None:
+            self.save_diffused_heat(u, self.OUTPUT_PATH)
         return u
 
     def get_geodesic_distances(
         self, u: NDArray[np.floating], vi_sources: list[int], v_equalize: list[int] | None = None
     ) -> NDArray[np.floating]:
         """
-        Finds geodesic distances from heat distribution u. I
+        Finds geodesic distances from heat distribution u.
 
         Parameters
         ----------
         u: np.array, dimensions: V x 1 (one scalar value per vertex)
-        vi_sources: list, int, the vertex indices of the sources
-        v_equalize: list, int, the vertex indices whose value should be equalized
+        vi_sources: list, int, the vertex keys of the sources
+        v_equalize: list, int, the vertex keys whose value should be equalized
         """
-        X = get_face_gradient_from_scalar_field(self.mesh, u)
-        X = normalize_gradient(X)
-        geodesic_dist = get_scalar_field_from_gradient(self.mesh, X, self.L, self.cotans)
-        if math.isnan(geodesic_dist[0]):
-            raise RuntimeError("get_scalar_field_from_gradient returned NaN - check mesh quality.")
-        geodesic_dist[vi_sources] = 0  # coerce boundary vertices to be on 0 (fixes small boundary imprecision)
-        return geodesic_dist
+        vertex_index = self.mesh_arrays.vertex_index
+        u = np.asarray(u, dtype=np.float64).reshape((-1, 1))
+        return self._integrate(u, [[vertex_index[vkey] for vkey in vi_sources]])[:, 0]
+
+    def save_diffused_heat(self, u: NDArray[np.floating], OUTPUT_PATH: str) -> None:
+        """Saves the heat distribution u to 'diffused_heat.json' in OUTPUT_PATH."""
+        utils.save_to_json([float(value) for value in u], OUTPUT_PATH, "diffused_heat.json")
+
+    def _diffuse(self, sources: list[list[int]]) -> NDArray[np.floating]:
+        """Heat distributions (#V x #sets) of the sets of source vertex indices, with sources at 0."""
+        u0 = np.zeros((len(self.mesh_arrays.V), len(sources)))
+        for column, vis in enumerate(sources):
+            u0[vis, column] = 1.0
+        u = self._heat_solver.solve(self.M @ u0)
+        # reverse values (to make sources at 0, increasing outward)
+        reversed_u: NDArray[np.floating] = u.max(axis=0) - u
+        return reversed_u
+
+    def _integrate(self, u: NDArray[np.floating], sources: list[list[int]]) -> NDArray[np.floating]:
+        """Geodesic distances (#V x #sets) that best explain the normalized gradients of the heat distributions u."""
+        div_X = np.empty_like(u)
+        for column in range(u.shape[1]):
+            # get_face_gradient_from_scalar_field points towards decreasing values, i.e. towards the sources
+            X = -get_face_gradient_from_scalar_field(self.mesh, u[:, column])
+            norm = np.linalg.norm(X, axis=1)[..., np.newaxis]
+            X = np.divide(X, norm, out=np.zeros_like(X), where=norm > 0)  # normalize, with 0 on flat faces
+            div_X[:, column] = get_per_vertex_divergence(self.mesh, X, self.cotans)
+
+        geodesic_dist = self._poisson_solver.solve(div_X)
+        if np.isnan(geodesic_dist).any():
+            raise RuntimeError("The Poisson solve of the heat method returned NaN - check mesh quality.")
+        for column, vis in enumerate(sources):
+            # make the mean value on the sources equal 0, so sources spread over a region all start from 0
+            geodesic_dist[:, column] -= np.mean(geodesic_dist[vis, column])
+            geodesic_dist[vis, column] = 0  # coerce boundary vertices to be on 0 (fixes small boundary imprecision)
+        distances: NDArray[np.floating] = 2 * np.maximum(geodesic_dist, 0.0)
+        return distances
 
 
 if __name__ == "__main__":
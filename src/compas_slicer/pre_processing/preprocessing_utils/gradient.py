@@ -14,6 +14,7 @@ from compas_slicer._numpy_ops import edge_gradient_from_vertex_gradient as _edge
 from compas_slicer._numpy_ops import face_gradient_from_scalar_field as _face_gradient_vectorized
 from compas_slicer._numpy_ops import per_vertex_divergence as _divergence_vectorized
 from compas_slicer._numpy_ops import vertex_gradient_from_face_gradient as _vertex_gradient_vectorized
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
 
 __all__ = [
     "get_vertex_gradient_from_face_gradient",
@@ -26,10 +27,9 @@ __all__ = [
 
 
 def _mesh_to_arrays(mesh: Mesh) -> tuple[NDArray[np.floating], NDArray[np.intp]]:
-    """Convert COMPAS mesh to numpy arrays for vectorized operations."""
-    V = np.array([mesh.vertex_coordinates(v) for v in mesh.vertices()], dtype=np.float64)
-    F = np.array([mesh.face_vertices(f) for f in mesh.faces()], dtype=np.intp)
-    return V, F
+    """Convert COMPAS mesh to numpy arrays for vectorized operations (cached, see :func:`get_mesh_arrays`)."""
+    mesh_arrays = get_mesh_arrays(mesh)
+    return mesh_arrays.V, mesh_arrays.F
 
 
 def get_vertex_gradient_from_face_gradient(mesh: Mesh, face_gradient: NDArray[np.floating]) -> NDArray[np.floating]:
@@ -46,9 +46,8 @@ def get_vertex_gradient_from_face_gradient(mesh: Mesh, face_gradient: NDArray[np
     np.array (dimensions : #V x 3) one gradient vector per vertex.
     """
     logger.info("Computing per vertex gradient")
-    V, F = _mesh_to_arrays(mesh)
-    face_areas = np.array([mesh.face_area(f) for f in mesh.faces()], dtype=np.float64)
-    return _vertex_gradient_vectorized(V, F, face_gradient, face_areas)
+    mesh_arrays = get_mesh_arrays(mesh)
+    return _vertex_gradient_vectorized(mesh_arrays.V, mesh_arrays.F, face_gradient, mesh_arrays.face_areas)
 
 
 def get_edge_gradient_from_vertex_gradient(mesh: Mesh, vertex_gradient: NDArray[np.floating]) -> NDArray[np.floating]:
@@ -64,7 +63,7 @@ def get_edge_gradient_from_vertex_gradient(mesh: Mesh, vertex_gradient: NDArray[
     ----------
     np.array (dimensions : #E x 3) one gradient vector per edge.
     """
-    edges = np.array(list(mesh.edges()), dtype=np.intp)
+    edges = get_mesh_arrays(mesh).edges
     return _edge_gradient_vectorized(edges, vertex_gradient)
 
 
@@ -83,11 +82,11 @@ def get_face_gradient_from_scalar_field(mesh: Mesh, u: NDArray[np.floating]) ->
     np.array (dimensions : #F x 3) one gradient vector per face.
     """
     logger.info("Computing per face gradient")
-    V, F = _mesh_to_arrays(mesh)
+    mesh_arrays = get_mesh_arrays(mesh)
     scalar_field = np.asarray(u, dtype=np.float64)
-    face_normals = np.array([mesh.face_normal(f) for f in mesh.faces()], dtype=np.float64)
-    face_areas = np.array([mesh.face_area(f) for f in mesh.faces()], dtype=np.float64)
-    return _face_gradient_vectorized(V, F, scalar_field, face_normals, face_areas)
+    return _face_gradient_vectorized(
+        mesh_arrays.V, mesh_arrays.F, scalar_field, mesh_arrays.face_normals, mesh_arrays.face_areas
+    )
 
 
 def get_face_edge_vectors(
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import scipy
+from loguru import logger
+from numpy.typing import NDArray
+
+import compas_slicer.utilities as utils
+
+if TYPE_CHECKING:
+    from compas.datastructures import Mesh
+
+
+__all__ = ["LaplacianSmoother"]
+
+
+class LaplacianSmoother:
+    """
+    Laplacian smoothing of scalar functions on the vertices of a mesh.
+
+    The cotangent Laplacian L is built once, with the rows of the boundary vertices zeroed so that their values
+    are kept, and applied to all functions together as the columns of one (#V x k) matrix. The explicit method
+    repeats the step a + strength * L * a. The implicit method repeats the backward Euler step (I - strength * L),
+    which is stable for any strength, and its factorization is cached per strength.
+
+    Attributes
+    ----------
+    mesh: :class: compas.datastructures.Mesh
+    L: :class: scipy.sparse.csr_matrix, the cotangent Laplacian (dimensions: #V x #V).
+    """
+
+    def __init__(self, mesh: Mesh, fix_boundaries: bool = True) -> None:
+        self.mesh = mesh
+        self.L = utils.get_mesh_cotmatrix(mesh, fix_boundaries=fix_boundaries)
+        self._implicit_solvers: dict[float, scipy.sparse.linalg.SuperLU] = {}
+
+    def smooth(
+        self, values: NDArray[np.floating], iterations: int, strength: float, implicit: bool = False
+    ) -> NDArray[np.floating]:
+        """
+        Smooths one or several scalar functions on the mesh.
+
+        Parameters
+        ----------
+        values: np.array (dimensions: #V, or #V x k), one function per column.
+        iterations: int, the number of smoothing steps.
+        strength: float, the step size of the smoothing.
+        implicit: bool, if True, backward Euler steps with the cached factorization of (I - strength * L).
+
+        Returns
+        ----------
+        np.array, the smoothed functions, with the same dimensions as values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if implicit:
+            solver = self._get_implicit_solver(strength)
+            for _ in range(iterations):
+                values = solver.solve(values)
+        else:
+            for _ in range(iterations):
+                values = values + strength * (self.L @ values)
+        return values
+
+    def _get_implicit_solver(self, strength: float) -> scipy.sparse.linalg.SuperLU:
+        """The factorization of the implicit smoothing operator (I - strength * L), computed once per strength."""
+        if strength not in self._implicit_solvers:
+            logger.info(f"Factorizing the implicit smoothing operator with strength: {strength}")
+            identity = scipy.sparse.identity(self.L.shape[0], format="csc")
+            self._implicit_solvers[strength] = scipy.sparse.linalg.splu(
+                scipy.sparse.csc_matrix(identity - strength * self.L)
+            )
+        return self._implicit_solvers[strength]
@@ -9,8 +9,8 @@ from loguru import logger
 
 import compas_slicer.utilities as utils
 from compas_slicer.pre_processing.preprocessing_utils.assign_vertex_distance import (
-    assign_interpolation_distance_to_mesh_vertex,
-    assign_interpolation_distance_to_mesh_vertices,
+    get_interpolation_distances,
+    get_interpolation_distances_grid,
 )
 from compas_slicer.pre_processing.preprocessing_utils.mesh_attributes_handling import (
     restore_mesh_attributes,
@@ -22,6 +22,7 @@ __all__ = ["MeshSplitter"]
 # --- Parameters
 T_SEARCH_RESOLUTION = 60000
 HIT_THRESHOLD = 0.02
+WEIGHT_BLOCK_SIZE = 1000  # number of weights evaluated at once in the split weight search
 
 
 class MeshSplitter:
@@ -55,13 +56,11 @@ class MeshSplitter:
         self.OUTPUT_PATH = utils.get_output_directory(DATA_PATH)
         self.target_LOW, self.target_HIGH = target_LOW, target_HIGH
 
-        assign_interpolation_distance_to_mesh_vertices(
-            self.mesh, weight=0.5, target_LOW=self.target_LOW, target_HIGH=self.target_HIGH
-        )
+        scalar_field = self.get_scalar_field(weight=0.5)
         # Late import to avoid circular dependency
         from compas_slicer.pre_processing.gradient_evaluation import GradientEvaluation
 
-        g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH)
+        g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH, scalar_field)
         g_evaluation.find_critical_points()  # First estimation of saddle points with weight = 0.5
         self.saddles = g_evaluation.saddles
         self.cut_indices = []
@@ -100,28 +99,24 @@ class MeshSplitter:
             # --- (1) More exact estimation of intersecting weight. Recompute gradient evaluation.
             # Find exact saddle point and the weight that intersects it.
 
-            assign_interpolation_distance_to_mesh_vertices(
-                self.mesh, weight=param_first_estimation, target_LOW=self.target_LOW, target_HIGH=self.target_HIGH
-            )
+            scalar_field = self.get_scalar_field(weight=param_first_estimation)
             # Late import to avoid circular dependency
             from compas_slicer.pre_processing.gradient_evaluation import GradientEvaluation
 
-            g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH)
+            g_evaluation = GradientEvaluation(self.mesh, self.DATA_PATH, scalar_field)
             g_evaluation.find_critical_points()
-            saddles_ds_tupples = [
-                (vkey, abs(g_evaluation.mesh.vertex_attribute(vkey, "scalar_field"))) for vkey in g_evaluation.saddles
-            ]
+            saddles_ds_tupples = [(vkey, abs(scalar_field.value(vkey))) for vkey in g_evaluation.saddles]
             saddles_ds_tupples = sorted(saddles_ds_tupples, key=lambda saddle_tupple: saddle_tupple[1])
             vkey = saddles_ds_tupples[0][0]
             t = self.identify_positions_to_split([vkey])[0]
             logger.info(f"vkey_exact : {vkey} , t_exact : {t:.6f}")
 
             # --- (2) find zero-crossing points
-            assign_interpolation_distance_to_mesh_vertices(self.mesh, t, self.target_LOW, self.target_HIGH)
+            scalar_field = self.get_scalar_field(weight=t)
             # Late import to avoid circular dependency
             from compas_slicer.slicers.slice_utilities import ScalarFieldContours
 
-            zero_contours = ScalarFieldContours(self.mesh)
+            zero_contours = ScalarFieldContours(self.mesh, scalar_field)
             zero_contours.compute()
             keys_of_clusters_to_keep = merge_clusters_saddle_point(zero_contours, saddle_vkeys=[vkey])
 
@@ -157,6 +152,21 @@ class MeshSplitter:
 
             self.mesh.to_obj(str(Path(self.OUTPUT_PATH) / "most_recent_cut_mesh.obj"))
 
+    def get_scalar_field(self, weight):
+        """
+        Returns the interpolated distance field of the targets with the given weight, without assigning it to the
+        vertex attributes of the mesh.
+
+        Parameters
+        ----------
+        weight: float, the weighting of the distances from the lower and the upper target, from 0 to 1.
+
+        Returns
+        ----------
+        :class: 'compas_slicer.utilities.ScalarField'
+        """
+        return utils.ScalarField(self.mesh, get_interpolation_distances(weight, self.target_LOW, self.target_HIGH))
+
     def update_targets(self):
         """
         Update targets with the new mesh that was created during the split process.
@@ -192,8 +202,8 @@ class MeshSplitter:
                 next_edge = edges[(i + 1) % len(edges)]
                 p = pts[(i + 1) % len(pts)]
 
-                faces_current_edge = self.mesh.edge_faces(u=edge[0], v=edge[1])
-                faces_next_edge = self.mesh.edge_faces(u=next_edge[0], v=next_edge[1])
+                faces_current_edge = self.mesh.edge_faces((edge[0], edge[1]))
+                faces_next_edge = self.mesh.edge_faces((next_edge[0], next_edge[1]))
 
                 fkey_common = list(set(faces_current_edge).intersection(faces_next_edge))[0]
                 vkey_common = list(set(edge).intersection(next_edge))[0]
@@ -217,12 +227,15 @@ class MeshSplitter:
             self.mesh.unify_cycles()
         except AssertionError:
             logger.warning("Could NOT unify cycles")
+        utils.invalidate_mesh_arrays(self.mesh)  # the faces were reoriented in place
         if not self.mesh.is_valid():
             logger.warning("Attention! Mesh is NOT valid!")
 
     def identify_positions_to_split(self, saddles):
         """
         Find the weights that create iso-contours that intersect the saddle points.
+        The distances of every saddle point are evaluated on blocks of the grid of weights, see
+        :func:`find_weight_intersecting_vkey_on_grid`.
 
         Parameters
         ----------
@@ -232,11 +245,11 @@ class MeshSplitter:
         ----------
         list, float, the weights from 0 to 1. One for each saddle point.
         """
-        split_params = []
-        for vkey in saddles:
-            param = self.find_weight_intersecting_vkey(vkey, threshold=HIT_THRESHOLD, resolution=T_SEARCH_RESOLUTION)
-            split_params.append(param)
-        return split_params
+        weights = np.asarray(get_weights_list(n=T_SEARCH_RESOLUTION, start=0.001, end=0.999))
+        return [
+            find_weight_intersecting_vkey_on_grid(vkey, weights, self.target_LOW, self.target_HIGH, HIT_THRESHOLD)
+            for vkey in saddles
+        ]
 
     def find_weight_intersecting_vkey(self, vkey, threshold, resolution):
         """
@@ -252,16 +265,8 @@ class MeshSplitter:
         ----------
         float, the weights from 0 to 1.
         """
-        weight_list = get_weights_list(n=resolution, start=0.001, end=0.999)
-        # TODO: save next d to avoid re-evaluating
-        for i, weight in enumerate(weight_list[:-1]):
-            current_d = assign_interpolation_distance_to_mesh_vertex(vkey, weight, self.target_LOW, self.target_HIGH)
-            next_d = assign_interpolation_distance_to_mesh_vertex(
-                vkey, weight_list[i + 1], self.target_LOW, self.target_HIGH
-            )
-            if abs(current_d) < abs(next_d) and current_d < threshold:
-                return weight
-        raise ValueError(f"Could NOT find param for saddle vkey {vkey}!")
+        weights = np.asarray(get_weights_list(n=resolution, start=0.001, end=0.999))
+        return find_weight_intersecting_vkey_on_grid(vkey, weights, self.target_LOW, self.target_HIGH, threshold)
 
 
 ###############################################
@@ -274,6 +279,66 @@ def get_weights_list(n, start=0.03, end=1.0):
     return list(np.arange(start=start, stop=end, step=(end - start) / n))
 
 
+def find_weight_intersecting_distances(weights, distances, threshold, vkey=None):
+    """
+    Returns the first weight at which the distance of a vertex stops decreasing in absolute value, while being
+    below the threshold. That is the weight of the grid whose iso-contour passes closest to the vertex.
+
+    Parameters
+    ----------
+    weights: np.array, float, the grid of weights, in ascending order.
+    distances: np.array, float, the distance of the vertex for each weight.
+    threshold: float, the d value below which we consider we have a hit.
+    vkey: int, the vertex key, for the error message.
+
+    Returns
+    ----------
+    float, the weight from 0 to 1.
+    """
+    hit = _first_hit(distances, threshold)
+    if hit is None:
+        raise ValueError(f"Could NOT find param for saddle vkey {vkey}!")
+    return float(weights[hit])
+
+
+def find_weight_intersecting_vkey_on_grid(
+    vkey, weights, target_LOW, target_HIGH, threshold, block_size=WEIGHT_BLOCK_SIZE
+):
+    """
+    Returns the same weight as find_weight_intersecting_distances on the distances of the vertex for the whole grid
+    of weights, but evaluates the distances on blocks of block_size weights, and stops at the first block with a hit.
+    This bounds the memory to (number of boundaries of target_HIGH x block_size) distances.
+
+    Parameters
+    ----------
+    vkey: int, the vertex key.
+    weights: np.array, float, the grid of weights, in ascending order.
+    target_LOW: :class: 'compas_slicer.pre_processing.CompoundTarget'
+    target_HIGH: :class: 'compas_slicer.pre_processing.CompoundTarget'
+    threshold: float, the d value below which we consider we have a hit.
+    block_size: int, the number of weights evaluated at once.
+
+    Returns
+    ----------
+    float, the weight from 0 to 1.
+    """
+    for start in range(0, max(len(weights) - 1, 1), block_size):
+        block = weights[start : start + block_size + 1]  # one weight of overlap, as a hit compares two weights
+        distances = get_interpolation_distances_grid([vkey], block, target_LOW, target_HIGH)[0]
+        hit = _first_hit(distances, threshold)
+        if hit is not None:
+            return float(block[hit])
+    raise ValueError(f"Could NOT find param for saddle vkey {vkey}!")
+
+
+def _first_hit(distances, threshold):
+    """Returns the index of the first distance that is below the threshold and smaller than the next one in absolute
+    value, or None."""
+    abs_distances = np.abs(distances)
+    hits = np.flatnonzero((abs_distances[:-1] < abs_distances[1:]) & (distances[:-1] < threshold))
+    return int(hits[0]) if len(hits) > 0 else None
+
+
 ###############################################
 # --- Mesh cutting utilities (pure Python replacements for libigl)
 
@@ -302,48 +367,45 @@ def _trimesh_cut_mesh(
     tuple[np.ndarray, np.ndarray]
         New vertices and faces with duplicated vertices along cut edges.
     """
-    n_faces = len(faces)
-
-    # Build a map from (vertex, face) -> new vertex index
-    # Vertices that are on cut edges need to be duplicated per face
-    vertex_face_to_new_index: dict[tuple[int, int], int] = {}
-    new_vertices = list(vertices)
-
-    # For each face, determine which vertices need to be duplicated
-    for fi in range(n_faces):
-        face = faces[fi]
-        for ei in range(3):
-            v0, v1 = face[ei], face[(ei + 1) % 3]
-
-            # Check if this edge is cut
-            if cut_flags[fi, ei] == 1:
-                # Both endpoints of cut edges need their own copy for this face
-                for v in [v0, v1]:
-                    key = (v, fi)
-                    if key not in vertex_face_to_new_index:
-                        # Create a new vertex (duplicate)
-                        new_idx = len(new_vertices)
-                        new_vertices.append(vertices[v])
-                        vertex_face_to_new_index[key] = new_idx
-
-    # Build new faces with updated vertex indices
-    new_faces = []
-    for fi in range(n_faces):
-        face = faces[fi]
-        new_face = []
-        for vi in range(3):
-            v = face[vi]
-            key = (v, fi)
-            if key in vertex_face_to_new_index:
-                # Use the duplicated vertex
-                new_face.append(vertex_face_to_new_index[key])
-            else:
-                # Use original vertex, but need to check if any adjacent face
-                # on a cut edge shares this vertex
-                new_face.append(v)
-        new_faces.append(new_face)
-
-    return np.array(new_vertices), np.array(new_faces)
+    faces = np.asarray(faces, dtype=np.intp).reshape((-1, 3))
+    n_vertices, n_faces = len(vertices), len(faces)
+    if n_faces == 0:
+        return np.asarray(vertices), faces
+
+    # halfedge 3 * f + i goes from faces[f, i] to faces[f, (i + 1) % 3]
+    u, w = faces.ravel(), faces[:, [1, 2, 0]].ravel()
+    cut = np.asarray(cut_flags, dtype=bool).ravel()
+    start_corners = np.arange(3 * n_faces)
+    end_corners = (start_corners // 3) * 3 + (start_corners + 1) % 3
+
+    # pair every halfedge with its opposite halfedge
+    halfedge_ids = u * n_vertices + w
+    order = np.argsort(halfedge_ids)
+    pos = np.minimum(np.searchsorted(halfedge_ids[order], w * n_vertices + u), len(order) - 1)
+    opposite = order[pos]
+    i = np.flatnonzero((halfedge_ids[opposite] == w * n_vertices + u) & (start_corners < opposite))
+    j = opposite[i]
+    i, j = i[~cut[i] & ~cut[j]], j[~cut[i] & ~cut[j]]
+
+    # the corners of a vertex in two faces that share an uncut edge keep the same vertex
+    row = np.concatenate([start_corners[i], end_corners[i]])
+    col = np.concatenate([end_corners[j], start_corners[j]])
+    adjacency = scipy.sparse.csr_matrix(
+        (np.ones(len(row), dtype=np.int8), (row, col)), shape=(3 * n_faces, 3 * n_faces)
+    )
+    n_groups, groups = scipy.sparse.csgraph.connected_components(adjacency, directed=False)
+
+    # the first group of corners of every vertex keeps its index, the other groups get duplicates
+    group_vertex = np.empty(n_groups, dtype=np.intp)
+    group_vertex[groups] = u
+    first_group = np.full(n_vertices, n_groups, dtype=np.intp)
+    np.minimum.at(first_group, u, groups)
+    duplicates = np.flatnonzero(first_group[group_vertex] != np.arange(n_groups))
+    new_index = group_vertex.copy()
+    new_index[duplicates] = n_vertices + np.arange(len(duplicates))
+
+    new_vertices = np.concatenate([np.asarray(vertices), np.asarray(vertices)[group_vertex[duplicates]]])
+    return new_vertices, new_index[groups].reshape((n_faces, 3))
 
 
 def _trimesh_face_components(
@@ -418,7 +480,7 @@ def separate_disconnected_components(mesh, attr, values, OUTPUT_PATH):
     mesh: :class: 'compas.datastructures.Mesh'
     attr: str, the key of the vertex attributes that signals the cuts. most likely 'cut'
     values: list, int, the cut indices
-    OUTPUT_PATH: str, the path to the output folder
+    OUTPUT_PATH: str, unused, kept for backwards compatibility
 
     Returns
     ----------
@@ -450,21 +512,15 @@ def separate_disconnected_components(mesh, attr, values, OUTPUT_PATH):
     v_cut, f_cut = _trimesh_cut_mesh(v, f, cut_flags)
     connected_components = _trimesh_face_components(v_cut, f_cut)
 
-    f_dict: dict[int, list[list[int]]] = {}
-    for i in range(max(connected_components) + 1):
-        f_dict[i] = []
-    for f_index, face in enumerate(f_cut):
-        component = connected_components[f_index]
-        f_dict[component].append(face.tolist() if hasattr(face, "tolist") else list(face))
-
     cut_meshes = []
-    for component in f_dict:
-        cut_mesh = Mesh.from_vertices_and_faces(v_cut.tolist(), f_dict[component])
-        cut_mesh.cull_vertices()
-        if len(list(cut_mesh.faces())) > 2:
-            temp_path = Path(OUTPUT_PATH) / "temp.obj"
-            cut_mesh.to_obj(str(temp_path))
-            cut_mesh = Mesh.from_obj(str(temp_path))  # get rid of too many empty keys
+    for component in range(int(connected_components.max()) + 1):
+        component_faces = f_cut[connected_components == component]
+        if len(component_faces) > 2:
+            # keep only the vertices of the component, with contiguous keys
+            used_vertices, component_faces = np.unique(component_faces, return_inverse=True)
+            cut_mesh = Mesh.from_vertices_and_faces(
+                v_cut[used_vertices].tolist(), component_faces.reshape((-1, 3)).tolist()
+            )
             cut_meshes.append(cut_mesh)
 
     for mesh in cut_meshes:
@@ -563,13 +619,14 @@ def cleanup_unrelated_isocontour_neighborhoods(zero_contours, keys_of_clusters_t
 # --- Mesh welding and sanitizing
 
 
-def weld_mesh(mesh, OUTPUT_PATH, precision="2f"):
+def weld_mesh(mesh, OUTPUT_PATH, precision=2):
     """Welds mesh and check that the result is valid."""
     for f_key in mesh.faces():
         if len(mesh.face_vertices(f_key)) < 3:
             mesh.delete_face(f_key)
 
-    welded_mesh = mesh.weld(precision=precision)
+    welded_mesh = mesh.copy()
+    welded_mesh.weld(precision=precision)  # welds in place
 
     temp_path = Path(OUTPUT_PATH) / "temp.obj"
     welded_mesh.to_obj(str(temp_path))  # make sure there's no empty f_keys
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 from abc import abstractmethod
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
@@ -15,6 +16,10 @@ from compas_slicer._numpy_ops import min_distances_to_set
 from compas_slicer.pre_processing.preprocessing_utils import get_existing_boundary_indices, get_existing_cut_indices
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from numpy.typing import NDArray
+
     from compas_slicer.geometry import VerticalLayer
 
 
@@ -154,53 +159,167 @@ class DirectedGraph:
     def get_all_topological_orders(self) -> list[list[int]]:
         """
         Finds  all topological orders from source to sink.
+        The number of orders grows combinatorially with the number of nodes; use :meth:`iter_topological_orders`
+        or :meth:`get_best_topological_order` to avoid enumerating them all.
         Returns
         ----------
         list of lists of integers. Each list represents the indices of one topological order.
         """
-        self.all_orders = []  # make sure list is empty
-        discovered = [False] * self.N
-        path: list[int] = []  # list to store the topological order
-        self.get_orders(path, discovered)
+        self.all_orders = list(self.iter_topological_orders())
         logger.info(f"Found {len(self.all_orders)} possible orders")
         return self.all_orders
 
-    def get_orders(self, path: list[int], discovered: list[bool]) -> None:
+    def iter_topological_orders(self) -> Iterator[list[int]]:
         """
-        Finds all topological orders from source to sink.
-        Sorting algorithm taken from https://www.techiedelight.com/find-all-possible-topological-orderings-of-dag/
+        Yields the topological orders from source to sink lazily, in the same order as
+        :meth:`get_all_topological_orders`. The first order takes O(N^2 + E) time, since every step scans
+        all nodes for one without remaining incoming edges. Nothing is yielded if the graph has a cycle.
+        Yields
+        ----------
+        list of integers, the indices of one topological order.
         """
-        for v in range(self.N):  # for every node
-            # proceed only if in-degree of current node is 0 and current node is not processed yet
-            if self.in_degree[v] == 0 and not discovered[v]:
-                # for every adjacent vertex u of v, reduce in-degree of u by 1
-                for u in self.adj_list[v]:
-                    self.in_degree[u] = self.in_degree[u] - 1
+        in_degree = list(self.in_degree)
+        discovered = [False] * self.N
+        path: list[int] = []
+
+        def extend_path() -> Iterator[list[int]]:
+            if len(path) == self.N:
+                yield list(path)
+                return
+            for v in range(self.N):
+                if in_degree[v] == 0 and not discovered[v]:
+                    for u in self.adj_list[v]:
+                        in_degree[u] -= 1
+                    path.append(v)
+                    discovered[v] = True
+
+                    yield from extend_path()
+
+                    for u in self.adj_list[v]:
+                        in_degree[u] += 1
+                    path.pop()
+                    discovered[v] = False
+
+        yield from extend_path()
+
+    def get_best_topological_order(
+        self, cost: Callable[[int, int], float] | None = None, beam_width: int | None = None
+    ) -> list[int]:
+        """
+        Finds the topological order with the lowest total cost of the transitions between consecutive nodes,
+        without enumerating all orders.
+
+        By default, the search is an exact branch and bound: the partial orders are extended with the cheapest
+        transitions first, and are pruned as soon as their cost plus the cheapest transition into each of the
+        remaining nodes reaches the cost of the best order found so far. With a beam width, only the beam_width
+        cheapest partial orders are extended at every step, which is faster but not guaranteed to be optimal.
+        Among orders of equal cost, the first one found is returned, so with zero costs the result is the first
+        order of :meth:`iter_topological_orders`.
+
+        Parameters
+        ----------
+        cost: callable (i, j) -> float, optional. The non-negative cost of the transition from node i to node j,
+            for example the travel distance between them. Defaults to :meth:`travel_distance`.
+        beam_width: int, optional. If given, the number of partial orders that are kept at every step.
 
-                # include current node in the path and mark it as discovered
+        Returns
+        ----------
+        list of integers, the indices of the selected topological order.
+        """
+        cost = cost if cost is not None else self.travel_distance
+        if beam_width is not None and beam_width < 1:
+            raise ValueError(f"The beam width must be at least 1, got {beam_width}.")
+        costs = np.array([[cost(i, j) if i != j else 0.0 for j in range(self.N)] for i in range(self.N)], dtype=float)
+        if np.any(costs < 0):
+            raise ValueError("The costs of the transitions between nodes must be non-negative.")
+
+        if beam_width is None:
+            best_order = self._branch_and_bound_order(costs)
+        else:
+            best_order = self._beam_search_order(costs, beam_width)
+        logger.info(f"Best topological order: {best_order}, cost: {_order_cost(costs, best_order):.3f}")
+        return best_order
+
+    def _branch_and_bound_order(self, costs: NDArray) -> list[int]:
+        """Returns the topological order with the lowest total transition cost, using branch and bound."""
+        # lower bound of the cost of entering each node
+        entry_costs = np.where(np.eye(self.N, dtype=bool), np.inf, costs).min(axis=0, initial=np.inf)
+        min_entry_costs = np.where(np.isfinite(entry_costs), entry_costs, 0.0).tolist()
+        costs_list = costs.tolist()
+
+        in_degree = list(self.in_degree)
+        discovered = [False] * self.N
+        path: list[int] = []
+        best_order: list[int] | None = None
+        best_cost = np.inf
+
+        def extend_path(path_cost: float, remaining_bound: float) -> None:
+            """remaining_bound: the sum of the lowest entry costs of the nodes that are not in the path."""
+            nonlocal best_order, best_cost
+            if len(path) == self.N:
+                if path_cost < best_cost:
+                    best_order, best_cost = list(path), path_cost
+                return
+            available = [v for v in range(self.N) if in_degree[v] == 0 and not discovered[v]]
+            if path:
+                available.sort(key=lambda v: costs_list[path[-1]][v])
+            for v in available:
+                step_cost = costs_list[path[-1]][v] if path else 0.0
+                bound = remaining_bound - min_entry_costs[v]
+                if path_cost + step_cost + bound >= best_cost:
+                    continue
+                for u in self.adj_list[v]:
+                    in_degree[u] -= 1
                 path.append(v)
                 discovered[v] = True
 
-                # recur
-                self.get_orders(path, discovered)
+                extend_path(path_cost + step_cost, bound)
 
-                # backtrack: reset in-degree information for the current node
                 for u in self.adj_list[v]:
-                    self.in_degree[u] = self.in_degree[u] + 1
-
-                # backtrack: remove current node from the path and mark it as undiscovered
+                    in_degree[u] += 1
                 path.pop()
                 discovered[v] = False
 
-        # print the topological order if all vertices are included in the path
-        if len(path) == self.N:
-            self.all_orders.append(copy.deepcopy(path))
+        extend_path(0.0, sum(min_entry_costs))
+        if best_order is None:
+            raise ValueError("No topological order was found. Check that the graph has no cycles.")
+        return best_order
+
+    def _beam_search_order(self, costs: NDArray, beam_width: int) -> list[int]:
+        """Returns a topological order with a low total transition cost, using beam search."""
+        costs_list = costs.tolist()
+        beam: list[tuple[float, list[int], list[int]]] = [(0.0, [], list(self.in_degree))]
+        for _ in range(self.N):
+            candidates: list[tuple[float, list[int], list[int]]] = []
+            for path_cost, path, in_degree in beam:
+                discovered = set(path)
+                for v in range(self.N):
+                    if in_degree[v] == 0 and v not in discovered:
+                        step_cost = costs_list[path[-1]][v] if path else 0.0
+                        child_in_degree = list(in_degree)
+                        for u in self.adj_list[v]:
+                            child_in_degree[u] -= 1
+                        candidates.append((path_cost + step_cost, [*path, v], child_in_degree))
+            if not candidates:
+                raise ValueError("No topological order was found. Check that the graph has no cycles.")
+            candidates.sort(key=lambda candidate: candidate[0])  # stable, so ties keep the enumeration order
+            beam = candidates[:beam_width]
+        return beam[0][1]
+
+    def travel_distance(self, i: int, j: int) -> float:
+        """Returns the cost of printing node j right after node i. Inheriting classes return the travel distance."""
+        return 0.0
 
     def get_parents_of_node(self, node_index: int) -> list[int]:
         """Returns the parents of node with i = node_index."""
         return [j for j, adj in enumerate(self.adj_list) if node_index in adj]
 
 
+def _order_cost(costs: NDArray, order: list[int]) -> float:
+    """Returns the total cost of the transitions between the consecutive nodes of an order."""
+    return float(sum(costs[i, j] for i, j in zip(order[:-1], order[1:])))
+
+
 #################################
 #  --- Meshes DirectedGraph
 
@@ -276,6 +395,15 @@ class MeshDirectedGraph(DirectedGraph):
         # --- debugging output
         return children, cut_ids
 
+    def travel_distance(self, i: int, j: int) -> float:
+        """Returns the distance between the vertex centroids of the meshes i and j."""
+        return float(np.linalg.norm(self.mesh_centroids[j] - self.mesh_centroids[i]))
+
+    @cached_property
+    def mesh_centroids(self) -> NDArray:
+        """(N, 3) centroids of the vertices of the meshes."""
+        return np.array([np.mean(mesh.vertices_attributes("xyz"), axis=0) for mesh in self.all_meshes])
+
 
 #################################
 #  --- Segments DirectedGraph
@@ -333,6 +461,12 @@ class SegmentsDirectedGraph(DirectedGraph):
                     children.append(i)
         return children, [None for _ in children]  # None because this graph doesn't have cut ids
 
+    def travel_distance(self, i: int, j: int) -> float:
+        """Returns the distance from the last point of the segment i to the first point of the segment j."""
+        last_pt = self.segments[i].paths[-1].points[-1]
+        first_pt = self.segments[j].paths[0].points[0]
+        return float(np.linalg.norm(np.asarray(first_pt, dtype=float) - np.asarray(last_pt, dtype=float)))
+
 
 #################################
 # --- helpers
@@ -18,7 +18,7 @@ from compas.itertools import pairwise
 from loguru import logger
 
 from compas_slicer.config import GcodeConfig
-from compas_slicer.geometry import PrintPointsCollection
+from compas_slicer.geometry import ColumnarPrintPointsCollection, PrintPointsCollection
 from compas_slicer.print_organization.print_organization_utilities.gcode import create_gcode_text
 from compas_slicer.slicers.base_slicer import BaseSlicer
 
@@ -145,6 +145,17 @@ class BasePrintOrganizer:
         duplicate_ppts = []
 
         path = self.printpoints[layer_idx][path_idx]
+        if isinstance(self.printpoints, ColumnarPrintPointsCollection):
+            steps = np.linalg.norm(np.diff(path.positions, axis=0), axis=1)
+            dup_index = np.flatnonzero(steps < tolerance).tolist()
+            if dup_index:
+                logger.warning(
+                    f"Attention! {len(dup_index)} Duplicate printpoint(s) on "
+                    f"layer {layer_idx}, path {path_idx}, indices: {dup_index}. They will be removed."
+                )
+                self.printpoints.remove_printpoints(np.asarray(dup_index) + path.indices.start)
+            return
+
         for i, printpoint in enumerate(path.printpoints[:-1]):
             next_ppt = path.printpoints[i + 1]
             if np.linalg.norm(np.array(printpoint.pt) - np.array(next_ppt.pt)) < tolerance:
@@ -252,9 +263,9 @@ class BasePrintOrganizer:
         count = 0
 
         for i, layer in enumerate(self.printpoints):
-            for j, path in enumerate(layer):
+            for j in range(len(layer)):
                 self.remove_duplicate_points_in_path(i, j)
-                for printpoint in path:
+                for printpoint in self.printpoints[i][j]:
                     data[count] = printpoint.to_data()
                     count += 1
 
@@ -276,11 +287,11 @@ class BasePrintOrganizer:
         for i, layer in enumerate(self.printpoints):
             layer_key = f"layer_{i}"
             data[layer_key] = {}
-            for j, path in enumerate(layer):
+            for j in range(len(layer)):
                 path_key = f"path_{j}"
                 data[layer_key][path_key] = {}
                 self.remove_duplicate_points_in_path(i, j)
-                for k, printpoint in enumerate(path):
+                for k, printpoint in enumerate(self.printpoints[i][j]):
                     data[layer_key][path_key][k] = printpoint.to_data()
                     count += 1
 
@@ -10,9 +10,6 @@ from compas.geometry import (
     Vector,
     closest_point_on_polyline,
     distance_point_point,
-    dot_vectors,
-    scale_vector,
-    subtract_vectors,
 )
 from loguru import logger
 from numpy.typing import NDArray
@@ -215,8 +212,11 @@ class InterpolationPrintOrganizer(BasePrintOrganizer):
                 logger.error("no topology graph found, cannnot set the order of vertical layers")
                 self.selected_order = [0]
             else:
-                all_orders = self.topo_sort_graph.get_all_topological_orders()
-                self.selected_order = all_orders[0]  # TODO: add more elaborate selection strategy
+                # the first topological order, found without enumerating all orders
+                # TODO: add more elaborate selection strategy, see DirectedGraph.get_best_topological_order
+                self.selected_order = next(self.topo_sort_graph.iter_topological_orders(), None)
+                if self.selected_order is None:
+                    raise ValueError("The vertical layers have no topological order, their directed graph has a cycle.")
         else:
             self.selected_order = [0]  # there is only one segment, only this option
 
@@ -247,21 +247,26 @@ class InterpolationPrintOrganizer(BasePrintOrganizer):
             # Batch query: find closest points for all points in this path at once
             closest_pts, distances = _batch_closest_points_on_polyline(path.points, support_polyline_pts)
 
+            # Batch up vectors of the whole path, flipped to point away from the support
+            path_pts = np.asarray(path.points, dtype=np.float64).reshape((-1, 3))
+            path_normals = np.array(normals[count : count + len(path_pts)], dtype=np.float64).reshape((-1, 3))
+            up_vectors = utils.get_printpoints_up_vectors(path_pts, path_normals)
+            flip = np.einsum("ij,ij->i", path_pts - closest_pts, up_vectors) < 0
+            up_vectors[flip] *= -1.0
+            up_vectors = up_vectors.tolist()
+
             print_path = PrintPath()
             for k, p in enumerate(path.points):
                 cp = closest_pts[k]
                 d = distances[k]
 
-                normal = normals[count]
-                ppt = PrintPoint(pt=p, layer_height=avg_layer_height, mesh_normal=normal)
+                ppt = PrintPoint(
+                    pt=p, layer_height=avg_layer_height, mesh_normal=normals[count], up_vector=Vector(*up_vectors[k])
+                )
 
                 ppt.closest_support_pt = Point(cp[0], cp[1], cp[2])
                 ppt.distance_to_support = d
                 ppt.layer_height = max(min(d, max_layer_height), min_layer_height)
-                ppt.up_vector = self.get_printpoint_up_vector(path, k, normal)
-                if dot_vectors(subtract_vectors(p, ppt.closest_support_pt), ppt.up_vector) < 0:
-                    ppt.up_vector = Vector(*scale_vector(ppt.up_vector, -1))
-                ppt.frame = ppt.get_frame()
 
                 print_path.printpoints.append(ppt)
                 count += 1
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
+import numpy as np
 import progressbar
 from compas.geometry import Vector
 from loguru import logger
 
 import compas_slicer.utilities as utils
-from compas_slicer.geometry import PrintLayer, PrintPath, PrintPoint
+from compas_slicer.geometry import ColumnarPrintPointsCollection, PrintLayer, PrintPath, PrintPoint
 from compas_slicer.print_organization.base_print_organizer import BasePrintOrganizer
+from compas_slicer.print_organization.print_organization_utilities.extruder_toggle import (
+    set_print_layer_extruder_toggle,
+)
 
 if TYPE_CHECKING:
+    from compas_slicer.geometry import Layer
     from compas_slicer.slicers import PlanarSlicer
 
 
@@ -39,49 +45,150 @@ class PlanarPrintOrganizer(BasePrintOrganizer):
     def __repr__(self) -> str:
         return f"<PlanarPrintOrganizer with {len(self.slicer.layers)} layers>"
 
-    def create_printpoints(self, generate_mesh_normals: bool = True) -> None:
+    def create_printpoints(self, generate_mesh_normals: bool = True, columnar: bool = False) -> None:
         """Create the print points of the fabrication process.
 
         Parameters
         ----------
         generate_mesh_normals : bool
             If True, compute mesh normals. If False, use Vector(0, 1, 0).
+        columnar : bool
+            If True, ``self.printpoints`` is a :class:`ColumnarPrintPointsCollection` built directly
+            from arrays, instead of a PrintPointsCollection of PrintPoint objects.
 
         """
+        if columnar:
+            logger.info("Creating columnar print points ...")
+            self.printpoints = self._create_columnar_printpoints(generate_mesh_normals)
+            return
 
         count = 0
         logger.info("Creating print points ...")
         with progressbar.ProgressBar(max_value=self.slicer.number_of_points) as bar:
-            if generate_mesh_normals:
-                logger.info("Generating mesh normals ...")
-                # fast method for getting the closest mesh normals to all the printpoints
-                all_pts = [pt for layer in self.slicer.layers for path in layer.paths for pt in path.points]
-                closest_fks, projected_pts = utils.pull_pts_to_mesh_faces(self.slicer.mesh, all_pts)
-                normals = [Vector(*self.slicer.mesh.face_normal(fkey)) for fkey in closest_fks]
+            for print_layer in self.iter_print_layers(
+                generate_mesh_normals=generate_mesh_normals, extruder_toggles=False
+            ):
+                self.printpoints.layers.append(print_layer)
+                count += sum(len(print_path.printpoints) for print_path in print_layer.paths)
+                bar.update(count)
+
+    def _create_columnar_printpoints(self, generate_mesh_normals: bool) -> ColumnarPrintPointsCollection:
+        """Creates the print points of all layers as arrays, see :meth:`create_printpoints`."""
+        layers = self.slicer.layers
+        paths = [path for layer in layers for path in layer.paths]
+        path_lengths = [len(path.points) for path in paths]
+        path_offsets = np.concatenate([[0], np.cumsum(path_lengths, dtype=np.intp)]).astype(np.intp)
+        layer_offsets = np.concatenate([[0], np.cumsum([len(layer.paths) for layer in layers])]).astype(np.intp)
+        positions = np.array([pt for path in paths for pt in path.points], dtype=np.float64).reshape((-1, 3))
+
+        if generate_mesh_normals:
+            mesh = self.slicer.mesh
+            f_normals = np.array([mesh.face_normal(fkey) for fkey in mesh.faces()], dtype=np.float64)
+            closest_fis, _, _ = utils.get_mesh_bvh(mesh).closest_points(positions)
+            normals = f_normals[closest_fis]
+        else:
+            normals = np.tile([0.0, 1.0, 0.0], (len(positions), 1))
+
+        up_vectors = utils.get_printpoints_up_vectors(positions, normals, path_offsets)
+        flat_layer = np.repeat([layer.is_brim or layer.is_raft for layer in layers], np.diff(layer_offsets))
+        flat_points = np.repeat(flat_layer, path_lengths)
+        up_vectors[flat_points] = [0.0, 0.0, 1.0]
+
+        return ColumnarPrintPointsCollection(
+            positions=positions,
+            mesh_normals=normals,
+            layer_heights=self.slicer.layer_height if self.slicer.layer_height else 2.0,
+            path_offsets=path_offsets,
+            layer_offsets=layer_offsets,
+            up_vectors=up_vectors,
+        )
+
+    def iter_print_layers(
+        self,
+        layers: Iterable[Layer] | None = None,
+        generate_mesh_normals: bool = True,
+        extruder_toggles: bool = True,
+    ) -> Iterator[PrintLayer]:
+        """Lazily creates the print layers of the fabrication process, one layer at a time.
+
+        The print layers are not stored in ``self.printpoints``, so that they can be consumed as a
+        pipeline together with :meth:`PlanarSlicer.iter_layers` and :func:`write_gcode`.
+        As :func:`set_extruder_toggle` needs all the print points, the extruder toggles of the pipeline
+        are set here instead, with the same rules. A layer is yielded once the next layer is known.
 
-            for _i, layer in enumerate(self.slicer.layers):
-                print_layer = PrintLayer()
+        Parameters
+        ----------
+        layers : Iterable[Layer] | None
+            The layers to convert. If None, the layers of the slicer are used.
+        generate_mesh_normals : bool
+            If True, compute mesh normals. If False, use Vector(0, 1, 0).
+        extruder_toggles : bool
+            If True, set the extruder toggles of the print points as :func:`set_extruder_toggle`.
 
-                for _j, path in enumerate(layer.paths):
-                    print_path = PrintPath()
+        Yields
+        ------
+        PrintLayer
+        """
+        if layers is None:
+            layers = self.slicer.layers
 
-                    for k, point in enumerate(path.points):
-                        n = normals[count] if generate_mesh_normals else Vector(0, 1, 0)
-                        layer_h = self.slicer.layer_height if self.slicer.layer_height else 2.0
-                        printpoint = PrintPoint(pt=point, layer_height=layer_h, mesh_normal=n)
+        if generate_mesh_normals:
+            mesh = self.slicer.mesh
+            f_normals = [mesh.face_normal(fkey) for fkey in mesh.faces()]
+            bvh = utils.get_mesh_bvh(mesh)
 
-                        if layer.is_brim or layer.is_raft:
-                            printpoint.up_vector = Vector(0, 0, 1)
-                        else:
-                            printpoint.up_vector = self.get_printpoint_up_vector(path, k, n)
+        def create_print_layer(layer: Layer, next_layer: Layer | None) -> PrintLayer:
+            normals = None
+            if generate_mesh_normals:
+                # normals of the mesh faces closest to all the points of the layer
+                pts = np.array([pt for path in layer.paths for pt in path.points], dtype=np.float64).reshape((-1, 3))
+                closest_fis, _, _ = bvh.closest_points(pts)
+                normals = [Vector(*f_normals[fi]) for fi in closest_fis]
+            print_layer = self._create_print_layer(layer, normals)
+            if extruder_toggles:
+                set_print_layer_extruder_toggle(print_layer, layer, next_layer)
+            return print_layer
+
+        # the extruder toggles of a layer depend on the next layer, so every layer waits for the next one
+        previous_layer: Layer | None = None
+        for layer in layers:
+            if previous_layer is not None:
+                yield create_print_layer(previous_layer, layer)
+            previous_layer = layer
+        if previous_layer is not None:
+            yield create_print_layer(previous_layer, None)
+
+    def _create_print_layer(self, layer: Layer, normals: list[Vector] | None) -> PrintLayer:
+        """Creates the print layer of a layer, given the mesh normals of its points (or None)."""
+        layer_h = self.slicer.layer_height if self.slicer.layer_height else 2.0
+        print_layer = PrintLayer()
+
+        pts = np.array([pt for path in layer.paths for pt in path.points], dtype=np.float64).reshape((-1, 3))
+        path_offsets = np.concatenate([[0], np.cumsum([len(path.points) for path in layer.paths])]).astype(np.intp)
+        normals_array = (
+            np.array(normals, dtype=np.float64) if normals is not None else np.tile([0.0, 1.0, 0.0], (len(pts), 1))
+        )
+        if layer.is_brim or layer.is_raft:
+            up_vectors = np.tile([0.0, 0.0, 1.0], (len(pts), 1))
+        else:
+            up_vectors = utils.get_printpoints_up_vectors(pts, normals_array, path_offsets)
+        up_vectors = up_vectors.tolist()
 
-                        print_path.printpoints.append(printpoint)
-                        bar.update(count)
-                        count += 1
+        count = 0
+        for path in layer.paths:
+            print_path = PrintPath()
 
-                    print_layer.paths.append(print_path)
+            for point in path.points:
+                n = normals[count] if normals is not None else Vector(0, 1, 0)
+                printpoint = PrintPoint(
+                    pt=point, layer_height=layer_h, mesh_normal=n, up_vector=Vector(*up_vectors[count])
+                )
+                print_path.printpoints.append(printpoint)
+                count += 1
 
-                self.printpoints.layers.append(print_layer)
+            print_layer.paths.append(print_path)
+
+        return print_layer
 
 
 if __name__ == "__main__":
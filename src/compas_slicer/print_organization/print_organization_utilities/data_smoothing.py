@@ -86,6 +86,6 @@ def smooth_printpoints_up_vectors(print_organizer: BasePrintOrganizer, iteration
         printpoint.up_vector = Vector(*v) if isinstance(v, list) else v
 
     smooth_printpoint_attribute(print_organizer, iterations, strength, get_ppt_up_vec, set_ppt_up_vec)
-    # finally update any values in the printpoints that are affected by the changed attribute
+    # finally reset the frames, so that they are computed from the smoothed up vectors when accessed
     for ppt in print_organizer.printpoints_iterator():
-        ppt.frame = ppt.get_frame()
+        ppt.frame = None
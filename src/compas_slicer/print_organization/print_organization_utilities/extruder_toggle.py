@@ -2,16 +2,24 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 from loguru import logger
 
 import compas_slicer
+from compas_slicer.geometry import ColumnarPrintPointsCollection
 
 if TYPE_CHECKING:
+    from compas_slicer.geometry import Layer, PrintLayer
     from compas_slicer.print_organization import BasePrintOrganizer
     from compas_slicer.slicers import BaseSlicer
 
 
-__all__ = ["set_extruder_toggle", "override_extruder_toggle", "check_assigned_extruder_toggle"]
+__all__ = [
+    "set_extruder_toggle",
+    "set_print_layer_extruder_toggle",
+    "override_extruder_toggle",
+    "check_assigned_extruder_toggle",
+]
 
 
 def set_extruder_toggle(print_organizer: BasePrintOrganizer, slicer: BaseSlicer) -> None:
@@ -26,32 +34,10 @@ def set_extruder_toggle(print_organizer: BasePrintOrganizer, slicer: BaseSlicer)
     logger.info("Setting extruder toggle")
 
     for i, layer in enumerate(slicer.layers):
-        is_vertical_layer = isinstance(layer, compas_slicer.geometry.VerticalLayer)
-        is_brim_layer = layer.is_brim
+        next_layer = slicer.layers[i + 1] if i < len(slicer.layers) - 1 else None
 
-        for j, path in enumerate(layer.paths):
-            is_closed_path = path.is_closed
-
-            # --- decide if the path should be interrupted at the end
-            interrupt_path = False
-
-            if not is_closed_path:
-                interrupt_path = True
-                # open paths should always be interrupted
-
-            if not is_vertical_layer and len(layer.paths) > 1:
-                interrupt_path = True
-                # horizontal layers with multiple paths should be interrupted so that the extruder
-                # can travel from one path to the other, exception is added for the brim layers
-                if is_brim_layer and (j + 1) % layer.number_of_brim_offsets != 0:
-                    interrupt_path = False
-
-            if is_vertical_layer and j == len(layer.paths) - 1:
-                interrupt_path = True
-                # the last path of a vertical layer should be interrupted
-
-            if i < len(slicer.layers) - 1 and not slicer.layers[i + 1].paths[0].is_closed:
-                interrupt_path = True
+        for j in range(len(layer.paths)):
+            interrupt_path = _interrupt_path(layer, j, next_layer)
 
             # --- create extruder toggles
             try:
@@ -59,6 +45,12 @@ def set_extruder_toggle(print_organizer: BasePrintOrganizer, slicer: BaseSlicer)
             except (KeyError, IndexError):
                 logger.exception(f"no path found for layer {i}")
             else:
+                if isinstance(path_printpoints, compas_slicer.geometry.PrintPathView):
+                    toggles = print_organizer.printpoints.extruder_toggles[path_printpoints.indices]
+                    toggles[:] = True
+                    if interrupt_path and len(toggles) > 0:
+                        toggles[-1] = False
+                    continue
                 for k, printpoint in enumerate(path_printpoints):
                     if interrupt_path:
                         if k == len(path_printpoints) - 1:
@@ -75,6 +67,56 @@ def set_extruder_toggle(print_organizer: BasePrintOrganizer, slicer: BaseSlicer)
         logger.exception(e)
 
 
+def _interrupt_path(layer: Layer, path_index: int, next_layer: Layer | None) -> bool:
+    """Returns True if the extruder should be switched off at the end of a path of a layer.
+
+    Parameters
+    ----------
+    layer: :class:`compas_slicer.geometry.Layer`
+    path_index: int, the index of the path in the layer
+    next_layer: :class:`compas_slicer.geometry.Layer`, the layer printed after it, or None for the last layer
+    """
+    is_vertical_layer = isinstance(layer, compas_slicer.geometry.VerticalLayer)
+
+    # open paths should always be interrupted
+    interrupt_path = not layer.paths[path_index].is_closed
+
+    if not is_vertical_layer and len(layer.paths) > 1:
+        # horizontal layers with multiple paths should be interrupted so that the extruder
+        # can travel from one path to the other, exception is added for the brim layers
+        interrupt_path = not (layer.is_brim and (path_index + 1) % layer.number_of_brim_offsets != 0)
+
+    if is_vertical_layer and path_index == len(layer.paths) - 1:
+        interrupt_path = True
+        # the last path of a vertical layer should be interrupted
+
+    if next_layer is not None and len(next_layer.paths) > 0 and not next_layer.paths[0].is_closed:
+        interrupt_path = True
+
+    return interrupt_path
+
+
+def set_print_layer_extruder_toggle(print_layer: PrintLayer, layer: Layer, next_layer: Layer | None) -> None:
+    """Sets the extruder_toggle value for the printpoints of one print layer, as :func:`set_extruder_toggle`.
+
+    This allows setting the extruder toggles in a pipeline that creates the print layers one at a time,
+    see :meth:`PlanarPrintOrganizer.iter_print_layers`.
+
+    Parameters
+    ----------
+    print_layer: :class:`compas_slicer.geometry.PrintLayer`, the print layer of the layer
+    layer: :class:`compas_slicer.geometry.Layer`
+    next_layer: :class:`compas_slicer.geometry.Layer`, the layer printed after it, or None for the last layer
+    """
+    for j, print_path in enumerate(print_layer.paths):
+        interrupt_path = _interrupt_path(layer, j, next_layer)
+        for k, printpoint in enumerate(print_path.printpoints):
+            printpoint.extruder_toggle = not (interrupt_path and k == len(print_path.printpoints) - 1)
+
+    if next_layer is None and print_layer.paths and print_layer.paths[-1].printpoints:
+        print_layer.paths[-1].printpoints[-1].extruder_toggle = False  # the last print point of the print
+
+
 def override_extruder_toggle(print_organizer: BasePrintOrganizer, override_value: bool) -> None:
     """Overrides the extruder_toggle value for the printpoints with a user-defined value.
 
@@ -87,12 +129,17 @@ def override_extruder_toggle(print_organizer: BasePrintOrganizer, override_value
     """
     if not isinstance(override_value, bool):
         raise TypeError("Override value must be of type bool")
+    if isinstance(print_organizer.printpoints, ColumnarPrintPointsCollection):
+        print_organizer.printpoints.extruder_toggles[:] = override_value
+        return
     for printpoint in print_organizer.printpoints_iterator():
         printpoint.extruder_toggle = override_value
 
 
 def check_assigned_extruder_toggle(print_organizer: BasePrintOrganizer) -> bool:
     """Checks that all the printpoints have an assigned extruder toggle."""
+    if isinstance(print_organizer.printpoints, ColumnarPrintPointsCollection):
+        return bool(np.all(print_organizer.printpoints.extruder_toggles >= 0))
     all_toggles_assigned = True
     for printpoint in print_organizer.printpoints_iterator():
         if printpoint.extruder_toggle is None:
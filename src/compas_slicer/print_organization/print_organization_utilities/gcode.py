@@ -6,8 +6,9 @@ This module generates G-code for FDM 3D printing from organized print points.
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 from compas.geometry import Point
 from loguru import logger
@@ -15,9 +16,10 @@ from loguru import logger
 from compas_slicer.config import GcodeConfig
 
 if TYPE_CHECKING:
+    from compas_slicer.geometry import PrintLayer, PrintPoint
     from compas_slicer.print_organization import BasePrintOrganizer
 
-__all__ = ["create_gcode_text", "GcodeBuilder"]
+__all__ = ["create_gcode_text", "write_gcode", "GcodeBuilder"]
 
 # =============================================================================
 # Constants
@@ -41,26 +43,36 @@ class GcodeBuilder:
     """Builder for constructing G-code output efficiently.
 
     Uses a list internally and joins at the end for better performance
-    than repeated string concatenation.
+    than repeated string concatenation. If a stream is given, the lines
+    are written to it directly instead, so that no output is held in memory.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, stream: TextIO | None = None) -> None:
         self._lines: list[str] = []
+        self._stream = stream
+        self._n_written = 0
+
+    def _append(self, line: str) -> None:
+        if self._stream is None:
+            self._lines.append(line)
+        else:
+            self._stream.write(f"\n{line}" if self._n_written else line)
+            self._n_written += 1
 
     def comment(self, text: str) -> None:
         """Add a comment line."""
-        self._lines.append(f";{text}")
+        self._append(f";{text}")
 
     def cmd(self, gcode: str, comment: str = "") -> None:
         """Add a G-code command with optional inline comment."""
         if comment:
-            self._lines.append(f"{gcode:<30} ;{comment}")
+            self._append(f"{gcode:<30} ;{comment}")
         else:
-            self._lines.append(gcode)
+            self._append(gcode)
 
     def blank(self) -> None:
         """Add a blank line."""
-        self._lines.append("")
+        self._append("")
 
     def build(self) -> str:
         """Return the complete G-code as a string."""
@@ -180,7 +192,9 @@ def _write_purge_line(gb: GcodeBuilder, config: GcodeConfig) -> None:
     gb.blank()
 
 
-def _write_toolpath(gb: GcodeBuilder, print_organizer: BasePrintOrganizer, config: GcodeConfig) -> float:
+def _write_toolpath(
+    gb: GcodeBuilder, printpoints_with_indices: Iterable[tuple[PrintPoint, int, int, int]], config: GcodeConfig
+) -> float:
     """Write the main toolpath G-code.
 
     Returns the final Z height for use in footer.
@@ -192,7 +206,7 @@ def _write_toolpath(gb: GcodeBuilder, print_organizer: BasePrintOrganizer, confi
     prev_z = 0.0
     layer_height = PURGE_HEIGHT
 
-    for ppt, layer_idx, _path_idx, point_idx in print_organizer.printpoints_indices_iterator():
+    for ppt, layer_idx, _path_idx, point_idx in printpoints_with_indices:
         pt = ppt.pt
         layer_height = ppt.layer_height
         distance = _distance_3d(prev_pt, pt)
@@ -314,7 +328,43 @@ def create_gcode_text(print_organizer: BasePrintOrganizer, config: GcodeConfig |
 
     _write_header(gb, config, timestamp)
     _write_purge_line(gb, config)
-    final_z = _write_toolpath(gb, print_organizer, config)
+    final_z = _write_toolpath(gb, print_organizer.printpoints_indices_iterator(), config)
     _write_footer(gb, config, final_z)
 
     return gb.build()
+
+
+def write_gcode(print_layers: Iterable[PrintLayer], stream: TextIO, config: GcodeConfig | None = None) -> None:
+    """Stream G-code for a sequence of print layers to a text stream.
+
+    Produces the same text as :func:`create_gcode_text` for a print organizer with the same print
+    layers, apart from the timestamp, but consumes the print layers one at a time and writes every
+    line directly, so it can be fed by a lazy pipeline such as :meth:`PlanarPrintOrganizer.iter_print_layers`.
+
+    Parameters
+    ----------
+    print_layers : Iterable[PrintLayer]
+        The print layers in printing order.
+    stream : TextIO
+        An open text stream, e.g. a file opened for writing.
+    config : GcodeConfig | None
+        G-code configuration. If None, uses defaults.
+
+    """
+    config = config or GcodeConfig()
+    logger.info("Writing G-code")
+
+    gb = GcodeBuilder(stream)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    printpoints_with_indices = (
+        (ppt, i, j, k)
+        for i, print_layer in enumerate(print_layers)
+        for j, print_path in enumerate(print_layer.paths)
+        for k, ppt in enumerate(print_path.printpoints)
+    )
+
+    _write_header(gb, config, timestamp)
+    _write_purge_line(gb, config)
+    final_z = _write_toolpath(gb, printpoints_with_indices, config)
+    _write_footer(gb, config, final_z)
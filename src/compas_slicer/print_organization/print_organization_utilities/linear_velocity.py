@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable
 
+import numpy as np
 from compas.geometry import Vector, dot_vectors
 from loguru import logger
 
+from compas_slicer.geometry import ColumnarPrintPointsCollection
 from compas_slicer.utilities import remap, remap_unbound
 
 if TYPE_CHECKING:
@@ -30,6 +32,9 @@ def set_linear_velocity_constant(print_organizer: BasePrintOrganizer, v: float =
     """
 
     logger.info("Setting constant linear velocity")
+    if isinstance(print_organizer.printpoints, ColumnarPrintPointsCollection):
+        print_organizer.printpoints.velocities[:] = v
+        return
     for printpoint in print_organizer.printpoints_iterator():
         printpoint.velocity = v
 
@@ -50,6 +55,10 @@ def set_linear_velocity_per_layer(print_organizer: BasePrintOrganizer, per_layer
             f"Wrong number of velocity values: got {len(per_layer_velocities)}, "
             f"need {print_organizer.number_of_layers} (one per layer)"
         )
+    printpoints = print_organizer.printpoints
+    if isinstance(printpoints, ColumnarPrintPointsCollection):
+        printpoints.velocities[:] = np.asarray(per_layer_velocities, dtype=np.float64)[printpoints.layer_indices]
+        return
     for printpoint, i, _j, _k in print_organizer.printpoints_indices_iterator():
         printpoint.velocity = per_layer_velocities[i]
 
@@ -109,6 +118,17 @@ def set_linear_velocity_by_overhang(
     bound_remapping: bool
     """
 
+    printpoints = print_organizer.printpoints
+    if isinstance(printpoints, ColumnarPrintPointsCollection):
+        logger.info("Setting linear velocity based on parameter range")
+        params = printpoints.mesh_normals[:, 2]
+        if bound_remapping:
+            params = np.clip(params, overhang_range[0], overhang_range[1])
+        in_range = overhang_range[1] - overhang_range[0]
+        out_range = velocity_range[1] - velocity_range[0]
+        printpoints.velocities[:] = velocity_range[0] + (params - overhang_range[0]) / in_range * out_range
+        return
+
     def param_func(ppt):
         return dot_vectors(ppt.mesh_normal, Vector(0.0, 0.0, 1.0))
 
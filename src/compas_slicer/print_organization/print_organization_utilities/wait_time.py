@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Literal
 from compas.geometry import Vector, normalize_vector
 from loguru import logger
 
+from compas_slicer.geometry import ColumnarPrintPointsCollection
 from compas_slicer.utilities import find_next_printpoint
 
 if TYPE_CHECKING:
@@ -122,6 +123,9 @@ def override_wait_time(print_organizer: BasePrintOrganizer, override_value: floa
     override_value: float
         Value to override the wait_time values with.
     """
+    if isinstance(print_organizer.printpoints, ColumnarPrintPointsCollection):
+        print_organizer.printpoints.wait_times[:] = override_value
+        return
     for printpoint in print_organizer.printpoints_iterator():
         printpoint.wait_time = override_value
 
@@ -115,10 +115,10 @@ class ScalarFieldPrintOrganizer(BasePrintOrganizer):
                     pp.distance_to_support = grad_norm
                     pp.layer_height = grad_norm
                     pp.up_vector = Vector(*normalize_vector(grad))
-                    pp.frame = pp.get_frame()
 
     def add_gradient_to_vertices(self) -> GradientEvaluation:
-        g_evaluation = GradientEvaluation(self.slicer.mesh, self.DATA_PATH)
+        scalar_field = utils.ScalarField(self.slicer.mesh, self.slicer.scalar_field)
+        g_evaluation = GradientEvaluation(self.slicer.mesh, self.DATA_PATH, scalar_field)
         g_evaluation.compute_gradient()
         g_evaluation.compute_gradient_norm()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from pathlib import Path as FilePath
 from typing import TYPE_CHECKING, Any
 
@@ -10,8 +11,11 @@ from compas.geometry import bounding_box, distance_point_point_sqrd
 from loguru import logger
 
 from compas_slicer.geometry import Layer, VerticalLayer
-from compas_slicer.post_processing.seams_align import seams_align
-from compas_slicer.post_processing.unify_paths_orientation import unify_paths_orientation
+from compas_slicer.post_processing.seams_align import seams_align, seams_align_layer
+from compas_slicer.post_processing.unify_paths_orientation import (
+    unify_layer_paths_orientation,
+    unify_paths_orientation,
+)
 from compas_slicer.utilities import utils
 
 if TYPE_CHECKING:
@@ -105,12 +109,46 @@ class BaseSlicer:
         self.close_paths()
         logger.info(f"Created {len(self.layers)} Layers with {self.number_of_points} total points")
 
+    def post_process_layers(self, layers: Iterable[Layer]) -> Iterator[Layer]:
+        """Lazily applies the standard post-processing of :meth:`slice_model` to a stream of layers.
+
+        Invalid paths and layers are skipped, closed paths are closed, seams are aligned to the next
+        path and the path orientations are unified, with a lookahead of a single layer. Every yielded
+        layer is used as reference for the next one, so it should not be modified before the next
+        layer has been requested.
+
+        Parameters
+        ----------
+        layers : Iterable[Layer]
+            Layers in printing order, for example as generated layer by layer by a slicer.
+
+        Yields
+        ------
+        Layer
+            The post-processed layers.
+        """
+        valid_layers = (layer for layer in map(_remove_invalid_paths, layers) if len(layer.paths) > 0)
+
+        prev_layer = None
+        prev_path_end = None
+        layer = next(valid_layers, None)
+        while layer is not None:
+            next_layer = next(valid_layers, None)
+
+            _close_paths(layer)
+            next_path_start = next_layer.paths[0].points[0] if next_layer is not None else None
+            seams_align_layer(layer, "next_path", prev_path_end, next_path_start)
+            prev_path_end = layer.paths[-1].points[-1]
+            unify_layer_paths_orientation(layer, prev_layer)
+            _close_paths(layer)
+            yield layer
+
+            prev_layer, layer = layer, next_layer
+
     def close_paths(self) -> None:
         """For closed paths, ensures first and last point are identical."""
         for layer in self.layers:
-            for path in layer.paths:
-                if path.is_closed and distance_point_point_sqrd(path.points[0], path.points[-1]) > 0.00001:
-                    path.points.append(path.points[0])
+            _close_paths(layer)
 
     def remove_invalid_paths_and_layers(self) -> None:
         """Removes invalid layers and paths from the slicer."""
@@ -233,3 +271,19 @@ class BaseSlicer:
     def get_layers_dict(self) -> dict[int, dict[str, Any]]:
         """Returns a dictionary of layers."""
         return {i: layer.to_data() for i, layer in enumerate(self.layers)}
+
+
+def _close_paths(layer: Layer) -> None:
+    """For closed paths of the layer, ensures first and last point are identical."""
+    for path in layer.paths:
+        if path.is_closed and distance_point_point_sqrd(path.points[0], path.points[-1]) > 0.00001:
+            path.points.append(path.points[0])
+
+
+def _remove_invalid_paths(layer: Layer) -> Layer:
+    """Removes the paths with less than two points from the layer."""
+    for j, path in enumerate(list(layer.paths)):
+        if len(path.points) < 2:
+            logger.warning(f"Invalid Path: Path {j}, {path}")
+            layer.paths.remove(path)
+    return layer
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import progressbar
+from compas.geometry import Point
 from loguru import logger
 
 from compas_slicer.config import InterpolationConfig
-from compas_slicer.geometry import VerticalLayersManager
-from compas_slicer.pre_processing.preprocessing_utils.assign_vertex_distance import (
-    assign_interpolation_distance_to_mesh_vertices,
-)
+from compas_slicer.geometry import Path, VerticalLayersManager
+from compas_slicer.pre_processing.preprocessing_utils.assign_vertex_distance import get_interpolation_distances
 from compas_slicer.slicers import BaseSlicer
-from compas_slicer.slicers.slice_utilities import ScalarFieldContours
+from compas_slicer.slicers.slice_utilities import InterpolationLevelContours, ScalarFieldLevelContours
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from compas.datastructures import Mesh
+    from numpy.typing import NDArray
 
     from compas_slicer.pre_processing import InterpolationSlicingPreprocessor
+    from compas_slicer.pre_processing.preprocessing_utils.compound_target import CompoundTarget
 
 
 __all__ = ["InterpolationSlicer"]
@@ -38,6 +42,10 @@ class InterpolationSlicer(BaseSlicer):
         Interpolation configuration.
     n_multiplier : float
         Multiplier for number of isocurves.
+    workers : int
+        Number of worker processes that compute the contours of contiguous bands of interpolation parameters
+        in parallel. The contours are added to the vertical layers in the order of the parameters, so the result
+        is identical to serial slicing. 1 computes the contours serially.
 
     """
 
@@ -46,10 +54,14 @@ class InterpolationSlicer(BaseSlicer):
         mesh: Mesh,
         preprocessor: InterpolationSlicingPreprocessor | None = None,
         config: InterpolationConfig | None = None,
+        workers: int = 1,
     ) -> None:
         logger.info("InterpolationSlicer")
         BaseSlicer.__init__(self, mesh)
 
+        if workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, got {workers}.")
+
         # make sure the mesh of the preprocessor and the mesh of the slicer match
         if preprocessor and len(list(mesh.vertices())) != len(list(preprocessor.mesh.vertices())):
             raise ValueError(
@@ -60,6 +72,7 @@ class InterpolationSlicer(BaseSlicer):
         self.config = config if config else InterpolationConfig()
         self.preprocessor = preprocessor
         self.n_multiplier: float = 1.0
+        self.workers = workers
 
     def generate_paths(self) -> None:
         """Generate curved paths."""
@@ -75,18 +88,81 @@ class InterpolationSlicer(BaseSlicer):
 
         # create paths + layers
         with progressbar.ProgressBar(max_value=len(params_list)) as bar:
-            for i, param in enumerate(params_list):
-                assign_interpolation_distance_to_mesh_vertices(
-                    self.mesh, param, self.preprocessor.target_LOW, self.preprocessor.target_HIGH
-                )
-                contours = ScalarFieldContours(self.mesh)
-                contours.compute()
-                contours.add_to_vertical_layers_manager(vertical_layers_manager)
+            for i, level_contours in enumerate(self.iter_contours(params_list)):
+                for pts, is_closed in level_contours:
+                    if len(pts) > 3:  # discard curves that are too small
+                        path = Path([Point(*pt) for pt in pts.tolist()], is_closed=is_closed)
+                        vertical_layers_manager.add(path)
 
                 bar.update(i)  # advance progress bar
 
         self.layers = vertical_layers_manager.layers
 
+    def iter_contours(self, params_list: list[float]) -> Iterator[list[tuple[NDArray, bool]]]:
+        """Yields the contours of the interpolated distance field for every interpolation parameter.
+
+        Without uneven weights, the interpolated field is linear in the parameter, so the crossing parameter of
+        every edge is solved once and the contours of all parameters are found at once. With uneven weights,
+        the field of every parameter is evaluated as an array and contoured without modifying the mesh.
+        With more than one worker, the parameters are split into contiguous bands that are contoured in
+        worker processes, each receiving a copy of the mesh and the targets.
+
+        Parameters
+        ----------
+        params_list : list[float]
+            Interpolation parameters, from 0 to 1.
+
+        Yields
+        ------
+        list[tuple[NDArray, bool]]
+            The (N, 3) points of every contour of the parameter, and True if the contour is closed.
+
+        """
+        if not self.preprocessor:
+            raise ValueError("You need to provide a pre-processor in order to generate paths.")
+        target_LOW, target_HIGH = self.preprocessor.target_LOW, self.preprocessor.target_HIGH
+        if target_LOW is None:
+            raise ValueError("The pre-processor has no targets, call create_compound_targets first.")
+
+        if self.workers <= 1 or len(params_list) <= 1:
+            yield from _iter_interpolation_contours(self.mesh, target_LOW, target_HIGH, params_list)
+            return
+
+        bands = np.array_split(np.asarray(params_list, dtype=np.float64), min(self.workers, len(params_list)))
+        with ProcessPoolExecutor(max_workers=len(bands)) as executor:
+            futures = [
+                executor.submit(_interpolation_contours, self.mesh, target_LOW, target_HIGH, band.tolist())
+                for band in bands
+            ]
+            for future in futures:
+                yield from future.result()
+
+
+def _iter_interpolation_contours(
+    mesh: Mesh, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None, params_list: list[float]
+) -> Iterator[list[tuple[NDArray, bool]]]:
+    """Yields the contours of the interpolated distance field for every interpolation parameter."""
+    if target_LOW and target_HIGH and target_HIGH.has_uneven_weights:
+        for param in params_list:
+            distances = get_interpolation_distances(param, target_LOW, target_HIGH)
+            yield from ScalarFieldLevelContours(mesh, distances).iter_contours([0.0])
+    elif target_LOW and target_HIGH:
+        d_low, d_high = target_LOW.get_all_distances(), target_HIGH.get_all_distances()
+        yield from InterpolationLevelContours(mesh, d_low, d_high).iter_contours(params_list)
+    elif target_LOW:
+        # offsets of the lower target
+        offsets = [param * target_LOW.get_max_dist() for param in params_list]
+        yield from ScalarFieldLevelContours(mesh, target_LOW.get_all_distances()).iter_contours(offsets)
+    else:
+        raise ValueError("You need to provide at least one target")
+
+
+def _interpolation_contours(
+    mesh: Mesh, target_LOW: CompoundTarget, target_HIGH: CompoundTarget | None, params_list: list[float]
+) -> list[list[tuple[NDArray, bool]]]:
+    """Worker process entry point: the contours of a band of interpolation parameters."""
+    return list(_iter_interpolation_contours(mesh, target_LOW, target_HIGH, params_list))
+
 
 def find_no_of_isocurves(target_0: Any, target_1: Any, avg_layer_height: float = 1.1) -> int:
     """Return the number of isocurves to cover the distance from target_0 to target_1.
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Literal
+
 from compas.datastructures import Mesh
 from compas.geometry import Plane, Point, Vector
 from loguru import logger
 
 from compas_slicer.slicers.base_slicer import BaseSlicer
-from compas_slicer.slicers.planar_slicing import create_planar_paths
+from compas_slicer.slicers.planar_slicing import (
+    FaceIntervalIndex,
+    create_planar_paths,
+    create_planar_paths_numpy,
+    iter_planar_paths,
+    iter_planar_paths_numpy,
+)
+
+if TYPE_CHECKING:
+    from compas_slicer.geometry import Layer
 
 __all__ = ["PlanarSlicer"]
 
@@ -22,6 +34,12 @@ class PlanarSlicer(BaseSlicer):
     slice_height_range : tuple[float, float] | None
         Optional tuple (z_start, z_end) to slice only part of the model.
         Values are relative to mesh minimum height.
+    backend : str
+        Slicing backend, either "cgal" (requires compas_cgal) or "numpy" (pure NumPy, no CGAL needed).
+    workers : int
+        Number of worker processes that slice contiguous bands of layers in parallel. 1 slices serially.
+    path_arrays : bool
+        If True, the layers hold array-backed :class:`PathArray` paths instead of lists of Points.
 
     """
 
@@ -30,18 +48,37 @@ class PlanarSlicer(BaseSlicer):
         mesh: Mesh,
         layer_height: float = 2.0,
         slice_height_range: tuple[float, float] | None = None,
+        backend: Literal["cgal", "numpy"] = "cgal",
+        workers: int = 1,
+        path_arrays: bool = False,
     ) -> None:
         logger.info("PlanarSlicer")
         BaseSlicer.__init__(self, mesh)
 
+        if backend not in ("cgal", "numpy"):
+            raise ValueError(f"Unknown planar slicing backend: {backend}. Use 'cgal' or 'numpy'.")
+        if workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, got {workers}.")
+
         self.layer_height = layer_height
         self.slice_height_range = slice_height_range
+        self.backend = backend
+        self.workers = workers
+        self.path_arrays = path_arrays
+        self._face_index: FaceIntervalIndex | None = None
 
     def __repr__(self) -> str:
         return f"<PlanarSlicer with {len(self.layers)} layers and layer_height : {self.layer_height:.2f} mm>"
 
-    def generate_paths(self) -> None:
-        """Generate the planar slicing paths."""
+    @property
+    def face_index(self) -> FaceIntervalIndex:
+        """Index of the mesh faces sorted by their z span, built on first use and reused by later calls."""
+        if self._face_index is None:
+            self._face_index = FaceIntervalIndex.from_mesh(self.mesh)
+        return self._face_index
+
+    def get_planes(self) -> list[Plane]:
+        """Returns the slicing planes, from the bottom to the top of the (ranged) mesh."""
         z = [self.mesh.vertex_attribute(key, "z") for key in self.mesh.vertices()]
         min_z, max_z = min(z), max(z)
 
@@ -58,7 +95,48 @@ class PlanarSlicer(BaseSlicer):
         d = abs(min_z - max_z)
         no_of_layers = int(d / self.layer_height) + 1
         normal = Vector(0, 0, 1)
-        planes = [Plane(Point(0, 0, min_z + i * self.layer_height), normal) for i in range(no_of_layers)]
+        return [Plane(Point(0, 0, min_z + i * self.layer_height), normal) for i in range(no_of_layers)]
+
+    def generate_paths(self) -> None:
+        """Generate the planar slicing paths."""
+        planes = self.get_planes()
+
+        if self.backend == "numpy":
+            logger.info("Planar slicing using NumPy ...")
+            self.layers = create_planar_paths_numpy(
+                self.mesh, planes, face_index=self.face_index, workers=self.workers, path_arrays=self.path_arrays
+            )
+        else:
+            logger.info("Planar slicing using CGAL ...")
+            self.layers = create_planar_paths(self.mesh, planes, workers=self.workers, path_arrays=self.path_arrays)
+
+    def iter_layers(self, post_process: bool = True) -> Iterator[Layer]:
+        """Lazily slices the model and yields one layer at a time, from the bottom up.
+
+        In contrast to :meth:`slice_model`, the layers are not stored in ``self.layers``, so that
+        the memory use stays bounded by a few layers. This allows downstream steps to consume
+        the layers as a pipeline, see :meth:`PlanarPrintOrganizer.iter_print_layers` and
+        :func:`write_gcode`.
+
+        Parameters
+        ----------
+        post_process : bool
+            If True, applies the standard post-processing of :meth:`slice_model` layer by layer,
+            see :meth:`post_process_layers`.
+
+        Yields
+        ------
+        Layer
+        """
+        planes = self.get_planes()
+
+        if self.backend == "numpy":
+            layers = iter_planar_paths_numpy(
+                self.mesh, planes, face_index=self.face_index, path_arrays=self.path_arrays
+            )
+        else:
+            layers = iter_planar_paths(self.mesh, planes, path_arrays=self.path_arrays)
 
-        logger.info("Planar slicing using CGAL ...")
-        self.layers = create_planar_paths(self.mesh, planes)
+        if post_process:
+            layers = self.post_process_layers(layers)
+        yield from layers
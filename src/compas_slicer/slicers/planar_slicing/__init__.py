@@ -1,3 +1,4 @@
 from .planar_slicing_cgal import *  # noqa: F401 F403
+from .planar_slicing_numpy import *  # noqa: F401 F403
 
 __all__ = [name for name in dir() if not name.startswith("_")]
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import itertools
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable
 
+import numpy as np
 import progressbar
 from compas.geometry import Plane, Point
 from compas.plugins import PluginNotInstalledError
 
-from compas_slicer.geometry import Layer, Path
+from compas_slicer.geometry import Layer, Path, PathArray
+from compas_slicer.slicers.planar_slicing.planar_slicing_numpy import FaceIntervalIndex
 
 if TYPE_CHECKING:
     from compas.datastructures import Mesh
+    from numpy.typing import NDArray
 
 
-__all__ = ["create_planar_paths"]
+__all__ = ["create_planar_paths", "iter_planar_paths"]
 
 
-def create_planar_paths(mesh: Mesh, planes: list[Plane]) -> list[Layer]:
+def create_planar_paths(mesh: Mesh, planes: list[Plane], workers: int = 1, path_arrays: bool = False) -> list[Layer]:
     """Creates planar contours very efficiently using CGAL.
 
     Parameters
@@ -24,45 +29,25 @@ def create_planar_paths(mesh: Mesh, planes: list[Plane]) -> list[Layer]:
     mesh: :class: 'compas.datastructures.Mesh'
         A compas mesh.
     planes: list, :class: 'compas.geometry.Plane'
+    workers: int
+        Number of worker processes. If larger than 1, the planes are split into contiguous bands
+        that are sliced in parallel, see :func:`slice_mesh_in_bands`. The planes must then be parallel.
+    path_arrays: bool
+        If True, the paths are array-backed :class:`PathArray` objects instead of lists of Points.
     """
-    try:
-        from compas_cgal.slicer import slice_mesh
-    except ImportError as e:
-        raise PluginNotInstalledError(
-            "Compas_cgal library is missing! "
-            "You can't use this planar slicing method without it. "
-            "Install it with: pip install compas_cgal"
-        ) from e
-
-    # prepare mesh for slicing
-    M = mesh.to_vertices_and_faces()
+    slice_mesh = _import_slice_mesh()
 
     # slicing operation
-    contours = slice_mesh(M, planes)
+    if workers > 1 and len(planes) > 1:
+        contours = slice_mesh_in_bands(mesh, planes, workers)
+    else:
+        contours = slice_mesh(mesh.to_vertices_and_faces(), planes)
     cgal_layers = get_grouped_list(contours, key_function=key_function)
 
     layers = []
     with progressbar.ProgressBar(max_value=len(planes)) as bar:
         for i, layer in enumerate(cgal_layers):
-            paths_per_layer = []
-            for path in layer:
-                points_per_contour = []
-                for point in path:
-                    pt = Point(point[0], point[1], point[2])
-                    points_per_contour.append(pt)
-
-                # check if path is closed
-                if points_per_contour[0] == points_per_contour[-1]:
-                    is_closed = True
-                else:
-                    is_closed = False
-                # generate paths
-                path = Path(points=points_per_contour, is_closed=is_closed)
-                paths_per_layer.append(path)
-
-            # generate layers
-            layer = Layer(paths_per_layer)
-            layers.append(layer)
+            layers.append(_contours_to_layer(layer, path_arrays))
 
             # advance progressbar
             bar.update(i)
@@ -70,6 +55,112 @@ def create_planar_paths(mesh: Mesh, planes: list[Plane]) -> list[Layer]:
     return layers
 
 
+def iter_planar_paths(
+    mesh: Mesh, planes: list[Plane], chunk_size: int = 16, path_arrays: bool = False
+) -> Iterator[Layer]:
+    """Lazily creates planar contours using CGAL, a few layers at a time.
+
+    Only the contours of one chunk of planes are held in memory, which keeps the peak memory
+    bounded for tall models with many layers.
+
+    Parameters
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+        A compas mesh.
+    planes: list, :class: 'compas.geometry.Plane'
+        Slicing planes, sorted in the order in which the layers should be yielded.
+    chunk_size: int
+        Number of planes that are passed to CGAL at once.
+    path_arrays: bool
+        If True, the paths are array-backed :class:`PathArray` objects instead of lists of Points.
+
+    Yields
+    ------
+    Layer
+        One layer per plane that intersects the mesh.
+    """
+    slice_mesh = _import_slice_mesh()
+
+    M = mesh.to_vertices_and_faces()
+    for start in range(0, len(planes), chunk_size):
+        contours = slice_mesh(M, planes[start : start + chunk_size])
+        for layer in get_grouped_list(contours, key_function=key_function):
+            yield _contours_to_layer(layer, path_arrays)
+
+
+def _import_slice_mesh() -> Callable[..., Any]:
+    """Imports the CGAL slicing function, raising a helpful error if compas_cgal is missing."""
+    try:
+        from compas_cgal.slicer import slice_mesh as cgal_slice_mesh
+    except ImportError as e:
+        raise PluginNotInstalledError(
+            "Compas_cgal library is missing! "
+            "You can't use this planar slicing method without it. "
+            "Install it with: pip install compas_cgal"
+        ) from e
+    slice_mesh: Callable[..., Any] = cgal_slice_mesh
+    return slice_mesh
+
+
+def _contours_to_layer(contours: list[Any], path_arrays: bool = False) -> Layer:
+    """Converts the CGAL contours of one plane to a Layer."""
+    if path_arrays:
+        paths = []
+        for contour in contours:
+            coords = np.array(contour, dtype=np.float64)
+            paths.append(PathArray(coords, is_closed=bool(np.array_equal(coords[0], coords[-1]))))
+        return Layer(paths)
+
+    paths_per_layer = []
+    for contour in contours:
+        # convert the whole contour at once, a per-coordinate loop dominates the runtime on large meshes
+        points_per_contour = [Point(*point) for point in np.asarray(contour, dtype=float).tolist()]
+
+        # check if path is closed
+        is_closed = points_per_contour[0] == points_per_contour[-1]
+        # generate paths
+        paths_per_layer.append(Path(points=points_per_contour, is_closed=is_closed))
+    return Layer(paths_per_layer)
+
+
+def slice_mesh_in_bands(mesh: Mesh, planes: list[Plane], workers: int) -> list[NDArray[np.float64]]:
+    """Slices the mesh with CGAL in parallel worker processes, one contiguous band of parallel planes per worker.
+
+    Every worker only receives the faces that overlap its band, see :meth:`FaceIntervalIndex.split`.
+    The contours are the same as with serial slicing, but since CGAL picks the start point and the order
+    of the contours from the whole mesh it slices, closed contours may start at another point, and the
+    contours of a plane may come in another order. The contours of all bands are concatenated from the
+    lowest to the highest plane.
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+    V = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+    F = np.asarray(faces, dtype=np.intp).reshape((-1, 3))
+    index = FaceIntervalIndex(V, F, np.asarray(planes[0].normal, dtype=np.float64))
+    heights = np.array([np.dot(plane.point, index.normal) for plane in planes], dtype=np.float64)
+    bands = index.split(heights, workers)
+
+    with ProcessPoolExecutor(max_workers=len(bands)) as executor:
+        futures = [
+            executor.submit(
+                _slice_band,
+                V_band,
+                F_band.astype(np.int32),
+                [(list(planes[i].point), list(planes[i].normal)) for i in positions],
+            )
+            for positions, V_band, F_band in bands
+        ]
+        return [contour for future in futures for contour in future.result()]
+
+
+def _slice_band(
+    V: NDArray[np.float64], F: NDArray[np.int32], planes: list[tuple[list[float], list[float]]]
+) -> list[NDArray[np.float64]]:
+    """Worker function: slices the faces of one band with CGAL and returns picklable arrays."""
+    from compas_cgal.slicer import slice_mesh
+
+    return [np.array(contour, dtype=np.float64) for contour in slice_mesh((V, F), planes)]
+
+
 def get_grouped_list(item_list: list[Any], key_function: Callable[[Any], Any]) -> list[list[Any]]:
     """Groups layers horizontally."""
     # first sort, because grouping only groups consecutively matching items
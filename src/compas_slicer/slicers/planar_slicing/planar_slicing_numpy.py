@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import progressbar
+import scipy.sparse
+from compas.geometry import Point
+from loguru import logger
+from numpy.typing import NDArray
+from scipy.sparse.csgraph import connected_components
+
+from compas_slicer.geometry import Layer, Path, PathArray
+
+if TYPE_CHECKING:
+    from compas.datastructures import Mesh
+    from compas.geometry import Plane
+
+
+__all__ = ["create_planar_paths_numpy", "iter_planar_paths_numpy", "slice_mesh_arrays", "FaceIntervalIndex"]
+
+# Consecutive contour points closer than this are merged (occurs when a vertex lies exactly on a plane)
+DUPLICATE_POINT_TOLERANCE = 1e-10
+
+PlaneContours = list[tuple[NDArray[np.float64], bool]]
+
+
+def create_planar_paths_numpy(
+    mesh: Mesh,
+    planes: list[Plane],
+    face_index: FaceIntervalIndex | None = None,
+    workers: int = 1,
+    path_arrays: bool = False,
+) -> list[Layer]:
+    """Creates planar contours with a pure NumPy implementation, without CGAL.
+
+    The planes are swept in order, and each plane is only intersected with the triangles
+    whose span along the normal contains it. The resulting segments are stitched into
+    polylines through integer edge keys.
+
+    Parameters
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+        A triangulated compas mesh.
+    planes: list, :class: 'compas.geometry.Plane'
+        Parallel slicing planes, i.e. planes that all share the same normal.
+    face_index: :class: 'FaceIntervalIndex' | None
+        A prebuilt index of the mesh faces along the plane normal, for reuse across calls.
+        If None, it is built from the mesh.
+    workers: int
+        Number of worker processes. If larger than 1, the planes are split into contiguous bands that
+        are sliced in parallel, each with only the faces overlapping its band. The result is identical
+        to the serial one.
+    path_arrays: bool
+        If True, the paths are array-backed :class:`PathArray` objects instead of lists of Points.
+
+    Returns
+    -------
+    list[Layer]
+        One layer per plane that intersects the mesh.
+    """
+    if len(planes) == 0:
+        return []
+
+    normal, heights = get_plane_heights(planes)
+    face_index = _check_face_index(mesh, face_index, normal)
+    contours_per_plane = face_index.slice(heights, workers=workers)
+
+    layers = []
+    with progressbar.ProgressBar(max_value=len(planes)) as bar:
+        for i, contours in enumerate(contours_per_plane):
+            if len(contours) > 0:
+                layers.append(_contours_to_layer(contours, path_arrays))
+            bar.update(i)
+
+    return layers
+
+
+def iter_planar_paths_numpy(
+    mesh: Mesh, planes: list[Plane], face_index: FaceIntervalIndex | None = None, path_arrays: bool = False
+) -> Iterator[Layer]:
+    """Lazily creates planar contours with the NumPy backend, one layer at a time.
+
+    Only the contours of the current plane are held in memory, which keeps the peak memory
+    bounded for tall models with many layers.
+
+    Parameters
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+        A triangulated compas mesh.
+    planes: list, :class: 'compas.geometry.Plane'
+        Parallel slicing planes, i.e. planes that all share the same normal.
+    face_index: :class: 'FaceIntervalIndex' | None
+        A prebuilt index of the mesh faces along the plane normal. If None, it is built from the mesh.
+    path_arrays: bool
+        If True, the paths are array-backed :class:`PathArray` objects instead of lists of Points.
+
+    Yields
+    ------
+    Layer
+        One layer per plane that intersects the mesh, in ascending order along the normal.
+    """
+    if len(planes) == 0:
+        return
+
+    normal, heights = get_plane_heights(planes)
+    face_index = _check_face_index(mesh, face_index, normal)
+    for _, contours in face_index.iter_slices(heights):
+        if len(contours) > 0:
+            yield _contours_to_layer(contours, path_arrays)
+
+
+def get_plane_heights(planes: list[Plane]) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Returns the common unit normal of parallel planes and their offsets along it.
+
+    Raises
+    ------
+    ValueError
+        If the planes are not parallel.
+    """
+    normal = np.asarray(planes[0].normal, dtype=np.float64)
+    normal = normal / np.linalg.norm(normal)
+    for plane in planes:
+        n = np.asarray(plane.normal, dtype=np.float64)
+        if not np.allclose(n / np.linalg.norm(n), normal):
+            raise ValueError("The numpy planar slicing backend only supports parallel planes.")
+    heights = np.array([np.dot(plane.point, normal) for plane in planes], dtype=np.float64)
+    return normal, heights
+
+
+def _check_face_index(
+    mesh: Mesh, face_index: FaceIntervalIndex | None, normal: NDArray[np.float64]
+) -> FaceIntervalIndex:
+    """Builds the face index if needed, or checks that the given one matches the plane normal."""
+    if face_index is None:
+        return FaceIntervalIndex.from_mesh(mesh, normal)
+    if not np.allclose(face_index.normal, normal):
+        raise ValueError("The face index was built for a different normal than the one of the planes.")
+    return face_index
+
+
+def _contours_to_layer(contours: PlaneContours, path_arrays: bool = False) -> Layer:
+    """Converts the contour arrays of one plane to a Layer."""
+    if path_arrays:
+        return Layer([PathArray(pts, is_closed=is_closed) for pts, is_closed in contours])
+    return Layer([Path(points=[Point(*p) for p in pts.tolist()], is_closed=is_closed) for pts, is_closed in contours])
+
+
+class FaceIntervalIndex:
+    """Index of the faces of a triangle mesh, sorted by their span along a direction.
+
+    Sweeping a series of parallel planes through the index only visits the faces that are
+    active at each plane, so slicing costs O(F + number of intersections) instead of
+    O(F x number of planes). The index can be reused for any number of slicing calls
+    on the same mesh.
+
+    Attributes
+    ----------
+    V : ndarray (V, 3)
+        Vertex coordinates.
+    F : ndarray (F, 3)
+        Consistently oriented face vertex indices.
+    normal : ndarray (3,)
+        Unit direction along which the faces are indexed.
+    offsets : ndarray (V,)
+        Offset of every vertex along the normal.
+    """
+
+    def __init__(self, V: NDArray[np.float64], F: NDArray[np.intp], normal: NDArray[np.float64] | None = None) -> None:
+        if normal is None:
+            normal = np.array([0.0, 0.0, 1.0])
+        normal = np.asarray(normal, dtype=np.float64)
+        self.V = np.asarray(V, dtype=np.float64)
+        self.F = np.asarray(F, dtype=np.intp)
+        self.normal = normal / np.linalg.norm(normal)
+        self.offsets = self.V @ self.normal
+
+        face_offsets = self.offsets[self.F]
+        self.face_min = face_offsets.min(axis=1)
+        self.face_max = face_offsets.max(axis=1)
+        self._order = np.argsort(self.face_min, kind="stable")
+        self._sorted_min = self.face_min[self._order]
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh, normal: NDArray[np.float64] | None = None) -> FaceIntervalIndex:
+        """Builds the index from a triangulated compas mesh."""
+        V, F = get_oriented_vertices_and_faces(mesh)
+        return cls(V, F, normal)
+
+    def __repr__(self) -> str:
+        return f"<FaceIntervalIndex with {len(self.F)} faces>"
+
+    def sweep(self, heights: NDArray[np.float64]) -> Iterator[tuple[int, NDArray[np.intp]]]:
+        """Yields the indices of the faces that cross each height, in ascending order of height.
+
+        A face crosses a height h if its minimum offset is <= h and its maximum offset is > h.
+
+        Parameters
+        ----------
+        heights : ndarray (L,)
+            Offsets of the planes along the normal, in any order.
+
+        Yields
+        ------
+        tuple
+            The position of the height in the input array and the active face indices.
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        active = np.empty(0, dtype=np.intp)
+        start = 0
+        for i in np.argsort(heights, kind="stable"):
+            h = heights[i]
+            end = int(np.searchsorted(self._sorted_min, h, side="right"))
+            if end > start:
+                active = np.concatenate([active, self._order[start:end]])
+                start = end
+            active = active[self.face_max[active] > h]
+            yield int(i), active
+
+    def split(
+        self, heights: NDArray[np.float64], n_bands: int
+    ) -> list[tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.intp]]]:
+        """Splits the heights into contiguous bands and extracts the faces that overlap each band.
+
+        Parameters
+        ----------
+        heights : ndarray (L,)
+            Offsets of the planes along the normal, in any order.
+        n_bands : int
+            Number of bands, at most one per height.
+
+        Returns
+        -------
+        list
+            One tuple (height positions, V, F) per band, in ascending order of height. V and F describe
+            the faces of the band, with vertices renumbered in their original order.
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        order = np.argsort(heights, kind="stable")
+        bands = []
+        for positions in np.array_split(order, max(1, min(n_bands, len(order)))):
+            lo, hi = heights[positions[0]], heights[positions[-1]]
+            F = self.F[(self.face_min <= hi) & (self.face_max > lo)]
+            used, F_band = np.unique(F, return_inverse=True)
+            bands.append((positions, self.V[used], F_band.reshape(F.shape)))
+        return bands
+
+    def slice(self, heights: NDArray[np.float64], workers: int = 1) -> list[PlaneContours]:
+        """Slices the indexed mesh at the given heights.
+
+        Parameters
+        ----------
+        heights : ndarray (L,)
+            Offsets of the planes along the normal, in any order.
+        workers : int
+            Number of worker processes, see :func:`create_planar_paths_numpy`.
+
+        Returns
+        -------
+        list
+            One list per height, in the input order, holding a tuple (points, is_closed) per contour.
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        contours: list[PlaneContours] = [[] for _ in range(len(heights))]
+
+        if workers <= 1 or len(heights) <= 1:
+            for i, plane_contours in self.iter_slices(heights):
+                contours[i] = plane_contours
+            return contours
+
+        bands = self.split(heights, workers)
+        with ProcessPoolExecutor(max_workers=min(workers, len(bands))) as executor:
+            futures = [
+                executor.submit(slice_mesh_arrays, V, F, heights[positions], self.normal) for positions, V, F in bands
+            ]
+            for (positions, _, _), future in zip(bands, futures):
+                for i, band_contours in zip(positions, future.result()):
+                    contours[i] = band_contours
+        return contours
+
+    def iter_slices(self, heights: NDArray[np.float64]) -> Iterator[tuple[int, PlaneContours]]:
+        """Lazily slices the indexed mesh at the given heights, in ascending order of height.
+
+        Yields
+        ------
+        tuple
+            The position of the height in the input array and a tuple (points, is_closed) per contour.
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        for i, active in self.sweep(heights):
+            if len(active) > 0:
+                yield i, _slice_faces(self.V, self.F[active], self.offsets, float(heights[i]))
+            else:
+                yield i, []
+
+
+def get_oriented_vertices_and_faces(mesh: Mesh) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+    """Returns the vertex and face arrays of the mesh, with consistently oriented face cycles.
+
+    The segment stitching relies on every interior edge being traversed once in each direction.
+    If that is not the case, the cycles of a copy of the mesh are unified first.
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+    V = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+    F = np.asarray(faces, dtype=np.intp).reshape((-1, 3))
+
+    halfedges = np.stack([F, np.roll(F, -1, axis=1)], axis=-1).reshape((-1, 2))
+    if len(np.unique(halfedges, axis=0)) != len(halfedges):
+        logger.warning("Mesh faces are not consistently oriented, unifying cycles before slicing.")
+        mesh = mesh.copy()
+        mesh.unify_cycles()
+        vertices, faces = mesh.to_vertices_and_faces()
+        V = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+        F = np.asarray(faces, dtype=np.intp).reshape((-1, 3))
+    return V, F
+
+
+def slice_mesh_arrays(
+    V: NDArray[np.float64],
+    F: NDArray[np.intp],
+    heights: NDArray[np.float64],
+    normal: NDArray[np.float64] | None = None,
+) -> list[PlaneContours]:
+    """Slices a triangle mesh given as arrays with a series of parallel planes.
+
+    Parameters
+    ----------
+    V : ndarray (V, 3)
+        Vertex coordinates.
+    F : ndarray (F, 3)
+        Consistently oriented face vertex indices.
+    heights : ndarray (L,)
+        Offsets of the planes along the normal.
+    normal : ndarray (3,) | None
+        Common unit normal of the planes. Defaults to the z-axis.
+
+    Returns
+    -------
+    list
+        One list per plane, holding a tuple (points, is_closed) per contour, where points is an
+        (N, 3) array. The first point of closed contours is repeated at the end.
+    """
+    return FaceIntervalIndex(V, F, normal).slice(heights)
+
+
+def _slice_faces(V: NDArray[np.float64], F: NDArray[np.intp], offsets: NDArray[np.float64], h: float) -> PlaneContours:
+    """Intersects the faces F with the plane at offset h and stitches the segments."""
+    # vertices on the plane count as below, so that a plane through the base is still sliced
+    face_above = offsets[F] > h
+    n_above = np.count_nonzero(face_above, axis=1)
+    crossed = (n_above == 1) | (n_above == 2)
+    if not np.any(crossed):
+        return []
+
+    # edge i of a face goes from F[:, i] to F[:, i+1]. Every crossed face has exactly one edge that crosses upwards
+    # and one that crosses downwards. Since neighboring faces traverse their shared edge in opposite directions, the
+    # segments (down-crossing -> up-crossing) are oriented consistently and chain into directed polylines.
+    Fc = F[crossed]
+    a_above = face_above[crossed]
+    b_above = np.roll(a_above, -1, axis=1)
+    rows = np.arange(len(Fc))
+    i_down = np.argmax(a_above & ~b_above, axis=1)
+    i_up = np.argmax(~a_above & b_above, axis=1)
+    Fn = np.roll(Fc, -1, axis=1)
+    start_u, start_v = Fc[rows, i_down], Fn[rows, i_down]
+    end_u, end_v = Fc[rows, i_up], Fn[rows, i_up]
+
+    # integer edge keys, independent of the direction in which the edge is traversed
+    n_vertices = len(V)
+    start_keys = np.minimum(start_u, start_v) * n_vertices + np.maximum(start_u, start_v)
+    end_keys = np.minimum(end_u, end_v) * n_vertices + np.maximum(end_u, end_v)
+    keys, inverse = np.unique(np.concatenate([start_keys, end_keys]), return_inverse=True)
+    seg_start, seg_end = inverse[: len(Fc)], inverse[len(Fc) :]
+
+    # zero crossing on each intersected edge
+    u, v = keys // n_vertices, keys % n_vertices
+    du, dv = offsets[u] - h, offsets[v] - h
+    t = du / (du - dv)
+    points = V[u] + t[:, np.newaxis] * (V[v] - V[u])
+
+    next_node = np.full(len(keys), -1, dtype=np.intp)
+    next_node[seg_start] = seg_end
+    if len(np.unique(seg_start)) != len(seg_start):
+        logger.warning("Non-manifold intersection found while slicing, some contours may be broken.")
+
+    return [_remove_consecutive_duplicates(points[chain], is_closed) for chain, is_closed in _order_chains(next_node)]
+
+
+def _order_chains(next_node: NDArray[np.intp]) -> list[tuple[NDArray[np.intp], bool]]:
+    """Splits a successor array into ordered chains of node indices.
+
+    Parameters
+    ----------
+    next_node : ndarray (N,)
+        Index of the successor of every node, -1 for the last node of an open chain.
+
+    Returns
+    -------
+    list
+        One tuple (ordered node indices, is_closed) per chain.
+    """
+    n = len(next_node)
+    has_next = next_node >= 0
+    nodes = np.arange(n)
+
+    adjacency = scipy.sparse.coo_matrix(
+        (np.ones(np.count_nonzero(has_next)), (nodes[has_next], next_node[has_next])), shape=(n, n)
+    )
+    n_chains, labels = connected_components(adjacency, directed=False)
+
+    prev_node = np.full(n, -1, dtype=np.intp)
+    prev_node[next_node[has_next]] = nodes[has_next]
+
+    # chains that have a node without predecessor are open, all others are cycles
+    is_open = np.zeros(n_chains, dtype=bool)
+    is_open[labels[prev_node < 0]] = True
+
+    # cycles start at their smallest node index; cut them open right before that node
+    _, first_nodes = np.unique(labels, return_index=True)
+    cycle_starts = first_nodes[~is_open]
+    successors = next_node.copy()
+    successors[prev_node[cycle_starts]] = -1
+
+    # list ranking with pointer jumping: rank = number of steps to the end of the chain
+    rank = (successors >= 0).astype(np.intp)
+    for _ in range(int(np.ceil(np.log2(max(n, 2)))) + 1):
+        active = successors >= 0
+        if not np.any(active):
+            break
+        rank[active] = rank[active] + rank[successors[active]]
+        successors[active] = successors[successors[active]]
+
+    order = np.lexsort((-rank, labels))
+    split_indices = np.cumsum(np.bincount(labels, minlength=n_chains))[:-1]
+    chains = np.split(order, split_indices)
+    return [(chain, not is_open[i]) for i, chain in enumerate(chains) if len(chain) > 1]
+
+
+def _remove_consecutive_duplicates(pts: NDArray[np.float64], is_closed: bool) -> tuple[NDArray[np.float64], bool]:
+    """Removes repeated consecutive points, and repeats the first point at the end of closed chains."""
+    keep = np.ones(len(pts), dtype=bool)
+    keep[1:] = np.linalg.norm(np.diff(pts, axis=0), axis=1) > DUPLICATE_POINT_TOLERANCE
+    pts = pts[keep]
+    if is_closed and len(pts) > 1:
+        if np.linalg.norm(pts[-1] - pts[0]) <= DUPLICATE_POINT_TOLERANCE:
+            pts = pts[:-1]
+        pts = np.vstack([pts, pts[:1]])
+    return pts, is_closed
+
+
+if __name__ == "__main__":
+    pass
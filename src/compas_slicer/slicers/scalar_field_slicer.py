@@ -4,12 +4,13 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import progressbar
+from compas.geometry import Point
 from loguru import logger
 
 from compas_slicer.config import InterpolationConfig
-from compas_slicer.geometry import VerticalLayersManager
+from compas_slicer.geometry import Path, VerticalLayersManager
 from compas_slicer.slicers import BaseSlicer
-from compas_slicer.slicers.slice_utilities import ScalarFieldContours
+from compas_slicer.slicers.slice_utilities import ScalarFieldLevelContours
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -52,8 +53,6 @@ class ScalarFieldSlicer(BaseSlicer):
         self.scalar_field: list[float] = list(np.array(scalar_field) - np.min(np.array(scalar_field)))
         self.config = config if config else InterpolationConfig()
 
-        mesh.update_default_vertex_attributes({"scalar_field": 0})
-
     def generate_paths(self) -> None:
         """Generate isocontours."""
         start_domain, end_domain = min(self.scalar_field), max(self.scalar_field)
@@ -62,18 +61,18 @@ class ScalarFieldSlicer(BaseSlicer):
         max_dist = self.config.vertical_layers_max_centroid_dist
         vertical_layers_manager = VerticalLayersManager(max_dist)
 
+        # the crossings of all isocontours are found at once, without modifying the vertex attributes of the mesh
+        # the first isocontour is slightly above the minimum, things can be tricky in the edge
+        levels = [0.05 * step] + [i * step for i in range(1, self.no_of_isocurves + 1)]
+        contours = ScalarFieldLevelContours(self.mesh, self.scalar_field)
+
         # create paths + layers
         with progressbar.ProgressBar(max_value=self.no_of_isocurves) as bar:
-            for i in range(0, self.no_of_isocurves + 1):
-                for vkey, data in self.mesh.vertices(data=True):
-                    if i == 0:
-                        data["scalar_field"] = self.scalar_field[vkey] - 0.05 * step  # things can be tricky in the edge
-                    else:
-                        data["scalar_field"] = self.scalar_field[vkey] - i * step
-
-                contours = ScalarFieldContours(self.mesh)
-                contours.compute()
-                contours.add_to_vertical_layers_manager(vertical_layers_manager)
+            for i, level_contours in enumerate(contours.iter_contours(levels)):
+                for pts, is_closed in level_contours:
+                    if len(pts) > 3:  # discard curves that are too small
+                        path = Path([Point(*pt) for pt in pts.tolist()], is_closed=is_closed)
+                        vertical_layers_manager.add(path)
 
                 bar.update(i)  # advance progress bar
 
@@ -1,6 +1,8 @@
+from .contour_stitching import *  # noqa: F401 F403
 from .contours_base import *  # noqa: F401 F403
 from .graph_connectivity import *  # noqa: F401 F403
 from .scalar_field_contours import *  # noqa: F401 F403
+from .scalar_field_levels import *  # noqa: F401 F403
 from .uv_contours import *  # noqa: F401 F403
 
 __all__ = [name for name in dir() if not name.startswith("_")]
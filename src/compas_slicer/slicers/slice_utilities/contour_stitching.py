@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components, depth_first_order
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = ["stitch_contour_edges"]
+
+
+def stitch_contour_edges(
+    face_edges: NDArray, crossed_edges: NDArray | list[int], start_faces: NDArray | list[int] | None = None
+) -> tuple[list[NDArray], list[bool]]:
+    """
+    Stitches the crossings of an iso-contour on the edges of a triangle mesh into ordered polylines.
+
+    Every face that is crossed by the iso-contour has two crossed edges and contributes one segment between
+    them, so every crossing has at most two neighbors and the polylines are chained in linear time by
+    following the neighbors of each crossing. Faces with three crossed edges (when the contour passes
+    exactly through a vertex) connect all three crossings; the polylines that contain such branches are
+    ordered with a depth first traversal instead.
+
+    Parameters
+    ----------
+    face_edges: np.array, (dimensions: #F x 3), edge indices of the faces (see :attr:`MeshArrays.face_edges`).
+    crossed_edges: np.array, (dimensions: #N), indices of the edges that are crossed by the iso-contour.
+    start_faces: np.array, (dimensions: #N), optional. For every crossing, the index of the face through which
+        a closed polyline that starts at it is traversed. By default, the polyline continues to the neighbor
+        with the lowest index.
+
+    Returns
+    ----------
+    chains: list of np.array of int. For every polyline, the indices into crossed_edges of its crossings, in order.
+        Open polylines start at one of their ends. Polylines with a single crossing are skipped.
+    closed: list of bool. For every polyline, True if it is closed, False otherwise.
+    """
+    face_edges = np.asarray(face_edges, dtype=np.intp).reshape((-1, 3))
+    crossed_edges = np.asarray(crossed_edges, dtype=np.intp).reshape(-1)
+    n = len(crossed_edges)
+    if n == 0:
+        return [], []
+
+    # crossing index of every edge, -1 for the edges that are not crossed
+    n_edges = max(int(face_edges.max(initial=-1)), int(crossed_edges.max())) + 1
+    node_of_edge = np.full(n_edges, -1, dtype=np.intp)
+    node_of_edge[crossed_edges] = np.arange(n)
+    face_nodes = node_of_edge[face_edges]
+
+    # one segment per face with two crossings, three segments per face with three crossings
+    crossed_faces = np.flatnonzero(np.sum(face_nodes >= 0, axis=1) >= 2)
+    face_nodes = face_nodes[crossed_faces]
+    pairs = [face_nodes[:, [0, 1]], face_nodes[:, [1, 2]], face_nodes[:, [2, 0]]]
+    segments = np.concatenate(pairs)
+    segment_faces = np.tile(crossed_faces, 3)
+    valid = np.all(segments >= 0, axis=1)
+    segments, segment_faces = np.sort(segments[valid], axis=1), segment_faces[valid]
+
+    a = np.concatenate([segments[:, 0], segments[:, 1]])
+    b = np.concatenate([segments[:, 1], segments[:, 0]])
+    degrees = np.bincount(a, minlength=n)
+    graph = scipy.sparse.csr_matrix((np.ones(len(a), dtype=np.int8), (a, b)), shape=(n, n))
+    n_components, labels = connected_components(graph, directed=False)
+
+    # neighbors of the crossings with at most two neighbors, -1 for missing neighbors
+    order = np.argsort(a, kind="stable")
+    slots = np.arange(len(a)) - np.searchsorted(a[order], a[order])
+    simple = slots < 2
+    neighbors = np.full((n, 2), -1, dtype=np.intp)
+    neighbors[a[order][simple], slots[simple]] = b[order][simple]
+    first_neighbors = neighbors.min(axis=1, initial=n, where=neighbors >= 0)
+    if start_faces is not None:
+        # the neighbor that shares the start face, where there is one
+        start_faces = np.asarray(start_faces, dtype=np.intp).reshape(-1)
+        c = np.concatenate([segment_faces, segment_faces])
+        through_start_face = start_faces[a] == c
+        first_neighbors[a[through_start_face]] = b[through_start_face]
+
+    # components in the order of their first crossing, each starting from its first end (or first crossing)
+    first_node = np.full(n_components, n, dtype=np.intp)
+    np.minimum.at(first_node, labels, np.arange(n))
+    ends = np.flatnonzero(degrees == 1)
+    first_end = np.full(n_components, n, dtype=np.intp)
+    np.minimum.at(first_end, labels[ends], ends)
+    starts = np.where(first_end < n, first_end, first_node)
+    sizes = np.bincount(labels, minlength=n_components)
+    branched = np.zeros(n_components, dtype=bool)
+    branched[labels[degrees > 2]] = True
+
+    neighbors_list = neighbors.tolist()
+    chains: list[NDArray] = []
+    closed: list[bool] = []
+    for component in np.argsort(first_node, kind="stable").tolist():
+        if sizes[component] < 2:
+            continue
+        start = int(starts[component])
+        if branched[component]:
+            chain = depth_first_order(graph, start, directed=False, return_predecessors=False)
+            is_closed = bool(graph[chain[-1], start]) and len(chain) > 2
+        else:
+            chain, is_closed = _walk_chain(neighbors_list, start, int(first_neighbors[start]))
+        chains.append(np.asarray(chain, dtype=np.intp))
+        closed.append(is_closed)
+    return chains, closed
+
+
+def _walk_chain(neighbors: list[list[int]], start: int, following: int) -> tuple[list[int], bool]:
+    """Follows the neighbors from start, through following, until an end of the chain or until start is reached."""
+    chain = [start]
+    previous, current = -1, start
+    following = following if following < len(neighbors) else -1
+    while following >= 0 and following != start:
+        chain.append(following)
+        previous, current = current, following
+        n0, n1 = neighbors[current]
+        following = n1 if n0 == previous else n0
+    return chain, following == start and len(chain) > 2
@@ -9,10 +9,7 @@ from compas.itertools import pairwise
 
 import compas_slicer.utilities as utils
 from compas_slicer.geometry import Path, VerticalLayersManager
-from compas_slicer.slicers.slice_utilities.graph_connectivity import (
-    create_graph_from_mesh_edges,
-    sort_graph_connected_components,
-)
+from compas_slicer.slicers.slice_utilities.contour_stitching import stitch_contour_edges
 
 if TYPE_CHECKING:
     from compas.datastructures import Mesh
@@ -25,7 +22,7 @@ class ContoursBase:
     """
     This is meant to be extended by all classes that generate isocontours of a scalar function on a mesh.
     This class handles the two steps of iso-contouring of a triangular mesh consists of two steps;
-    1)find intersected edges and 2)sort intersections using a graph to generate coherent polylines.
+    1)find intersected edges and 2)stitch the intersections of neighboring edges into coherent polylines.
 
     The inheriting classes only have to implement the test that checks if an edge is intersected,
     and the method to find the zero crossing of an intersection.
@@ -56,16 +53,20 @@ class ContoursBase:
 
     def compute(self) -> None:
         self.find_intersections()
-        G = create_graph_from_mesh_edges(self.mesh, self.intersection_data, self.edge_to_index)
-        sorted_indices_dict = sort_graph_connected_components(G)
-
-        nodeDict = dict(G.nodes(data=True))
-        for key in sorted_indices_dict:
-            sorted_indices = sorted_indices_dict[key]
-            self.sorted_edge_clusters[key] = [nodeDict[node_index]["mesh_edge"] for node_index in sorted_indices]
+        mesh_arrays = utils.get_mesh_arrays(self.mesh)
+        intersected_edges = list(self.intersection_data)
+        edge_indices = [
+            mesh_arrays.edge_index[e] if e in mesh_arrays.edge_index else mesh_arrays.edge_index[(e[1], e[0])]
+            for e in intersected_edges
+        ]
+        # closed polylines continue from their first crossing into the face on the left of its edge
+        start_faces = mesh_arrays.edge_left_faces[edge_indices]
+        chains, closed = stitch_contour_edges(mesh_arrays.face_edges, edge_indices, start_faces)
+
+        for key, (chain, is_closed) in enumerate(zip(chains, closed)):
+            self.sorted_edge_clusters[key] = [intersected_edges[i] for i in chain.tolist()]
             self.sorted_point_clusters[key] = [self.intersection_data[e] for e in self.sorted_edge_clusters[key]]
-
-        self.label_closed_paths()
+            self.closed_paths_booleans[key] = is_closed
 
     def label_closed_paths(self) -> None:
         for key in self.sorted_edge_clusters:
@@ -87,9 +88,9 @@ class ContoursBase:
                     self.intersection_data[edge] = {}
                     self.intersection_data[edge] = Point(point[0], point[1], point[2])
 
-            # create [edge - point] dictionary
-            for i, e in enumerate(self.intersection_data):
-                self.edge_to_index[e] = i
+        # create [edge - point index] dictionary
+        for i, e in enumerate(self.intersection_data):
+            self.edge_to_index[e] = i
 
     def save_point_clusters_as_polylines_to_json(self, DATA_PATH: str | FilePath, name: str) -> None:
         all_points: dict[str, Any] = {}
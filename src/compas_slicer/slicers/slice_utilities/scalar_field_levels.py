@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from compas_slicer.slicers.slice_utilities.contour_stitching import stitch_contour_edges
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from compas.datastructures import Mesh
+    from numpy.typing import NDArray
+
+__all__ = ["ScalarFieldLevelContours", "InterpolationLevelContours", "find_levels_in_intervals"]
+
+
+class ScalarFieldLevelContours:
+    """
+    Finds the iso-contours of a scalar field on a mesh at many levels at once.
+
+    The edges of the mesh are bucketed by the interval [min, max] of the scalar field on their two vertices,
+    so the crossings of all levels are found in one vectorized pass, and the scalar field is never written to
+    the vertex attributes of the mesh. The crossings of each level are then stitched into polylines with
+    :func:`stitch_contour_edges`, in the same way as :class:`ScalarFieldContours`.
+
+    Attributes
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+    scalar_field: np.array, (dimensions: #V), one value per vertex, in the order of ``mesh.vertices()``.
+    """
+
+    def __init__(self, mesh: Mesh, scalar_field: Sequence[float] | NDArray) -> None:
+        self.mesh = mesh
+        self.mesh_arrays = get_mesh_arrays(mesh)
+        self.scalar_field = np.asarray(scalar_field, dtype=np.float64).reshape(-1)
+        if len(self.scalar_field) != len(self.mesh_arrays.V):
+            raise ValueError(
+                f"The scalar field has {len(self.scalar_field)} values, but the mesh has {len(self.mesh_arrays.V)} vertices."
+            )
+
+        edge_values = self.scalar_field[self.mesh_arrays.edges]
+        self.edge_min = edge_values.min(axis=1)
+        self.edge_max = edge_values.max(axis=1)
+
+    def find_crossings(self, levels: Sequence[float] | NDArray) -> list[tuple[NDArray, NDArray]]:
+        """
+        Finds the crossings of the iso-contours at all levels on the edges of the mesh.
+
+        Parameters
+        ----------
+        levels: list of float, the values of the iso-contours, in any order.
+
+        Returns
+        ----------
+        list of tuple (np.array, np.array), one per level: the indices of the crossed edges (in ascending
+            order) and the (N, 3) crossing points.
+        """
+        levels = np.asarray(levels, dtype=np.float64).reshape(-1)
+        if len(levels) == 0:
+            return []
+        mesh_arrays = self.mesh_arrays
+
+        # the edges whose interval [min, max] contains each level
+        edge_indices, level_indices = find_levels_in_intervals(self.edge_min, self.edge_max, levels)
+
+        # zero crossings of the field of each level: pt = v1 + t * (v2 - v1) where t = |d1| / (|d1| + |d2|)
+        u, v = mesh_arrays.edges[edge_indices, 0], mesh_arrays.edges[edge_indices, 1]
+        d1 = self.level_values(u, levels[level_indices])
+        d2 = self.level_values(v, levels[level_indices])
+        denom = np.abs(d1) + np.abs(d2)
+        valid = (d1 * d2 <= 0) & (denom > 0)
+        edge_indices, level_indices, u, v = edge_indices[valid], level_indices[valid], u[valid], v[valid]
+        t = np.abs(d1[valid]) / denom[valid]
+        v1 = mesh_arrays.V[u]
+        points = v1 + t[:, np.newaxis] * (mesh_arrays.V[v] - v1)
+
+        # group by level, keeping the edges in ascending order within each level
+        order = np.lexsort((edge_indices, level_indices))
+        splits = np.cumsum(np.bincount(level_indices, minlength=len(levels)))[:-1]
+        return list(zip(np.split(edge_indices[order], splits), np.split(points[order], splits)))
+
+    def level_values(self, vertices: NDArray, levels: NDArray) -> NDArray:
+        """Returns the values of the fields whose zero sets are the iso-contours at levels, on the vertices."""
+        values: NDArray = self.scalar_field[vertices] - levels
+        return values
+
+    def iter_contours(self, levels: Sequence[float] | NDArray) -> Iterator[list[tuple[NDArray, bool]]]:
+        """
+        Yields the iso-contours of every level, in the order of the levels.
+
+        Parameters
+        ----------
+        levels: list of float, the values of the iso-contours.
+
+        Yields
+        ----------
+        list of tuple (np.array, bool), the (N, 3) ordered points of every polyline of the level, and True
+            if the polyline is closed, False otherwise.
+        """
+        face_edges = self.mesh_arrays.face_edges
+        edge_left_faces = self.mesh_arrays.edge_left_faces
+        for edge_indices, points in self.find_crossings(levels):
+            # closed polylines continue from their first crossing into the face on the left of its edge
+            chains, closed = stitch_contour_edges(face_edges, edge_indices, edge_left_faces[edge_indices])
+            yield [(points[chain], is_closed) for chain, is_closed in zip(chains, closed)]
+
+
+class InterpolationLevelContours(ScalarFieldLevelContours):
+    """
+    Finds the iso-contours of the interpolation between two distance fields at many weights at once.
+
+    The contour at weight w is the zero set of the field d_low * (1 - w) - d_high * w. The field is linear in w,
+    so it crosses zero on every vertex at the weight d_low / (d_low + d_high), and every edge is crossed by the
+    contours of the weights between the crossing weights of its two vertices. These crossing weights are
+    computed once, and the crossings of all weights are found in one vectorized pass. The crossing points are
+    computed from the interpolated field itself, so they are the same as those of :class:`ScalarFieldContours`.
+
+    Attributes
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+    d_low: np.array, (dimensions: #V), the distances from the lower target.
+    d_high: np.array, (dimensions: #V), the distances from the upper target.
+    scalar_field: np.array, (dimensions: #V), the crossing weight of every vertex.
+    """
+
+    def __init__(self, mesh: Mesh, d_low: Sequence[float] | NDArray, d_high: Sequence[float] | NDArray) -> None:
+        self.d_low = np.asarray(d_low, dtype=np.float64).reshape(-1)
+        self.d_high = np.asarray(d_high, dtype=np.float64).reshape(-1)
+        sums = self.d_low + self.d_high
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_weights = self.d_low / sums
+        ScalarFieldLevelContours.__init__(self, mesh, crossing_weights)
+
+        # the crossing weights are rounded, so the intervals are widened, and the crossings are then tested exactly
+        tolerance = 1e-9 * np.maximum(1.0, np.maximum(np.abs(self.edge_min), np.abs(self.edge_max)))
+        self.edge_min = self.edge_min - tolerance
+        self.edge_max = self.edge_max + tolerance
+
+        # if the field of a vertex does not decrease with w, its edges can be crossed outside of the interval
+        edge_sums = sums[self.mesh_arrays.edges]
+        unbounded = ~np.all(edge_sums > 0, axis=1)
+        self.edge_min[unbounded] = -np.inf
+        self.edge_max[unbounded] = np.inf
+
+    def level_values(self, vertices: NDArray, levels: NDArray) -> NDArray:
+        """Returns the interpolated distances of the vertices, at the weights levels."""
+        values: NDArray = self.d_low[vertices] * (1 - levels) - self.d_high[vertices] * levels
+        return values
+
+
+def find_levels_in_intervals(
+    interval_min: NDArray, interval_max: NDArray, levels: Sequence[float] | NDArray
+) -> tuple[NDArray, NDArray]:
+    """
+    Finds all pairs of intervals and levels such that the level lies within the interval.
+
+    Every interval contains the contiguous run of sorted levels between its bounds, so the pairs are found
+    with two binary searches per interval, in time proportional to the number of intervals and pairs.
+
+    Parameters
+    ----------
+    interval_min: np.array, (dimensions: #N), the lower bounds of the intervals.
+    interval_max: np.array, (dimensions: #N), the upper bounds of the intervals.
+    levels: list of float, in any order.
+
+    Returns
+    ----------
+    interval_indices: np.array of int, the index of the interval of every pair, in ascending order.
+    level_indices: np.array of int, the index of the level of every pair.
+    """
+    levels = np.asarray(levels, dtype=np.float64).reshape(-1)
+    level_order = np.argsort(levels, kind="stable")
+    sorted_levels = levels[level_order]
+    first = np.searchsorted(sorted_levels, interval_min, side="left")
+    counts = np.maximum(np.searchsorted(sorted_levels, interval_max, side="right") - first, 0)
+    interval_indices = np.repeat(np.arange(len(counts)), counts)
+    run_starts = np.cumsum(counts) - counts
+    level_indices = level_order[
+        first[interval_indices] + np.arange(len(interval_indices)) - run_starts[interval_indices]
+    ]
+    return interval_indices, level_indices
+
+
+if __name__ == "__main__":
+    pass
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 from compas.geometry import (
+    Point,
     add_vectors,
     distance_point_point_xy,
     intersection_line_line_xy,
     is_point_on_segment_xy,
     scale_vector,
 )
+from compas.tolerance import TOL
 
 from compas_slicer.slicers.slice_utilities import ContoursBase
+from compas_slicer.slicers.slice_utilities.contour_stitching import stitch_contour_edges
+from compas_slicer.slicers.slice_utilities.scalar_field_levels import find_levels_in_intervals
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from compas.datastructures import Mesh
+    from numpy.typing import NDArray
 
-__all__ = ["UVContours"]
+__all__ = ["UVContours", "UVLineContours"]
 
 
 class UVContours(ContoursBase):
@@ -24,6 +33,20 @@ class UVContours(ContoursBase):
         self.p1 = p1  # tuple (u,v); first point in uv domain defining the cutting line
         self.p2 = p2  # tuple (u,v); second point in uv domain defining the cutting line
 
+    def find_intersections(self) -> None:
+        """
+        Fills in the
+        dict self.intersection_data: key=(ui,vi) : [xi,yi,zi],
+        dict self.edge_to_index: key=(u1,v1) : point_index.
+        The intersections with all edges are found at once with :class:`UVLineContours`."""
+        line_contours = UVLineContours(self.mesh)
+        [(edge_indices, points)] = line_contours.find_crossings([(self.p1, self.p2)])
+        edges = line_contours.mesh_arrays.edge_keys[edge_indices].tolist()
+        for (u, v), point in zip(edges, points.tolist()):
+            self.intersection_data[(u, v)] = Point(*point)
+        for i, e in enumerate(self.intersection_data):
+            self.edge_to_index[e] = i
+
     def uv(self, vkey: int) -> tuple[float, float]:
         uv: tuple[float, float] = self.mesh.vertex[vkey]["uv"]
         return uv
@@ -42,8 +65,151 @@ class UVContours(ContoursBase):
         p = intersection_line_line_xy((self.p1, self.p2), (self.uv(v1), self.uv(v2)))
         d1, d2 = distance_point_point_xy(self.uv(v1), p), distance_point_point_xy(self.uv(v2), p)
         if d1 + d2 > 0:
-            vec = self.mesh.edge_vector(v1, v2)
+            vec = self.mesh.edge_vector((v1, v2))
             vec = scale_vector(vec, d1 / (d1 + d2))
             pt: list[float] = add_vectors(self.mesh.vertex_coordinates(v1), vec)
             return pt
         return None
+
+
+class UVLineContours:
+    """
+    Finds the contours of a mesh along many straight lines of the uv domain at once.
+
+    The lines with the same direction r are level sets of the same linear function cross(r, uv), so the edges
+    that may be crossed by each line are found by bucketing the edges by the interval of that function on their
+    two vertices, as :class:`ScalarFieldLevelContours` does with a scalar field. The candidate crossings are then
+    tested and computed on all edges at once, with the same formulas and tolerances as
+    :meth:`UVContours.edge_is_intersected` and :meth:`UVContours.find_zero_crossing_data`.
+
+    Attributes
+    ----------
+    mesh: :class: 'compas.datastructures.Mesh'
+    uv: np.array, (dimensions: #V x 2), the uv coordinates of the vertices, in the order of ``mesh.vertices()``.
+        By default, the 'uv' vertex attributes of the mesh.
+    """
+
+    def __init__(self, mesh: Mesh, uv: Sequence[tuple[float, float]] | NDArray | None = None) -> None:
+        self.mesh = mesh
+        self.mesh_arrays = get_mesh_arrays(mesh)
+        if uv is None:
+            uv = [mesh.vertex[vkey]["uv"] for vkey in self.mesh_arrays.vertex_keys]
+        self.uv = np.asarray(uv, dtype=np.float64).reshape((-1, 2))
+        if len(self.uv) != len(self.mesh_arrays.V):
+            raise ValueError(
+                f"There are {len(self.uv)} uv coordinates, but the mesh has {len(self.mesh_arrays.V)} vertices."
+            )
+        self.edge_uv = self.uv[self.mesh_arrays.edges]
+
+    def find_crossings(
+        self, lines: Sequence[tuple[tuple[float, float], tuple[float, float]]] | NDArray
+    ) -> list[tuple[NDArray, NDArray]]:
+        """
+        Finds the crossings of all lines on the edges of the mesh.
+
+        Parameters
+        ----------
+        lines: list of tuple (p1, p2), the two (u, v) points that define each line segment.
+
+        Returns
+        ----------
+        list of tuple (np.array, np.array), one per line: the indices of the crossed edges (in ascending
+            order) and the (N, 3) crossing points.
+        """
+        lines = np.asarray(lines, dtype=np.float64).reshape((-1, 2, 2))
+        if len(lines) == 0:
+            return []
+        mesh_arrays = self.mesh_arrays
+        p1, p2 = lines[:, 0], lines[:, 1]
+
+        # candidate crossings of the lines of each direction, within the tolerance of the point on segment test
+        directions, groups = np.unique(p2 - p1, axis=0, return_inverse=True)
+        groups = groups.reshape(-1)
+        edge_lengths = _length_xy(self.edge_uv[:, 1] - self.edge_uv[:, 0])
+        edge_chunks: list[NDArray] = []
+        line_chunks: list[NDArray] = []
+        for group, (dx, dy) in enumerate(directions.tolist()):
+            group_lines = np.flatnonzero(groups == group)
+            edge_values = dx * self.edge_uv[:, :, 1] - dy * self.edge_uv[:, :, 0]
+            levels = dx * p1[group_lines, 1] - dy * p1[group_lines, 0]
+            tolerance = np.hypot(dx, dy) * (TOL.relative * edge_lengths + TOL.absolute)
+            tolerance = 2 * tolerance + TOL.absolute * np.abs(edge_values).max(axis=1)
+            edges, group_line_indices = find_levels_in_intervals(
+                edge_values.min(axis=1) - tolerance, edge_values.max(axis=1) + tolerance, levels
+            )
+            edge_chunks.append(edges)
+            line_chunks.append(group_lines[group_line_indices])
+        edge_indices, line_indices = np.concatenate(edge_chunks), np.concatenate(line_chunks)
+
+        # crossings of the line segments with the edges in the uv domain
+        a, b = self.edge_uv[edge_indices, 0], self.edge_uv[edge_indices, 1]
+        q1, q2 = p1[line_indices], p2[line_indices]
+        p, valid = _intersection_line_line_xy(q1, q2, a, b)
+        valid &= _is_point_on_segment_xy(p, a, b) & _is_point_on_segment_xy(p, q1, q2)
+        d1, d2 = _length_xy(p - a), _length_xy(p - b)
+        valid &= d1 + d2 > 0
+        edge_indices, line_indices = edge_indices[valid], line_indices[valid]
+        t = d1[valid] / (d1[valid] + d2[valid])
+
+        # crossing points on the mesh: pt = v1 + (v2 - v1) * t, where t = d1 / (d1 + d2)
+        v1 = mesh_arrays.V[mesh_arrays.edges[edge_indices, 0]]
+        v2 = mesh_arrays.V[mesh_arrays.edges[edge_indices, 1]]
+        points = v1 + (v2 - v1) * t[:, np.newaxis]
+
+        # group by line, keeping the edges in ascending order within each line
+        order = np.lexsort((edge_indices, line_indices))
+        splits = np.cumsum(np.bincount(line_indices, minlength=len(lines)))[:-1]
+        return list(zip(np.split(edge_indices[order], splits), np.split(points[order], splits)))
+
+    def iter_contours(
+        self, lines: Sequence[tuple[tuple[float, float], tuple[float, float]]] | NDArray
+    ) -> Iterator[list[tuple[NDArray, bool]]]:
+        """
+        Yields the contours along every line, in the order of the lines.
+
+        Parameters
+        ----------
+        lines: list of tuple (p1, p2), the two (u, v) points that define each line segment.
+
+        Yields
+        ----------
+        list of tuple (np.array, bool), the (N, 3) ordered points of every polyline along the line, and True
+            if the polyline is closed, False otherwise.
+        """
+        face_edges = self.mesh_arrays.face_edges
+        edge_left_faces = self.mesh_arrays.edge_left_faces
+        for edge_indices, points in self.find_crossings(lines):
+            # closed polylines continue from their first crossing into the face on the left of its edge
+            chains, closed = stitch_contour_edges(face_edges, edge_indices, edge_left_faces[edge_indices])
+            yield [(points[chain], is_closed) for chain, is_closed in zip(chains, closed)]
+
+
+def _length_xy(vectors: NDArray) -> NDArray:
+    """Lengths of (N, 2) vectors, computed as ``length_vector_xy``."""
+    lengths: NDArray = np.sqrt(vectors[:, 0] ** 2 + vectors[:, 1] ** 2)
+    return lengths
+
+
+def _intersection_line_line_xy(a: NDArray, b: NDArray, c: NDArray, d: NDArray) -> tuple[NDArray, NDArray]:
+    """Vectorized ``intersection_line_line_xy`` of the lines (a, b) and (c, d): the points, and False if parallel."""
+    x1, y1, x2, y2 = a[:, 0], a[:, 1], b[:, 0], b[:, 1]
+    x3, y3, x4, y4 = c[:, 0], c[:, 1], d[:, 0], d[:, 1]
+    denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+    valid = np.abs(denom) > TOL.absolute
+    denom = np.where(valid, denom, 1.0)
+    e = x1 * y2 - y1 * x2
+    f = x3 * y4 - y3 * x4
+    x = (e * (x3 - x4) - (x1 - x2) * f) / denom
+    y = (e * (y3 - y4) - (y1 - y2) * f) / denom
+    return np.column_stack([x, y]), valid
+
+
+def _is_point_on_segment_xy(p: NDArray, a: NDArray, b: NDArray) -> NDArray:
+    """Vectorized ``is_point_on_segment_xy`` of the points p and the segments (a, b), with the default tolerances."""
+    d_ab = _length_xy(b - a)
+    pa, pb = a - p, b - p
+    with np.errstate(divide="ignore", invalid="ignore"):
+        on_line = np.abs(pa[:, 0] * pb[:, 1] - pa[:, 1] * pb[:, 0]) / d_ab <= TOL.absolute
+    d_pa, d_pb = _length_xy(p - a), _length_xy(p - b)
+    on_segment: NDArray = on_line & (d_ab > 0) & (np.abs(d_pa + d_pb - d_ab) <= TOL.relative * d_ab + TOL.absolute)
+    return on_segment
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import numpy as np
 import progressbar
+from compas.geometry import Point
 from loguru import logger
 
 from compas_slicer.config import InterpolationConfig
-from compas_slicer.geometry import VerticalLayersManager
+from compas_slicer.geometry import Path, VerticalLayersManager
 from compas_slicer.slicers import BaseSlicer
-from compas_slicer.slicers.slice_utilities import UVContours
+from compas_slicer.slicers.slice_utilities import UVLineContours
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from compas.datastructures import Mesh
+    from numpy.typing import NDArray
 
 
 __all__ = ["UVSlicer"]
@@ -35,6 +40,10 @@ class UVSlicer(BaseSlicer):
         Number of levels to generate.
     config : InterpolationConfig
         Configuration parameters.
+    workers : int
+        Number of worker processes that compute the contours of contiguous bands of isocurves in parallel.
+        The contours are added to the vertical layers in the order of the isocurves, so the result is identical
+        to serial slicing. 1 computes the contours serially.
 
     """
 
@@ -44,18 +53,23 @@ class UVSlicer(BaseSlicer):
         vkey_to_uv: dict[int, tuple[float, float]],
         no_of_isocurves: int,
         config: InterpolationConfig | None = None,
+        workers: int = 1,
     ) -> None:
         logger.info("UVSlicer")
         BaseSlicer.__init__(self, mesh)
 
+        if workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, got {workers}.")
+
         self.vkey_to_uv = vkey_to_uv
         self.no_of_isocurves = no_of_isocurves
         self.config = config if config else InterpolationConfig()
+        self.workers = workers
 
         u = [self.vkey_to_uv[vkey][0] for vkey in mesh.vertices()]
         v = [self.vkey_to_uv[vkey][1] for vkey in mesh.vertices()]
         u_arr = np.array(u) * float(no_of_isocurves + 1)
-        vkey_to_i = self.mesh.key_index()
+        vkey_to_i = self.mesh.vertex_index()
 
         mesh.update_default_vertex_attributes({"uv": 0})
         for vkey in mesh.vertices():
@@ -69,28 +83,73 @@ class UVSlicer(BaseSlicer):
         max_dist = self.config.vertical_layers_max_centroid_dist
         vertical_layers_manager = VerticalLayersManager(max_dist)
 
+        lines: list[tuple[tuple[float, float], tuple[float, float]]] = []
+        for i in range(0, self.no_of_isocurves + 1):
+            u_val = float(i)
+            if i == 0:
+                u_val += 0.05  # contours are a bit tricky in the edges
+            if paths_type == "spiral":
+                u1, u2 = u_val, u_val + 1.0
+            else:  # 'flat'
+                u1 = u2 = u_val
+            lines.append(((u1, v_left), (u2, v_right)))
+
         # create paths + layers
         with progressbar.ProgressBar(max_value=self.no_of_isocurves) as bar:
-            for i in range(0, self.no_of_isocurves + 1):
-                u_val = float(i)
-                if i == 0:
-                    u_val += 0.05  # contours are a bit tricky in the edges
-                if paths_type == "spiral":
-                    u1, u2 = u_val, u_val + 1.0
-                else:  # 'flat'
-                    u1 = u2 = u_val
-
-                p1 = (u1, v_left)
-                p2 = (u2, v_right)
-
-                contours = UVContours(self.mesh, p1, p2)
-                contours.compute()
-                contours.add_to_vertical_layers_manager(vertical_layers_manager)
+            for i, line_contours in enumerate(self.iter_contours(lines)):
+                for pts, is_closed in line_contours:
+                    if len(pts) > 3:  # discard curves that are too small
+                        path = Path([Point(*pt) for pt in pts.tolist()], is_closed=is_closed)
+                        vertical_layers_manager.add(path)
 
                 bar.update(i)  # advance progress bar
 
         self.layers = vertical_layers_manager.layers
 
+    def iter_contours(
+        self, lines: list[tuple[tuple[float, float], tuple[float, float]]]
+    ) -> Iterator[list[tuple[NDArray, bool]]]:
+        """Yields the contours of the mesh along every line of the UV domain, in the order of the lines.
+
+        The crossings of all lines are found at once with :class:`UVLineContours`. With more than one worker,
+        the lines are split into contiguous bands that are contoured in worker processes, each receiving a copy
+        of the mesh with its uv attributes.
+
+        Parameters
+        ----------
+        lines : list[tuple[tuple[float, float], tuple[float, float]]]
+            The two (u, v) points that define each cutting line.
+
+        Yields
+        ------
+        list[tuple[NDArray, bool]]
+            The (N, 3) ordered points of every contour along the line, and True if the contour is closed.
+
+        """
+        if self.workers <= 1 or len(lines) <= 1:
+            yield from _iter_uv_contours(self.mesh, lines)
+            return
+
+        bands = [band.tolist() for band in np.array_split(np.arange(len(lines)), min(self.workers, len(lines)))]
+        with ProcessPoolExecutor(max_workers=len(bands)) as executor:
+            futures = [executor.submit(_uv_contours, self.mesh, [lines[i] for i in band]) for band in bands]
+            for future in futures:
+                yield from future.result()
+
+
+def _iter_uv_contours(
+    mesh: Mesh, lines: list[tuple[tuple[float, float], tuple[float, float]]]
+) -> Iterator[list[tuple[NDArray, bool]]]:
+    """Yields the contours of the mesh along every line of the UV domain."""
+    yield from UVLineContours(mesh).iter_contours(lines)
+
+
+def _uv_contours(
+    mesh: Mesh, lines: list[tuple[tuple[float, float], tuple[float, float]]]
+) -> list[list[tuple[NDArray, bool]]]:
+    """Worker process entry point: the contours of a band of lines of the UV domain."""
+    return list(_iter_uv_contours(mesh, lines))
+
 
 if __name__ == "__main__":
     pass
@@ -1,6 +1,10 @@
 """Helper utilities for I/O, geometry operations, and more."""
 
 from .attributes_transfer import *  # noqa: F401 E402 F403
+from .checkpoints import *  # noqa: F401 E402 F403
+from .mesh_arrays import *  # noqa: F401 E402 F403
+from .mesh_bvh import *  # noqa: F401 E402 F403
+from .scalar_field import *  # noqa: F401 E402 F403
 from .terminal_command import *  # noqa: F401 F403
 from .utils import *  # noqa: F401 E402 F403
 
@@ -6,7 +6,7 @@ import progressbar
 from compas.geometry import barycentric_coordinates
 from loguru import logger
 
-from compas_slicer.utilities.utils import pull_pts_to_mesh_faces
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
 
 if TYPE_CHECKING:
     from compas.datastructures import Mesh
@@ -49,14 +49,20 @@ def transfer_mesh_attributes_to_printpoints(
 
     all_pts = [ppt.pt for ppt in printpoints.iter_printpoints()]
 
-    closest_fks, projected_pts = pull_pts_to_mesh_faces(mesh, all_pts)
+    # closest triangle of the mesh and barycentric coordinates of the projected point on it
+    mesh_arrays = get_mesh_arrays(mesh)
+    bvh = mesh_arrays.get_bvh()
+    closest_tris, _, bar_coords, _ = bvh.closest_triangles(all_pts)
+    fkeys = mesh_arrays.face_keys
+    vkeys = mesh_arrays.vertex_keys
+    closest_fks = [fkeys[fi] for fi in bvh.triangle_faces[closest_tris].tolist()]
+    closest_vks = [[vkeys[vi] for vi in tri] for tri in bvh.triangles[closest_tris].tolist()]
+    bar_coords = bar_coords.tolist()
 
     i = 0
     with progressbar.ProgressBar(max_value=len(all_pts)) as bar:
         for pp in printpoints.iter_printpoints():
-            fkey = closest_fks[i]
-            proj_pt = projected_pts[i]
-            pp.attributes = transfer_mesh_attributes_to_point(mesh, fkey, proj_pt)
+            pp.attributes = _transfer_mesh_attributes(mesh, closest_fks[i], closest_vks[i], bar_coords[i])
             i += 1
             bar.update(i)
 
@@ -89,7 +95,11 @@ def transfer_mesh_attributes_to_point(mesh: Mesh, fkey: int, proj_pt: list[float
         proj_pt,
         triangle=(mesh.vertex_coordinates(vs[0]), mesh.vertex_coordinates(vs[1]), mesh.vertex_coordinates(vs[2])),
     )
+    return _transfer_mesh_attributes(mesh, fkey, vs[:3], bar_coords)
 
+
+def _transfer_mesh_attributes(mesh: Mesh, fkey: int, vs: list[int], bar_coords: list[float]) -> dict[str, Any]:
+    """Collects the face attributes of fkey and the vertex attributes of vs, weighted by bar_coords."""
     # get face attributes
     face_attrs = mesh.face_attributes(fkey)
     keys_to_remove = [attr for attr in face_attrs if is_reserved_attribute(attr)]
@@ -97,7 +107,6 @@ def transfer_mesh_attributes_to_point(mesh: Mesh, fkey: int, proj_pt: list[float
         del face_attrs[key]  # remove from face_attrs dictionary
 
     # get vertex attributes using barycentric coordinates
-    vs = mesh.face_vertices(fkey)
     vertex_attrs: dict[str, Any] = {}
     checked_attrs: list[str] = []
     for attr in mesh.vertex_attributes(vs[0]):
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from compas.datastructures import Mesh
+from loguru import logger
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+__all__ = ["CheckpointStore", "checkpoint_key", "meshes_to_arrays", "meshes_from_arrays"]
+
+# Part of every key, increase it when the stored format changes so that old checkpoints are not read
+CHECKPOINT_FORMAT_VERSION = 2
+
+
+def checkpoint_key(*parts: Any) -> str:
+    """
+    Returns a hash of the inputs of a stage.
+
+    Arrays are hashed by their dtype, shape and bytes, dicts by their sorted items, and lists and tuples item by item,
+    so the key changes whenever any value changes.
+
+    Parameters
+    ----------
+    parts
+        Arrays, numbers, strings, enums, None, and dicts, lists and tuples of these.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CHECKPOINT_FORMAT_VERSION}".encode())
+    for part in parts:
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+
+def _update_digest(digest: Any, part: Any) -> None:
+    if isinstance(part, np.ndarray):
+        array = np.ascontiguousarray(part)
+        digest.update(f"a{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    elif isinstance(part, dict):
+        digest.update(f"d{len(part)}".encode())
+        for k in sorted(part, key=str):
+            _update_digest(digest, str(k))
+            _update_digest(digest, part[k])
+    elif isinstance(part, (list, tuple)):
+        digest.update(f"l{len(part)}".encode())
+        for item in part:
+            _update_digest(digest, item)
+    elif isinstance(part, Enum):
+        _update_digest(digest, part.value)
+    elif part is None or isinstance(part, (bool, int, float, str, np.generic)):
+        digest.update(f"{type(part).__name__}:{part!r};".encode())
+    else:
+        raise TypeError(f"Cannot hash a checkpoint input of type {type(part).__name__}")
+
+
+def meshes_to_arrays(meshes: list[Mesh]) -> dict[str, NDArray]:
+    """
+    Converts triangle meshes to flat arrays: the vertex keys, coordinates and faces of every mesh,
+    and its numeric vertex attributes with their defaults.
+
+    Vertex attributes that are not a number on every vertex are not stored.
+
+    Parameters
+    ----------
+    meshes : list[Mesh]
+
+    Returns
+    -------
+    dict[str, NDArray]
+        Arrays named ``mesh{i}_{...}``, and ``n_meshes``.
+    """
+    arrays: dict[str, NDArray] = {"n_meshes": np.array(len(meshes))}
+    for i, mesh in enumerate(meshes):
+        vkeys = list(mesh.vertices())
+        vertex_index = {vkey: index for index, vkey in enumerate(vkeys)}
+        arrays[f"mesh{i}_vertex_keys"] = np.array(vkeys, dtype=np.int64)
+        arrays[f"mesh{i}_V"] = np.array(mesh.vertices_attributes("xyz"), dtype=np.float64).reshape((-1, 3))
+        faces = [[vertex_index[vkey] for vkey in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+        arrays[f"mesh{i}_F"] = np.array(faces, dtype=np.int64).reshape((-1, 3))
+
+        names = set(mesh.default_vertex_attributes)
+        for _vkey, data in mesh.vertices(data=True):
+            names.update(data)
+        names.difference_update("xyz")
+
+        attr_names, attr_defaults = [], []
+        for name in sorted(names):
+            values = np.array(mesh.vertices_attribute(name), dtype=object)
+            default = mesh.default_vertex_attributes.get(name)
+            if not all(isinstance(value, (bool, int, float, np.number)) for value in [default, *values.tolist()]):
+                continue
+            arrays[f"mesh{i}_attr_{name}"] = np.array(values.tolist())
+            attr_names.append(name)
+            attr_defaults.append(float(default))
+        arrays[f"mesh{i}_attr_names"] = np.array(attr_names, dtype=str)
+        arrays[f"mesh{i}_attr_defaults"] = np.array(attr_defaults, dtype=np.float64)
+    return arrays
+
+
+def meshes_from_arrays(arrays: dict[str, NDArray]) -> list[Mesh]:
+    """
+    Creates the meshes stored with meshes_to_arrays, with the same vertex keys and numeric vertex attributes.
+
+    Parameters
+    ----------
+    arrays : dict[str, NDArray]
+
+    Returns
+    -------
+    list[Mesh]
+    """
+    meshes = []
+    for i in range(int(arrays["n_meshes"])):
+        vkeys = arrays[f"mesh{i}_vertex_keys"].tolist()
+        attr_names = arrays[f"mesh{i}_attr_names"].tolist()
+        attr_values = [arrays[f"mesh{i}_attr_{name}"].tolist() for name in attr_names]
+
+        mesh = Mesh()
+        mesh.update_default_vertex_attributes(
+            {
+                name: type(values[0])(default) if values else default
+                for name, default, values in zip(attr_names, arrays[f"mesh{i}_attr_defaults"].tolist(), attr_values)
+            }
+        )
+        for index, (vkey, (x, y, z)) in enumerate(zip(vkeys, arrays[f"mesh{i}_V"].tolist())):
+            attr_dict = {name: values[index] for name, values in zip(attr_names, attr_values)}
+            mesh.add_vertex(key=vkey, x=x, y=y, z=z, attr_dict=attr_dict)
+        for face in arrays[f"mesh{i}_F"].tolist():
+            mesh.add_face([vkeys[index] for index in face])
+        meshes.append(mesh)
+    return meshes
+
+
+class CheckpointStore:
+    """
+    Stores the results of the stages of a pipeline in a folder, keyed by a hash of the inputs of every stage.
+
+    Every result is a compressed ``.npz`` file of arrays named ``{stage}_{key}.npz``. A stage whose inputs are
+    unchanged finds its result with :meth:`load` and is skipped. Only the latest result of each stage is kept.
+
+    Attributes
+    ----------
+    path : Path
+        The folder of the checkpoints.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<CheckpointStore at {self.path}>"
+
+    def file_path(self, stage: str, key: str) -> Path:
+        """Returns the file of the result of a stage."""
+        return self.path / f"{stage}_{key}.npz"
+
+    def contains(self, stage: str, key: str) -> bool:
+        """Returns True if the result of a stage with the given key is stored."""
+        return self.file_path(stage, key).exists()
+
+    def load(self, stage: str, key: str) -> dict[str, NDArray] | None:
+        """
+        Returns the arrays stored for a stage with the given key, or None if there are none.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage.
+        key : str
+            The hash of the inputs of the stage, see checkpoint_key.
+
+        Returns
+        -------
+        dict[str, NDArray] | None
+        """
+        file_path = self.file_path(stage, key)
+        if not file_path.exists():
+            return None
+        try:
+            with np.load(file_path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {file_path}: {e}")
+            return None
+        logger.info(f"Loaded checkpoint of stage '{stage}': {file_path.name}")
+        return arrays
+
+    def save(self, stage: str, key: str, arrays: dict[str, NDArray]) -> Path:
+        """
+        Stores the arrays of a stage with the given key, replacing the previous results of the stage.
+
+        The file is written to a temporary file first and then renamed, so an interrupted run never leaves a
+        truncated checkpoint.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage.
+        key : str
+            The hash of the inputs of the stage, see checkpoint_key.
+        arrays : dict[str, NDArray]
+
+        Returns
+        -------
+        Path
+            The checkpoint file.
+        """
+        file_path = self.file_path(stage, key)
+        temp_path = file_path.with_name(f".{file_path.stem}.tmp.npz")
+        # typed as Any: mypy checks every unpacked array against the allow_pickle keyword of savez_compressed
+        named_arrays: dict[str, Any] = dict(arrays)
+        np.savez_compressed(temp_path, allow_pickle=False, **named_arrays)
+        os.replace(temp_path, file_path)
+        for old_path in self.path.glob(f"{stage}_*.npz"):
+            if old_path != file_path and old_path.stem.rsplit("_", 1)[0] == stage:
+                old_path.unlink()
+        logger.info(f"Saved checkpoint of stage '{stage}': {file_path.name}")
+        return file_path
+
+    def clear(self) -> None:
+        """Removes all stored checkpoints."""
+        for file_path in self.path.glob("*.npz"):
+            file_path.unlink()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import weakref
+from functools import cached_property
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from compas_slicer.utilities.mesh_bvh import MeshBVH
+
+if TYPE_CHECKING:
+    from compas.datastructures import Mesh
+    from numpy.typing import NDArray
+
+
+__all__ = ["MeshArrays", "get_mesh_arrays", "get_mesh_bvh", "invalidate_mesh_arrays"]
+
+_XYZ = itemgetter("x", "y", "z")
+
+# cached MeshArrays per mesh
+_MESH_ARRAYS_CACHE: weakref.WeakKeyDictionary[Mesh, MeshArrays] = weakref.WeakKeyDictionary()
+
+
+class MeshArrays:
+    """NumPy arrays of the geometry and connectivity of a mesh, computed lazily and shared between functions.
+
+    Use :func:`get_mesh_arrays` to get the arrays of a mesh, which are cached per mesh and recomputed
+    when vertices or faces are added or removed, or after :func:`invalidate_mesh_arrays`. All indices refer
+    to the order of ``mesh.vertices()`` and ``mesh.faces()``, which may differ from the vertex and face keys.
+
+    The arrays only hold a weak reference to the mesh, so that the cache does not keep the mesh alive.
+
+    Attributes
+    ----------
+    mesh : Mesh
+        The mesh. Raises a ReferenceError if the mesh was garbage collected.
+    V : NDArray
+        (V, 3) vertex coordinates.
+    vertex_keys : list[int]
+        Vertex key of each vertex index.
+    face_keys : list[int]
+        Face key of each face index.
+
+    """
+
+    def __init__(self, mesh: Mesh) -> None:
+        self._mesh_ref = weakref.ref(mesh)
+        self.V = _vertex_coordinates(mesh)
+        self.vertex_keys = list(mesh.vertices())
+        self.face_keys = list(mesh.faces())
+        self._topology = _topology_signature(mesh)
+        self._bvhs: dict[int, MeshBVH] = {}
+
+    def __repr__(self) -> str:
+        return f"<MeshArrays with {len(self.vertex_keys)} vertices, {len(self.face_keys)} faces>"
+
+    @property
+    def mesh(self) -> Mesh:
+        """The mesh of the arrays."""
+        mesh = self._mesh_ref()
+        if mesh is None:
+            raise ReferenceError("The mesh of the arrays was garbage collected.")
+        return mesh
+
+    def is_valid(self) -> bool:
+        """Returns False if vertices or faces were added to or removed from the mesh, True otherwise.
+
+        Changes that keep the vertices and faces, such as moved vertices or reoriented faces, are not
+        detected. Call :func:`invalidate_mesh_arrays` after them.
+        """
+        mesh = self._mesh_ref()
+        return mesh is not None and _topology_signature(mesh) == self._topology
+
+    @cached_property
+    def vertex_index(self) -> dict[int, int]:
+        """Vertex index of each vertex key."""
+        return {vkey: i for i, vkey in enumerate(self.vertex_keys)}
+
+    @cached_property
+    def faces(self) -> list[list[int]]:
+        """Vertex indices of each face, for faces with any number of vertices."""
+        vertex_index = self.vertex_index
+        return [[vertex_index[vkey] for vkey in self.mesh.face_vertices(fkey)] for fkey in self.face_keys]
+
+    @cached_property
+    def F(self) -> NDArray:
+        """(F, 3) vertex indices of the faces. Raises a ValueError if the mesh is not triangulated."""
+        if any(len(face) != 3 for face in self.faces):
+            raise ValueError("The mesh must be triangulated.")
+        return np.array(self.faces, dtype=np.intp).reshape((-1, 3))
+
+    @cached_property
+    def edges(self) -> NDArray:
+        """(E, 2) vertex indices of the edges, in the order of ``mesh.edges()``."""
+        vertex_index = self.vertex_index
+        return np.array([(vertex_index[u], vertex_index[v]) for u, v in self.mesh.edges()], dtype=np.intp).reshape(
+            (-1, 2)
+        )
+
+    @cached_property
+    def edge_keys(self) -> NDArray:
+        """(E, 2) vertex keys of the edges, in the order of ``mesh.edges()``."""
+        edge_keys: NDArray = np.asarray(self.vertex_keys, dtype=np.intp)[self.edges]
+        return edge_keys
+
+    @cached_property
+    def edge_index(self) -> dict[tuple[int, int], int]:
+        """Edge index of each edge (u, v) of vertex keys, in the orientation of ``mesh.edges()``."""
+        return {(u, v): i for i, (u, v) in enumerate(self.edge_keys.tolist())}
+
+    @cached_property
+    def vertex_rings(self) -> tuple[NDArray, NDArray]:
+        """Ordered one-ring of each vertex in CSR form, as (offsets, indices).
+
+        The neighbors of vertex i, in the order of ``mesh.vertex_neighbors(vkey, ordered=True)``,
+        are ``indices[offsets[i]:offsets[i + 1]]``.
+        """
+        vertex_index = self.vertex_index
+        rings = [
+            [vertex_index[nbr] for nbr in self.mesh.vertex_neighbors(vkey, ordered=True)] for vkey in self.vertex_keys
+        ]
+        offsets = np.zeros(len(rings) + 1, dtype=np.intp)
+        np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+        indices = np.fromiter(chain.from_iterable(rings), dtype=np.intp, count=offsets[-1])
+        return offsets, indices
+
+    @cached_property
+    def edge_faces(self) -> NDArray:
+        """(E, 2) indices of the faces on both sides of each edge, -1 on the boundary."""
+        u, v, f, e = self._halfedges
+        forward = u < v  # the face on the left of the edge (min, max) comes first
+        edge_faces = np.full((len(self.edges), 2), -1, dtype=np.intp)
+        edge_faces[e, np.where(forward, 0, 1)] = f
+        return edge_faces
+
+    @cached_property
+    def edge_left_faces(self) -> NDArray:
+        """(E,) index of the face on the left of each edge, in the orientation of ``mesh.edges()``.
+
+        Boundary edges without a face on their left get the face on their right.
+        """
+        edge_faces = self.edge_faces
+        forward = self.edges[:, 0] < self.edges[:, 1]
+        left = np.where(forward, edge_faces[:, 0], edge_faces[:, 1])
+        right = np.where(forward, edge_faces[:, 1], edge_faces[:, 0])
+        return np.where(left >= 0, left, right)
+
+    @cached_property
+    def face_edges(self) -> NDArray:
+        """(F, 3) edge indices of the (triangular) faces; column i is the edge from vertex i to vertex i + 1."""
+        return self._halfedges[3].reshape((len(self.F), 3))
+
+    @cached_property
+    def _halfedges(self) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Start vertex, end vertex, face and edge index of each halfedge, face by face."""
+        n_vertices = len(self.vertex_keys)
+        halfedges = np.array(
+            [(face[k], face[(k + 1) % len(face)], fi) for fi, face in enumerate(self.faces) for k in range(len(face))],
+            dtype=np.intp,
+        ).reshape((-1, 3))
+        u, v, f = halfedges.T
+
+        edge_ids = np.minimum(self.edges[:, 0], self.edges[:, 1]) * n_vertices + np.maximum(
+            self.edges[:, 0], self.edges[:, 1]
+        )
+        order = np.argsort(edge_ids)
+        e = order[np.searchsorted(edge_ids[order], np.minimum(u, v) * n_vertices + np.maximum(u, v))]
+        return u, v, f, e
+
+    @cached_property
+    def face_cross_products(self) -> NDArray:
+        """(F, 3) cross products of the first two edges of the (triangular) faces."""
+        v0, v1, v2 = self.V[self.F[:, 0]], self.V[self.F[:, 1]], self.V[self.F[:, 2]]
+        return np.cross(v1 - v0, v2 - v0)
+
+    @cached_property
+    def face_areas(self) -> NDArray:
+        """(F,) areas of the (triangular) faces."""
+        areas: NDArray = 0.5 * np.linalg.norm(self.face_cross_products, axis=1)
+        return areas
+
+    @cached_property
+    def face_normals(self) -> NDArray:
+        """(F, 3) unit normals of the (triangular) faces."""
+        lengths = np.linalg.norm(self.face_cross_products, axis=1, keepdims=True)
+        normals: NDArray = np.divide(
+            self.face_cross_products, lengths, out=np.zeros((len(lengths), 3)), where=lengths > 0
+        )
+        return normals
+
+    @cached_property
+    def cotans(self) -> NDArray:
+        """(F, 3) halved cotangents of the angles of the faces; column i is the angle at vertex i of each face."""
+        i0, i1, i2 = self.F[:, 0], self.F[:, 1], self.F[:, 2]
+        v0, v1, v2 = self.V[i0], self.V[i1], self.V[i2]
+
+        e0 = v2 - v1
+        e1 = v0 - v2
+        e2 = v1 - v0
+
+        def cotangent(a: NDArray, b: NDArray) -> NDArray:
+            cross = np.cross(a, b)
+            cross_norm = np.linalg.norm(cross, axis=1)
+            dot = np.sum(a * b, axis=1)
+            cross_norm = np.maximum(cross_norm, 1e-10)
+            cot: NDArray = dot / cross_norm
+            return cot
+
+        cot0 = cotangent(-e2, e1)
+        cot1 = cotangent(-e0, e2)
+        cot2 = cotangent(-e1, e0)
+        return np.column_stack([cot0, cot1, cot2]) * 0.5
+
+    def get_bvh(self, leaf_size: int = 8) -> MeshBVH:
+        """Returns the :class:`MeshBVH` of the mesh faces, built on first use."""
+        if leaf_size not in self._bvhs:
+            self._bvhs[leaf_size] = MeshBVH(self.V, self.faces, leaf_size=leaf_size)
+        return self._bvhs[leaf_size]
+
+
+def get_mesh_arrays(mesh: Mesh) -> MeshArrays:
+    """Returns the MeshArrays of a mesh, creating them if the mesh has none or if they are no longer valid.
+
+    Adding or removing vertices or faces is detected by comparing the number of vertices and faces and the
+    highest vertex and face keys, which takes constant time. Code that moves vertices or reorients faces in
+    place must call :func:`invalidate_mesh_arrays` afterwards.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh.
+
+    Returns
+    -------
+    MeshArrays
+
+    """
+    arrays = _MESH_ARRAYS_CACHE.get(mesh)
+    if arrays is None or not arrays.is_valid():
+        arrays = MeshArrays(mesh)
+        _MESH_ARRAYS_CACHE[mesh] = arrays
+    return arrays
+
+
+def invalidate_mesh_arrays(mesh: Mesh) -> None:
+    """Removes the cached MeshArrays and MeshBVH of a mesh, so they are recomputed on their next use.
+
+    Call it after changing the vertex coordinates or the faces of a mesh in place.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh.
+
+    """
+    _MESH_ARRAYS_CACHE.pop(mesh, None)
+
+
+def get_mesh_bvh(mesh: Mesh, leaf_size: int = 8) -> MeshBVH:
+    """Returns the MeshBVH of a mesh, building it only if the mesh has no BVH yet or its arrays are recomputed.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A compas mesh.
+    leaf_size : int
+        Maximum number of triangles per leaf, used when the BVH is built.
+
+    Returns
+    -------
+    MeshBVH
+
+    """
+    return get_mesh_arrays(mesh).get_bvh(leaf_size=leaf_size)
+
+
+def _vertex_coordinates(mesh: Mesh) -> NDArray:
+    """(V, 3) vertex coordinates of the mesh, in the order of ``mesh.vertices()``."""
+    n = mesh.number_of_vertices()
+    xyz = chain.from_iterable(map(_XYZ, mesh.vertex.values()))
+    return np.fromiter(xyz, dtype=np.float64, count=3 * n).reshape((n, 3))
+
+
+def _topology_signature(mesh: Mesh) -> tuple[int, int, int, int]:
+    return (
+        mesh.number_of_vertices(),
+        mesh.number_of_faces(),
+        getattr(mesh, "_max_vertex", -1),
+        getattr(mesh, "_max_face", -1),
+    )
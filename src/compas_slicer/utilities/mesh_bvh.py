@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import scipy.spatial
+
+if TYPE_CHECKING:
+    from compas.datastructures import Mesh
+    from numpy.typing import NDArray
+
+
+__all__ = ["MeshBVH", "closest_points_on_triangles"]
+
+
+class MeshBVH:
+    """Bounding volume hierarchy over the triangles of a mesh, for batched exact closest-point queries.
+
+    The triangles are sorted along a Morton (z-order) curve and grouped into leaves of ``leaf_size``
+    triangles. The axis-aligned bounding boxes of the leaves are merged pairwise, level by level, into
+    an implicit binary tree, in which node ``j`` of a level has the children ``2j`` and ``2j + 1`` on the
+    level below. Queries traverse the tree for many points at once, pruning nodes whose box is farther
+    than the best distance found so far. The best distance is initialized with the triangle whose
+    centroid is nearest to the point, so that only few leaves remain after pruning.
+
+    Non-triangular faces are split into a fan of triangles.
+
+    Attributes
+    ----------
+    V : NDArray
+        (V, 3) vertex coordinates.
+    triangles : NDArray
+        (T, 3) vertex indices of the triangles, in leaf order.
+    triangle_faces : NDArray
+        (T,) face index of each triangle.
+    leaf_size : int
+        Maximum number of triangles per leaf.
+    levels : list[tuple[NDArray, NDArray]]
+        (min, max) corners of the node boxes per level, from the leaves (level 0) to the root.
+
+    """
+
+    def __init__(self, V: NDArray, F: list[list[int]] | NDArray, leaf_size: int = 8) -> None:
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be at least 1, got {leaf_size}")
+        self.V = np.asarray(V, dtype=np.float64).reshape((-1, 3))
+        triangles, triangle_faces = _triangulate(F)
+        if len(triangles) == 0:
+            raise ValueError("Cannot build a MeshBVH for a mesh without faces.")
+
+        order = np.argsort(_morton_codes(self.V[triangles].mean(axis=1)), kind="stable")
+        self.triangles = triangles[order]
+        self.triangle_faces = triangle_faces[order]
+        self.leaf_size = leaf_size
+
+        corners = self.V[self.triangles]
+        starts = np.arange(0, len(self.triangles), leaf_size)
+        self.levels = [
+            (np.minimum.reduceat(corners.min(axis=1), starts), np.maximum.reduceat(corners.max(axis=1), starts))
+        ]
+        while len(self.levels[-1][0]) > 1:
+            lo, hi = self.levels[-1]
+            pairs = np.arange(0, len(lo), 2)
+            self.levels.append((np.minimum.reduceat(lo, pairs), np.maximum.reduceat(hi, pairs)))
+        self._centroid_tree = scipy.spatial.cKDTree(corners.mean(axis=1))
+
+    def __repr__(self) -> str:
+        return f"<MeshBVH with {len(self.triangles)} triangles, {len(self.levels)} levels>"
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh, leaf_size: int = 8) -> MeshBVH:
+        """Creates a MeshBVH over the faces of a compas mesh.
+
+        The face indices returned by queries follow the order of ``mesh.faces()``. Prefer
+        :func:`get_mesh_bvh`, which builds the BVH of a mesh only once.
+        """
+        V, F = mesh.to_vertices_and_faces()
+        return cls(V, F, leaf_size=leaf_size)
+
+    def closest_triangles(
+        self, points: NDArray | list, chunk_size: int = 8192
+    ) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Finds the closest triangle and the closest point on it for each query point.
+
+        Parameters
+        ----------
+        points : NDArray | list
+            (N, 3) query points.
+        chunk_size : int
+            Number of points traversed together, bounding the memory of a query.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray, NDArray]
+            (N,) triangle indices into ``self.triangles``, (N, 3) closest points,
+            (N, 3) barycentric coordinates of the closest points and (N,) squared distances.
+
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        n = len(points)
+        tris = np.empty(n, dtype=np.intp)
+        closest = np.empty((n, 3))
+        bary = np.empty((n, 3))
+        d2 = np.empty(n)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            tris[start:stop], closest[start:stop], bary[start:stop], d2[start:stop] = self._query(points[start:stop])
+        return tris, closest, bary, d2
+
+    def closest_points(self, points: NDArray | list, chunk_size: int = 8192) -> tuple[NDArray, NDArray, NDArray]:
+        """Finds the closest face and the closest point on the mesh for each query point.
+
+        Parameters
+        ----------
+        points : NDArray | list
+            (N, 3) query points.
+        chunk_size : int
+            Number of points traversed together, bounding the memory of a query.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray]
+            (N,) face indices, (N, 3) closest points and (N, 3) barycentric coordinates of the closest
+            points, with respect to the vertices of the closest triangle (see :meth:`closest_triangles`).
+
+        """
+        tris, closest, bary, _ = self.closest_triangles(points, chunk_size=chunk_size)
+        return self.triangle_faces[tris], closest, bary
+
+    def _query(self, points: NDArray) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        n = len(points)
+        best_d2 = np.full(n, np.inf)
+        best_tri = np.zeros(n, dtype=np.intp)
+        best_pt = np.zeros((n, 3))
+        best_bary = np.zeros((n, 3))
+
+        def update(q: NDArray, leaves: NDArray) -> None:
+            """Evaluates all triangles of the leaves for the query indices q, keeping the best per query."""
+            q = np.repeat(q, self.leaf_size)
+            tri = (leaves[:, None] * self.leaf_size + np.arange(self.leaf_size)).ravel()
+            valid = tri < len(self.triangles)
+            update_triangles(q[valid], tri[valid])
+
+        def update_triangles(q: NDArray, tri: NDArray) -> None:
+            """Evaluates the triangles tri for the query indices q, keeping the best per query."""
+            corners = self.V[self.triangles[tri]]
+            pts, bary = closest_points_on_triangles(points[q], corners[:, 0], corners[:, 1], corners[:, 2])
+            d2 = np.einsum("ij,ij->i", pts - points[q], pts - points[q])
+            # the best candidate of every query: sort by query, then distance, and take the first of each query
+            order = np.lexsort((d2, q))
+            first = order[np.flatnonzero(np.diff(q[order], prepend=-1))]
+            better = d2[first] < best_d2[q[first]]
+            first = first[better]
+            qf = q[first]
+            best_d2[qf] = d2[first]
+            best_tri[qf] = tri[first]
+            best_pt[qf] = pts[first]
+            best_bary[qf] = bary[first]
+
+        # (1) the triangle with the nearest centroid gives every query a tight first upper bound
+        _, nearest = self._centroid_tree.query(points)
+        update_triangles(np.arange(n), np.asarray(nearest, dtype=np.intp))
+
+        # (2) full traversal, pruning the nodes that are farther than the current upper bound
+        q = np.arange(n)
+        node = np.zeros(n, dtype=np.intp)
+        for level in range(len(self.levels) - 1, -1, -1):
+            lo, hi = self.levels[level]
+            keep = _box_distances2(points[q], lo[node], hi[node]) < best_d2[q]
+            q, node = q[keep], node[keep]
+            if level == 0:
+                break
+            n_children = len(self.levels[level - 1][0])
+            q = np.repeat(q, 2)
+            node = (node[:, None] * 2 + np.arange(2)).ravel()
+            exists = node < n_children
+            q, node = q[exists], node[exists]
+        if len(q):
+            update(q, node)
+
+        return best_tri, best_pt, best_bary, best_d2
+
+
+def closest_points_on_triangles(points: NDArray, a: NDArray, b: NDArray, c: NDArray) -> tuple[NDArray, NDArray]:
+    """Closest points on triangles (a, b, c) to points, evaluated row by row.
+
+    Uses the Voronoi region tests from Ericson, Real-Time Collision Detection (2005), section 5.1.5.
+
+    Parameters
+    ----------
+    points, a, b, c : NDArray
+        (N, 3) query points and triangle corners.
+
+    Returns
+    -------
+    tuple[NDArray, NDArray]
+        (N, 3) closest points and (N, 3) barycentric coordinates of the closest points.
+
+    """
+    ab, ac = b - a, c - a
+    ap, bp, cp = points - a, points - b, points - c
+    d1, d2 = np.einsum("ij,ij->i", ab, ap), np.einsum("ij,ij->i", ac, ap)
+    d3, d4 = np.einsum("ij,ij->i", ab, bp), np.einsum("ij,ij->i", ac, bp)
+    d5, d6 = np.einsum("ij,ij->i", ab, cp), np.einsum("ij,ij->i", ac, cp)
+    va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # face region by default, then override with the edge and vertex regions, in reverse priority
+        denom = va + vb + vc
+        v, w = np.where(denom != 0, vb / denom, 0.0), np.where(denom != 0, vc / denom, 0.0)
+        bary = np.stack([1.0 - v - w, v, w], axis=1)
+
+        bc_edge = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        bary[bc_edge] = np.stack([np.zeros_like(t), 1.0 - t, t], axis=1)[bc_edge]
+
+        ac_edge = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        t = d2 / (d2 - d6)
+        bary[ac_edge] = np.stack([1.0 - t, np.zeros_like(t), t], axis=1)[ac_edge]
+
+        ab_edge = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        t = d1 / (d1 - d3)
+        bary[ab_edge] = np.stack([1.0 - t, t, np.zeros_like(t)], axis=1)[ab_edge]
+
+    bary[(d6 >= 0) & (d5 <= d6)] = [0.0, 0.0, 1.0]
+    bary[(d3 >= 0) & (d4 <= d3)] = [0.0, 1.0, 0.0]
+    bary[(d1 <= 0) & (d2 <= 0)] = [1.0, 0.0, 0.0]
+    # degenerate triangles may still produce invalid weights: fall back to the first corner
+    bary[~np.all(np.isfinite(bary), axis=1)] = [1.0, 0.0, 0.0]
+
+    closest = bary[:, :1] * a + bary[:, 1:2] * b + bary[:, 2:] * c
+    return closest, bary
+
+
+def _triangulate(F: list[list[int]] | NDArray) -> tuple[NDArray, NDArray]:
+    """Splits faces into fans of triangles. Returns (T, 3) vertex indices and (T,) face indices."""
+    if isinstance(F, np.ndarray) and F.ndim == 2 and F.shape[1] == 3:
+        return F.astype(np.intp), np.arange(len(F), dtype=np.intp)
+    triangles = []
+    faces = []
+    for fi, face in enumerate(F):
+        for k in range(1, len(face) - 1):
+            triangles.append((face[0], face[k], face[k + 1]))
+            faces.append(fi)
+    return np.array(triangles, dtype=np.intp).reshape((-1, 3)), np.array(faces, dtype=np.intp)
+
+
+def _box_distances2(points: NDArray, lo: NDArray, hi: NDArray) -> NDArray:
+    """Squared distances between points and axis-aligned boxes, row by row (0 inside the box)."""
+    d = np.maximum(lo - points, 0.0) + np.maximum(points - hi, 0.0)
+    distances2: NDArray = np.einsum("ij,ij->i", d, d)
+    return distances2
+
+
+def _morton_codes(points: NDArray) -> NDArray:
+    """30-bit Morton codes of points, quantized to 1024 cells along each axis of their bounding box."""
+    lo = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lo, 1e-12)
+    cells = np.clip(((points - lo) / extent * 1023).astype(np.uint32), 0, 1023)
+
+    def spread(x: NDArray) -> NDArray:
+        x = (x | (x << 16)) & 0x030000FF
+        x = (x | (x << 8)) & 0x0300F00F
+        x = (x | (x << 4)) & 0x030C30C3
+        x = (x | (x << 2)) & 0x09249249
+        return x
+
+    codes: NDArray = (spread(cells[:, 0]) << 2) | (spread(cells[:, 1]) << 1) | spread(cells[:, 2])
+    return codes
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from compas.datastructures import Mesh
+    from numpy.typing import NDArray
+
+
+__all__ = ["ScalarField"]
+
+
+class ScalarField:
+    """A scalar function on the vertices of a mesh, stored as an array.
+
+    Contouring, gradient evaluation and critical point detection read the values from the array, so a scalar field
+    does not need to be written to and read back from the vertex attributes of the mesh. Use
+    :meth:`to_mesh_attribute` only to visualize or export the field.
+
+    Attributes
+    ----------
+    mesh : Mesh
+        The mesh.
+    values : NDArray
+        (V,) one value per vertex, in the order of ``mesh.vertices()``.
+
+    """
+
+    def __init__(self, mesh: Mesh, values: Sequence[float] | NDArray) -> None:
+        self.mesh = mesh
+        self.mesh_arrays = get_mesh_arrays(mesh)
+        self.values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if len(self.values) != len(self.mesh_arrays.V):
+            raise ValueError(
+                f"The scalar field has {len(self.values)} values, but the mesh has {len(self.mesh_arrays.V)} vertices."
+            )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"<ScalarField with {len(self.values)} values>"
+
+    @classmethod
+    def from_mesh_attribute(cls, mesh: Mesh, name: str = "scalar_field") -> ScalarField:
+        """Creates the scalar field from a vertex attribute that is set on every vertex of the mesh.
+
+        Parameters
+        ----------
+        mesh : Mesh
+            The mesh.
+        name : str
+            The name of the vertex attribute.
+
+        Returns
+        -------
+        ScalarField
+
+        """
+        for vkey, data in mesh.vertices(data=True):
+            if name not in data:
+                raise ValueError(f"Vertex {vkey} does not have the attribute '{name}'")
+        return cls(mesh, mesh.vertices_attribute(name))
+
+    def to_mesh_attribute(self, name: str = "scalar_field") -> None:
+        """Writes the values to a vertex attribute of the mesh, for visualization or export.
+
+        Parameters
+        ----------
+        name : str
+            The name of the vertex attribute.
+
+        """
+        for vkey, value in zip(self.mesh_arrays.vertex_keys, self.values.tolist()):
+            self.mesh.vertex[vkey][name] = value
+
+    def value(self, vkey: int) -> float:
+        """Returns the value of the vertex with key vkey."""
+        return float(self.values[self.mesh_arrays.vertex_index[vkey]])
@@ -10,7 +10,6 @@ from compas.geometry import (
     Point,
     Vector,
     closest_point_in_cloud,
-    closest_point_on_plane,
     distance_point_point_sqrd,
     length_vector,
     normalize_vector,
@@ -18,6 +17,7 @@ from compas.geometry import (
 from compas.plugins import PluginNotInstalledError
 from loguru import logger
 
+from compas_slicer.utilities.mesh_arrays import get_mesh_arrays
 from compas_slicer.utilities.terminal_command import TerminalCommand
 
 if TYPE_CHECKING:
@@ -57,6 +57,8 @@ __all__ = [
     "find_previous_printpoint",
     "smooth_vectors",
     "get_normal_of_path_on_xy_plane",
+    "get_printpoints_up_vectors",
+    "get_printpoints_frame_axes",
     "get_all_files_with_name",
     "get_closest_mesh_normal_to_pt",
     "check_package_is_installed",
@@ -145,6 +147,9 @@ def get_closest_pt(pt: Point | NDArray, pts: list[Point]) -> Point:
 def pull_pts_to_mesh_faces(mesh: Mesh, points: list[Point]) -> tuple[list[int], list[Point]]:
     """Project points to mesh and find their closest face keys.
 
+    The closest points are exact, and are found with the cached :class:`MeshBVH` of the mesh
+    (see :func:`get_mesh_bvh` and :func:`get_mesh_arrays`).
+
     Parameters
     ----------
     mesh : Mesh
@@ -159,12 +164,10 @@ def pull_pts_to_mesh_faces(mesh: Mesh, points: list[Point]) -> tuple[list[int],
 
     """
     points_arr = np.array(points, dtype=np.float64).reshape((-1, 3))
-    fi_fk = dict(enumerate(mesh.faces()))
-    f_centroids = np.array([mesh.face_centroid(fkey) for fkey in mesh.faces()], dtype=np.float64)
-    closest_fis = np.argmin(scipy.spatial.distance_matrix(points_arr, f_centroids), axis=1)
-    closest_fks = [fi_fk[fi] for fi in closest_fis]
-    projected_pts = [closest_point_on_plane(point, mesh.face_plane(fi)) for point, fi in zip(points_arr, closest_fis)]
-    return closest_fks, projected_pts
+    mesh_arrays = get_mesh_arrays(mesh)
+    closest_fis, projected_pts, _ = mesh_arrays.get_bvh().closest_points(points_arr)
+    closest_fks = [mesh_arrays.face_keys[fi] for fi in closest_fis.tolist()]
+    return closest_fks, projected_pts.tolist()
 
 
 def smooth_vectors(vectors: list[Vector], strength: float, iterations: int) -> list[Vector]:
@@ -428,6 +431,93 @@ def get_normal_of_path_on_xy_plane(k: int, point: Point, path: SlicerPath, mesh:
     return normal
 
 
+#######################################
+# batched printpoint frames (NumPy implementations)
+
+
+def _normalize_rows(vectors: NDArray) -> NDArray:
+    """Normalize the rows of an (N, 3) array, leaving zero-length rows unchanged."""
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.array(vectors, dtype=np.float64), where=lengths > 0)
+
+
+def get_printpoints_up_vectors(points: NDArray, normals: NDArray, path_offsets: NDArray | None = None) -> NDArray:
+    """Get the up vectors of the printpoints of one or several paths at once.
+
+    Batched equivalent of :meth:`BasePrintOrganizer.get_printpoint_up_vector`: the up vector of each
+    point is orthogonal to its normal and to the direction towards the next point of the path, or
+    from the previous point for the last point of the path.
+
+    Parameters
+    ----------
+    points : NDArray
+        (N, 3) points of the paths, concatenated.
+    normals : NDArray
+        (N, 3) normals of the points.
+    path_offsets : NDArray | None
+        Index of the first point of every path, followed by N. If None, the points form one path.
+
+    Returns
+    -------
+    NDArray
+        (N, 3) unit up vectors, (0, 0, 1) where the up vector is undefined.
+
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    normals = np.asarray(normals, dtype=np.float64).reshape((-1, 3))
+    if path_offsets is None:
+        path_offsets = np.array([0, len(points)])
+    path_offsets = np.asarray(path_offsets, dtype=np.intp)
+    starts, lengths = path_offsets[:-1], np.diff(path_offsets)
+
+    is_last = np.zeros(len(points), dtype=bool)
+    is_last[path_offsets[1:][lengths > 0] - 1] = True
+    others = np.empty_like(points)
+    others[:-1] = points[1:]
+    others[is_last] = points[np.flatnonzero(is_last) - 1]
+    single = starts[lengths == 1]
+    others[single] = points[single]
+
+    up_vectors = _normalize_rows(np.cross(normals, _normalize_rows(points - others)))
+    up_vectors[is_last] *= -1.0
+    up_vectors[~np.any(up_vectors, axis=1)] = [0.0, 0.0, 1.0]
+    return up_vectors
+
+
+def get_printpoints_frame_axes(up_vectors: NDArray, normals: NDArray) -> tuple[NDArray, NDArray]:
+    """Get the x and y axes of the frames of many printpoints at once.
+
+    Batched equivalent of :meth:`PrintPoint.get_frame`: the x-axis is orthogonal to the up vector
+    and the normal, and the y-axis points towards the normal. The axes are not orthonormalized, so
+    that ``Frame(pt, xaxis, yaxis)`` gives the same frame as the printpoint.
+
+    Parameters
+    ----------
+    up_vectors : NDArray
+        (N, 3) up vectors of the printpoints.
+    normals : NDArray
+        (N, 3) mesh normals of the printpoints.
+
+    Returns
+    -------
+    tuple[NDArray, NDArray]
+        (N, 3) x axes and (N, 3) y axes.
+
+    """
+    up_vectors = np.asarray(up_vectors, dtype=np.float64).reshape((-1, 3))
+    normals = np.asarray(normals, dtype=np.float64).reshape((-1, 3))
+
+    xaxes = np.cross(up_vectors, normals)
+    xaxes[~np.any(xaxes, axis=1)] = [1.0, 0.0, 0.0]
+    yaxes = normals.copy()
+    yaxes[~np.any(yaxes, axis=1)] = [0.0, 1.0, 0.0]
+
+    parallel = np.abs(np.einsum("ij,ij->i", up_vectors, normals)) >= 1.0
+    xaxes[parallel] = [1.0, 0.0, 0.0]
+    yaxes[parallel] = [0.0, 1.0, 0.0]
+    return xaxes, yaxes
+
+
 #######################################
 # mesh matrix utils (NumPy implementations)
 
@@ -451,61 +541,34 @@ def get_mesh_cotmatrix(mesh: Mesh, fix_boundaries: bool = True) -> csr_matrix:
         Sparse matrix (V x V), cotangent Laplacian.
 
     """
-    V, F = mesh.to_vertices_and_faces()
-    vertices = np.array(V, dtype=np.float64)
-    faces = np.array(F, dtype=np.int32)
+    mesh_arrays = get_mesh_arrays(mesh)
+    faces = mesh_arrays.F
+    n_vertices = len(mesh_arrays.V)
 
-    n_vertices = len(vertices)
-
-    # Get cotangent weights for each half-edge
-    # For each face, compute cotangents of all three angles
+    # halved cotangents of the angles at each vertex of each face (cached on the mesh arrays)
     i0, i1, i2 = faces[:, 0], faces[:, 1], faces[:, 2]
-    v0, v1, v2 = vertices[i0], vertices[i1], vertices[i2]
-
-    # Edge vectors
-    e0 = v2 - v1  # opposite to vertex 0
-    e1 = v0 - v2  # opposite to vertex 1
-    e2 = v1 - v0  # opposite to vertex 2
-
-    # Cotangent of angle at vertex i = dot(e_j, e_k) / |cross(e_j, e_k)|
-    # where e_j and e_k are edges adjacent to vertex i
-    def cotangent(a: NDArray, b: NDArray) -> NDArray:
-        cross = np.cross(a, b)
-        cross_norm = np.linalg.norm(cross, axis=1)
-        dot = np.sum(a * b, axis=1)
-        # Avoid division by zero
-        cross_norm = np.maximum(cross_norm, 1e-10)
-        return dot / cross_norm
-
-    # Cotangent at each vertex of each face
-    cot0 = cotangent(-e2, e1)  # angle at vertex 0
-    cot1 = cotangent(-e0, e2)  # angle at vertex 1
-    cot2 = cotangent(-e1, e0)  # angle at vertex 2
+    cot0, cot1, cot2 = mesh_arrays.cotans.T
 
     # Build sparse matrix
     # L_ij += 0.5 * cot(angle opposite to edge ij)
     row = np.concatenate([i0, i1, i1, i2, i2, i0])
     col = np.concatenate([i1, i0, i2, i1, i0, i2])
-    data = np.concatenate([cot2, cot2, cot0, cot0, cot1, cot1]) * 0.5
+    data = np.concatenate([cot2, cot2, cot0, cot0, cot1, cot1])
 
-    L = csr_matrix((data, (row, col)), shape=(n_vertices, n_vertices))
+    L = scipy.sparse.csr_matrix((data, (row, col)), shape=(n_vertices, n_vertices))
 
     # Make symmetric and set diagonal to negative row sum
     L = L + L.T
     L = L - scipy.sparse.diags(np.array(L.sum(axis=1)).flatten())
 
     if fix_boundaries:
-        # Zero out rows for boundary vertices
-        boundary_mask = np.zeros(n_vertices, dtype=bool)
-        for i, (_vkey, vdata) in enumerate(mesh.vertices(data=True)):
-            if vdata.get("boundary", 0) > 0:
-                boundary_mask[i] = True
-
+        # Zero out rows for boundary vertices, by multiplying with a diagonal mask
+        boundary_mask = np.array(
+            [vdata.get("boundary", 0) > 0 for _vkey, vdata in mesh.vertices(data=True)], dtype=bool
+        )
         if np.any(boundary_mask):
-            L = L.tolil()
-            for i in np.where(boundary_mask)[0]:
-                L[i, :] = 0
-            L = L.tocsr()
+            L = (scipy.sparse.diags((~boundary_mask).astype(np.float64)) @ L).tocsr()
+            L.eliminate_zeros()
 
     return L
 
@@ -525,29 +588,7 @@ def get_mesh_cotans(mesh: Mesh) -> NDArray:
         Column i contains cotangent of angle at vertex i of each face.
 
     """
-    V, F = mesh.to_vertices_and_faces()
-    vertices = np.array(V, dtype=np.float64)
-    faces = np.array(F, dtype=np.int32)
-
-    i0, i1, i2 = faces[:, 0], faces[:, 1], faces[:, 2]
-    v0, v1, v2 = vertices[i0], vertices[i1], vertices[i2]
-
-    e0 = v2 - v1
-    e1 = v0 - v2
-    e2 = v1 - v0
-
-    def cotangent(a: NDArray, b: NDArray) -> NDArray:
-        cross = np.cross(a, b)
-        cross_norm = np.linalg.norm(cross, axis=1)
-        dot = np.sum(a * b, axis=1)
-        cross_norm = np.maximum(cross_norm, 1e-10)
-        return dot / cross_norm
-
-    cot0 = cotangent(-e2, e1)
-    cot1 = cotangent(-e0, e2)
-    cot2 = cotangent(-e1, e0)
-
-    return np.column_stack([cot0, cot1, cot2]) * 0.5
+    return get_mesh_arrays(mesh).cotans.copy()
 
 
 def get_mesh_massmatrix(mesh: Mesh) -> csr_matrix:
@@ -564,18 +605,12 @@ def get_mesh_massmatrix(mesh: Mesh) -> csr_matrix:
         Sparse diagonal matrix (V x V), vertex areas.
 
     """
-    V, F = mesh.to_vertices_and_faces()
-    vertices = np.array(V, dtype=np.float64)
-    faces = np.array(F, dtype=np.int32)
+    mesh_arrays = get_mesh_arrays(mesh)
+    faces = mesh_arrays.F
+    n_vertices = len(mesh_arrays.V)
 
-    n_vertices = len(vertices)
-
-    # Compute face areas
     i0, i1, i2 = faces[:, 0], faces[:, 1], faces[:, 2]
-    v0, v1, v2 = vertices[i0], vertices[i1], vertices[i2]
-
-    cross = np.cross(v1 - v0, v2 - v0)
-    face_areas = 0.5 * np.linalg.norm(cross, axis=1)
+    face_areas = mesh_arrays.face_areas
 
     # Distribute 1/3 of each face area to each vertex
     vertex_areas = np.zeros(n_vertices)
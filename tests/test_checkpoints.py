@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.utilities import CheckpointStore, checkpoint_key, meshes_from_arrays, meshes_to_arrays
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def test_checkpoint_key_changes_with_inputs():
+    config = {"avg_layer_height": 5.0, "target_high_union_params": [10.0]}
+    key = checkpoint_key(np.arange(6.0).reshape((2, 3)), config)
+    assert key == checkpoint_key(np.arange(6.0).reshape((2, 3)), dict(reversed(config.items())))
+    assert key != checkpoint_key(np.arange(6.0).reshape((3, 2)), config)
+    assert key != checkpoint_key(np.arange(6.0).reshape((2, 3)), {**config, "avg_layer_height": 5.5})
+    with pytest.raises(TypeError):
+        checkpoint_key(object())
+
+
+def test_meshes_round_trip_through_arrays():
+    """Tests that meshes keep their vertex keys, coordinates, faces and numeric vertex attributes."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    mesh.update_default_vertex_attributes({"cut": 0, "boundary": 0})
+    mesh.delete_vertex(0)
+    for vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] < 5.0 else 2 if data["z"] > 190.0 else 0
+        data["uv"] = [0.0, 1.0]  # not numeric, not stored
+        if vkey % 7 == 0:
+            data["cut"] = 3
+
+    (restored,) = meshes_from_arrays(meshes_to_arrays([mesh]))
+    assert list(restored.vertices()) == list(mesh.vertices())
+    assert restored.vertices_attributes("xyz") == mesh.vertices_attributes("xyz")
+    assert [restored.face_vertices(f) for f in restored.faces()] == [mesh.face_vertices(f) for f in mesh.faces()]
+    assert restored.vertices_attribute("cut") == mesh.vertices_attribute("cut")
+    assert restored.vertices_attribute("boundary") == mesh.vertices_attribute("boundary")
+    assert isinstance(restored.vertex_attribute(7, "cut"), int)
+    assert restored.vertex_attribute(7, "uv") is None
+
+
+def test_checkpoint_store_keeps_latest_result_per_stage(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints")
+    key_a, key_b = checkpoint_key("a"), checkpoint_key("b")
+    assert store.load("cut", key_a) is None
+
+    store.save("cut", key_a, {"values": np.arange(3)})
+    store.save("separate", key_a, {"values": np.arange(4)})
+    assert np.array_equal(store.load("cut", key_a)["values"], np.arange(3))
+
+    store.save("cut", key_b, {"values": np.arange(5)})
+    assert not store.contains("cut", key_a)
+    assert store.contains("separate", key_a)
+    assert np.array_equal(store.load("cut", key_b)["values"], np.arange(5))
+
+    store.clear()
+    assert not store.contains("cut", key_b)
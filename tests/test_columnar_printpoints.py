@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import numpy as np
+from compas.datastructures import Mesh
+from compas.geometry import Frame, Point, Vector
+
+from compas_slicer.geometry import ColumnarPrintPointsCollection, PrintPoint
+from compas_slicer.post_processing import generate_brim
+from compas_slicer.print_organization import (
+    PlanarPrintOrganizer,
+    override_wait_time,
+    set_extruder_toggle,
+    set_linear_velocity_by_overhang,
+)
+from compas_slicer.slicers import PlanarSlicer
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def create_setup():
+    slicer = PlanarSlicer(Mesh.from_obj(DATA_PATH / "cylinder.obj"), layer_height=15.0)
+    slicer.slice_model()
+    generate_brim(slicer, layer_width=3.0, number_of_brim_offsets=2)
+    return slicer
+
+
+def test_columnar_printpoints_match_printpoints():
+    """Tests that columnar printpoints have the same attributes as PrintPoint objects."""
+    slicer = create_setup()
+    print_organizer = PlanarPrintOrganizer(slicer)
+    print_organizer.create_printpoints()
+    columnar_organizer = PlanarPrintOrganizer(slicer)
+    columnar_organizer.create_printpoints(columnar=True)
+
+    printpoints = columnar_organizer.printpoints
+    assert isinstance(printpoints, ColumnarPrintPointsCollection)
+    converted = ColumnarPrintPointsCollection.from_collection(print_organizer.printpoints)
+    for name in ["positions", "mesh_normals", "up_vectors", "layer_heights", "path_offsets", "layer_offsets"]:
+        assert np.allclose(getattr(printpoints, name), getattr(converted, name)), name
+
+    for organizer in [print_organizer, columnar_organizer]:
+        set_extruder_toggle(organizer, slicer)
+        set_linear_velocity_by_overhang(organizer, overhang_range=(0.0, 0.5), velocity_range=(20.0, 40.0))
+        override_wait_time(organizer, 0.2)
+
+    for ppt, i, j, k in print_organizer.printpoints_indices_iterator():
+        view = printpoints.get_printpoint(i, j, k)
+        assert view.pt == ppt.pt
+        assert view.extruder_toggle is ppt.extruder_toggle
+        assert abs(view.velocity - ppt.velocity) < 1e-9
+        assert view.wait_time == ppt.wait_time
+        assert view.blend_radius is None
+
+
+def test_columnar_printpoints_roundtrip():
+    """Tests conversion to and from a PrintPointsCollection, and writing through views."""
+    slicer = create_setup()
+    print_organizer = PlanarPrintOrganizer(slicer)
+    print_organizer.create_printpoints()
+    collection = print_organizer.printpoints
+
+    columnar = ColumnarPrintPointsCollection.from_collection(collection)
+    assert columnar.to_collection() == collection
+    assert len(columnar[-1][-1]) == len(collection[-1][-1])
+
+    view = columnar[0][0][-1]
+    view.velocity = 12.0
+    view.extruder_toggle = False
+    assert columnar.velocities[view.index] == 12.0
+    assert columnar[0][0][-1].extruder_toggle is False
+
+    columnar.remove_printpoints([0, view.index])
+    assert columnar.number_of_printpoints == collection.number_of_printpoints - 2
+    assert len(columnar[0][0]) == len(collection[0][0]) - 2
+
+
+def test_columnar_printpoints_store_only_assigned_frames():
+    """Tests that only explicitly assigned frames are stored, and that the other frames follow the up vector."""
+    slicer = create_setup()
+    print_organizer = PlanarPrintOrganizer(slicer)
+    print_organizer.create_printpoints()
+    collection = print_organizer.printpoints
+    assigned = collection[0][0][0]
+    assigned.frame = Frame.worldYZ()
+
+    columnar = ColumnarPrintPointsCollection.from_collection(collection)
+    assert list(columnar.frames) == [0]
+    assert columnar[0][0][0].frame == Frame.worldYZ()
+
+    ppt = collection[0][0][1]
+    ppt.up_vector = Vector(1, 0, 0)
+    assert ppt.frame == ppt.get_frame()
+    ppt.frame = None
+    assert ppt._frame is None
+
+
+def test_printpoint_frame_argument_and_roundtrip():
+    """Tests that a given frame is kept, and that a computed frame stays computed after a data round trip."""
+    given = PrintPoint(Point(0, 0, 0), 1.0, Vector(1, 0, 0), Vector(0, 0, 1), Frame.worldYZ(), True)
+    assert given.frame == Frame.worldYZ()
+    assert given.extruder_toggle is True
+    assert PrintPoint.__from_data__(given.__data__).frame == Frame.worldYZ()
+
+    computed = PrintPoint.__from_data__(PrintPoint(Point(0, 0, 0), 1.0, Vector(1, 0, 0)).__data__)
+    assert computed._frame is None
+    computed.up_vector = Vector(0, 1, 0)
+    assert computed.frame == computed.get_frame()
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.slicers.slice_utilities import (
+    ContoursBase,
+    InterpolationLevelContours,
+    ScalarFieldContours,
+    ScalarFieldLevelContours,
+    UVContours,
+    UVLineContours,
+)
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+@pytest.mark.parametrize("axis", ["x", "z"])
+def test_contours_are_stitched_across_faces(axis):
+    """Tests that consecutive crossings of every contour share a face, and that all crossings are used."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    coordinates = mesh.vertices_attribute(axis)
+    middle = 0.5 * (min(coordinates) + max(coordinates)) + 1e-3
+    for _vkey, data in mesh.vertices(data=True):
+        data["scalar_field"] = data[axis] - middle
+
+    contours = ScalarFieldContours(mesh)
+    contours.compute()
+
+    def edge_faces(edge):
+        u, v = edge
+        return {mesh.halfedge_face((u, v)), mesh.halfedge_face((v, u))} - {None}
+
+    assert len(contours.sorted_edge_clusters) > 0
+    assert sum(len(edges) for edges in contours.sorted_edge_clusters.values()) == len(contours.intersection_data)
+    for key, edges in contours.sorted_edge_clusters.items():
+        for e1, e2 in zip(edges[:-1], edges[1:]):
+            assert edge_faces(e1) & edge_faces(e2)
+        is_closed = bool(edge_faces(edges[0]) & edge_faces(edges[-1])) and len(edges) > 2
+        assert contours.closed_paths_booleans[key] == is_closed
+        assert len(contours.sorted_point_clusters[key]) == len(edges)
+
+
+def test_level_contours_match_single_level_contours():
+    """Tests that the contours of all levels at once match the contours found one level at a time."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_v_closed_low_res.obj")
+    scalar_field = np.array(mesh.vertices_attribute("z"))
+    levels = np.linspace(scalar_field.min(), scalar_field.max(), 12)[1:-1]
+
+    level_contours = list(ScalarFieldLevelContours(mesh, scalar_field).iter_contours(levels))
+    assert "scalar_field" not in mesh.vertex_attributes(next(iter(mesh.vertices())))
+
+    assert len(level_contours) == len(levels)
+    for level, contours in zip(levels, level_contours):
+        for _vkey, data in mesh.vertices(data=True):
+            data["scalar_field"] = data["z"] - level
+        single_level = ScalarFieldContours(mesh)
+        single_level.compute()
+
+        assert len(contours) == len(single_level.sorted_point_clusters) > 0
+        for (pts, is_closed), key in zip(contours, single_level.sorted_point_clusters):
+            assert np.allclose(pts, single_level.sorted_point_clusters[key])
+            assert is_closed == single_level.closed_paths_booleans[key]
+
+
+def test_interpolation_level_contours_match_interpolated_field_contours():
+    """Tests that the contours from the crossing weights match the contours of the interpolated fields."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_v_closed_low_res.obj")
+    V = np.array([mesh.vertex_coordinates(vkey) for vkey in mesh.vertices()])
+    d_low = V[:, 2] - V[:, 2].min()
+    d_high = np.linalg.norm(V - V[np.argmax(V[:, 2])], axis=1)
+    weights = [0.1, 0.35, 0.5, 0.8]
+
+    level_contours = list(InterpolationLevelContours(mesh, d_low, d_high).iter_contours(weights))
+
+    assert len(level_contours) == len(weights)
+    for weight, contours in zip(weights, level_contours):
+        for i, (_vkey, data) in enumerate(mesh.vertices(data=True)):
+            data["scalar_field"] = d_low[i] * (1 - weight) - d_high[i] * weight
+        single_level = ScalarFieldContours(mesh)
+        single_level.compute()
+
+        assert len(contours) == len(single_level.sorted_point_clusters) > 0
+        for (pts, is_closed), key in zip(contours, single_level.sorted_point_clusters):
+            assert np.array_equal(pts, single_level.sorted_point_clusters[key])
+            assert is_closed == single_level.closed_paths_booleans[key]
+
+
+def test_uv_line_contours_match_per_edge_intersections():
+    """Tests that the crossings of all uv lines at once match the crossings found edge by edge."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    V = np.array([mesh.vertex_coordinates(vkey) for vkey in mesh.vertices()])
+    uv = (V[:, [2, 0]] - V[:, [2, 0]].min(axis=0)) / np.ptp(V[:, [2, 0]], axis=0)
+    for vkey, vertex_uv in zip(mesh.vertices(), uv.tolist()):
+        mesh.vertex_attribute(vkey, "uv", vertex_uv)
+    lines = [((u, 0.0), (u, 1.0)) for u in [0.1, 0.45, 0.8]] + [((0.0, 0.2), (1.0, 0.7)), ((0.3, 0.0), (0.6, 0.4))]
+
+    crossings = UVLineContours(mesh).find_crossings(lines)
+
+    assert len(crossings) == len(lines)
+    for (p1, p2), (edge_indices, points) in zip(lines, crossings):
+        per_edge = UVContours(mesh, p1, p2)
+        ContoursBase.find_intersections(per_edge)
+        assert len(per_edge.intersection_data) == len(edge_indices) > 0
+        assert np.array_equal(points, np.array(list(per_edge.intersection_data.values())))
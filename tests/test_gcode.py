@@ -0,0 +1,35 @@
+import io
+from pathlib import Path
+
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.print_organization import PlanarPrintOrganizer, create_gcode_text, set_extruder_toggle, write_gcode
+from compas_slicer.slicers import PlanarSlicer
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def _mask_timestamp(gcode):
+    return [line for line in gcode.splitlines() if not line.startswith(";Generated:")]
+
+
+@pytest.mark.parametrize("filename", ["cylinder.obj", "distorted_v_closed_low_res.obj"])
+def test_streamed_gcode_matches_gcode_text(filename):
+    """Tests that the streaming pipeline gives the same G-code and extruder toggles as the stored print points."""
+    slicer = PlanarSlicer(Mesh.from_obj(DATA_PATH / filename), layer_height=15.0)
+    slicer.slice_model()
+    print_organizer = PlanarPrintOrganizer(slicer)
+    print_organizer.create_printpoints()
+    set_extruder_toggle(print_organizer, slicer)
+
+    streamed_layers = list(print_organizer.iter_print_layers(slicer.iter_layers()))
+    stream = io.StringIO()
+    write_gcode(streamed_layers, stream)
+
+    assert _mask_timestamp(stream.getvalue()) == _mask_timestamp(create_gcode_text(print_organizer))
+    streamed_toggles = [
+        ppt.extruder_toggle for layer in streamed_layers for path in layer.paths for ppt in path.printpoints
+    ]
+    assert streamed_toggles == [ppt.extruder_toggle for ppt in print_organizer.printpoints.iter_printpoints()]
+    assert streamed_toggles[-1] is False
@@ -0,0 +1,64 @@
+import gc
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.pre_processing.preprocessing_utils import geodesics
+
+pytest.importorskip("compas_cgal")
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def test_heat_geodesic_solvers_are_cached_per_geometry(monkeypatch):
+    """Tests that meshes with the same counts but different geometry get their own solvers, in an LRU cache."""
+    monkeypatch.setattr(geodesics, "_cgal_solver_cache", type(geodesics._cgal_solver_cache)())
+    monkeypatch.setattr(geodesics, "CGAL_SOLVER_CACHE_SIZE", 2)
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    scaled = mesh.copy()
+    for _vkey, data in scaled.vertices(data=True):
+        data["z"] *= 2.0
+
+    solver = geodesics.get_heat_geodesic_solver(mesh)
+    assert geodesics.get_heat_geodesic_solver(mesh.copy()) is solver
+    assert geodesics.get_heat_geodesic_solver(scaled) is not solver
+
+    sources = [[0], [1, 2]]
+    distances = geodesics.get_heat_geodesic_distances_list(scaled, sources)
+    scaled_distances = geodesics.get_heat_geodesic_distances_list(mesh, sources)
+    assert not np.allclose(distances[1], scaled_distances[1])
+    assert np.allclose(distances[1], geodesics.get_heat_geodesic_distances(scaled, [1, 2]))
+    assert np.all(distances[1][[1, 2]] == 0)
+
+    other = Mesh.from_obj(DATA_PATH / "distorted_v_closed_low_res.obj")
+    geodesics.get_heat_geodesic_solver(other)
+    assert len(geodesics._cgal_solver_cache) == 2
+    assert geodesics.get_heat_geodesic_solver(mesh) is not solver  # evicted, as scaled was used more recently
+
+
+def test_custom_heat_geodesics_match_cgal():
+    """Tests that the prefactored custom heat method solves batches of sources, close to the CGAL distances."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    sources = [[0], [1, *mesh.vertex_neighbors(1)]]  # connected sources, like the clusters of a CompoundTarget
+
+    distances = geodesics.get_custom_HEAT_geodesic_distances_list(mesh, sources)
+    assert geodesics.get_geodesics_solver(mesh) is geodesics.get_geodesics_solver(mesh)
+    assert np.allclose(distances[1], geodesics.get_custom_HEAT_geodesic_distances(mesh, sources[1]))
+    for vstarts, custom, cgal in zip(sources, distances, geodesics.get_heat_geodesic_distances_list(mesh, sources)):
+        assert np.all(custom[vstarts] == 0)
+        assert np.abs(custom - cgal).max() < 0.1 * cgal.max()
+        assert np.abs(custom - cgal).mean() < 0.05 * cgal.max()
+
+
+def test_custom_heat_geodesics_solver_does_not_keep_meshes_alive():
+    """Tests that the cached solver of a mesh is released with its mesh."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    geodesics.get_custom_HEAT_geodesic_distances(mesh, [0])
+    assert mesh in geodesics._geodesics_solver_cache
+    mesh_ref = weakref.ref(mesh)
+    del mesh
+    gc.collect()
+    assert mesh_ref() is None
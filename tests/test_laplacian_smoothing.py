@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import numpy as np
+from compas.datastructures import Mesh
+
+import compas_slicer.utilities as utils
+from compas_slicer.pre_processing.preprocessing_utils import CompoundTarget, LaplacianSmoother
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def test_laplacian_smoothing_of_all_clusters(tmp_path):
+    """Tests that smoothing all clusters together equals smoothing each cluster, and keeps the boundary values."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] < 5.0 else 2 if data["z"] > 190.0 else 0
+    boundary = np.array([data["boundary"] > 0 for _vkey, data in mesh.vertices(data=True)])
+    target = CompoundTarget(mesh, "boundary", 1, tmp_path, geodesics_method="heat")
+    distances = target.get_all_distances_array().copy()
+
+    L = utils.get_mesh_cotmatrix(mesh, fix_boundaries=True)
+    assert L[boundary].nnz == 0
+    expected = []
+    for a in distances:
+        for _ in range(20):
+            a = a + 0.05 * L * a
+        expected.append(a)
+
+    smoother = LaplacianSmoother(mesh)
+    target.laplacian_smoothing(iterations=20, strength=0.05, smoother=smoother)
+    assert np.allclose(target.get_all_distances_array(), expected, rtol=0.0, atol=1e-9)
+
+    implicit = smoother.smooth(distances.T, iterations=20, strength=0.05, implicit=True)
+    assert np.array_equal(implicit[boundary], distances.T[boundary])
+    assert np.allclose(implicit, np.array(expected).T, rtol=0.0, atol=0.01 * np.max(distances))
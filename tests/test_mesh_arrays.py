@@ -0,0 +1,58 @@
+import gc
+import weakref
+from pathlib import Path
+
+import numpy as np
+from compas.datastructures import Mesh
+
+from compas_slicer.utilities import get_mesh_arrays, get_mesh_cotans, invalidate_mesh_arrays
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def test_mesh_arrays_match_mesh():
+    """Tests the arrays against the mesh, and the edge-face adjacency against the halfedges."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    arrays = get_mesh_arrays(mesh)
+    V, F = mesh.to_vertices_and_faces()
+
+    assert np.allclose(arrays.V, V)
+    assert np.array_equal(arrays.F, F)
+    assert [tuple(e) for e in arrays.edge_keys.tolist()] == list(mesh.edges())
+    assert np.allclose(arrays.face_areas, [mesh.face_area(f) for f in mesh.faces()])
+    assert np.allclose(arrays.face_normals, [mesh.face_normal(f) for f in mesh.faces()])
+
+    for (u, v), (f0, f1) in zip(arrays.edge_keys.tolist(), arrays.edge_faces.tolist()):
+        faces = {mesh.halfedge_face((u, v)), mesh.halfedge_face((v, u))} - {None}
+        assert {arrays.face_keys[f] for f in (f0, f1) if f >= 0} == faces
+
+
+def test_get_mesh_arrays_is_cached():
+    """Tests that the arrays of a mesh are reused, and recomputed when faces are added or after invalidation."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    arrays = get_mesh_arrays(mesh)
+    cotans = get_mesh_cotans(mesh)
+    assert get_mesh_arrays(mesh) is arrays
+
+    vkey = next(iter(mesh.vertices()))
+    mesh.vertex_attribute(vkey, "x", mesh.vertex_attribute(vkey, "x") + 1.0)
+    assert get_mesh_arrays(mesh) is arrays
+    invalidate_mesh_arrays(mesh)
+    assert get_mesh_arrays(mesh) is not arrays
+    assert not np.allclose(get_mesh_cotans(mesh), cotans)
+
+    arrays = get_mesh_arrays(mesh)
+    mesh.add_face(mesh.face_vertices(next(iter(mesh.faces())))[::-1])
+    assert get_mesh_arrays(mesh) is not arrays
+
+
+def test_get_mesh_arrays_does_not_keep_meshes_alive():
+    """Tests that the cached arrays do not hold a strong reference to their mesh."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    arrays = get_mesh_arrays(mesh)
+    arrays.get_bvh()
+    mesh_ref = weakref.ref(mesh)
+    del mesh
+    gc.collect()
+    assert mesh_ref() is None
+    assert not arrays.is_valid()
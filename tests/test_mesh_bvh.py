@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import numpy as np
+from compas.datastructures import Mesh
+
+from compas_slicer.utilities import MeshBVH, get_mesh_bvh, invalidate_mesh_arrays
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def _point_triangle_distances(point, a, b, c):
+    """Distances from a point to all triangles: to the projection on the plane if it is inside the
+    triangle, otherwise to the closest of the three edges."""
+    normals = np.cross(b - a, c - a)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    heights = np.einsum("ij,ij->i", point - a, normals)
+    projected = point - heights[:, np.newaxis] * normals
+    inside = np.ones(len(a), dtype=bool)
+    for start, end in ((a, b), (b, c), (c, a)):
+        inside &= np.einsum("ij,ij->i", np.cross(end - start, projected - start), normals) >= 0
+
+    edge_distances = []
+    for start, end in ((a, b), (b, c), (c, a)):
+        edge = end - start
+        t = np.clip(np.einsum("ij,ij->i", point - start, edge) / np.einsum("ij,ij->i", edge, edge), 0.0, 1.0)
+        edge_distances.append(np.linalg.norm(start + t[:, np.newaxis] * edge - point, axis=1))
+    return np.where(inside, np.abs(heights), np.min(edge_distances, axis=0))
+
+
+def test_mesh_bvh_closest_points_match_brute_force():
+    """Tests that the BVH finds the same closest distances as testing all the faces."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_v_closed_low_res.obj")
+    V, F = mesh.to_vertices_and_faces()
+    V, F = np.array(V), np.array(F)
+    bvh = MeshBVH(V, F, leaf_size=4)
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform(V.min(axis=0) - 10.0, V.max(axis=0) + 10.0, size=(300, 3))
+    face_indices, closest, bar_coords = bvh.closest_points(points, chunk_size=128)
+
+    for point, fi, cp in zip(points, face_indices, closest):
+        distances = _point_triangle_distances(point, V[F[:, 0]], V[F[:, 1]], V[F[:, 2]])
+        assert abs(np.linalg.norm(cp - point) - distances.min()) < 1e-9
+        assert abs(np.linalg.norm(cp - point) - distances[fi]) < 1e-9
+    assert np.allclose(np.einsum("ij,ijk->ik", bar_coords, V[F[face_indices]]), closest)
+
+
+def test_get_mesh_bvh_is_cached():
+    """Tests that the BVH of a mesh is built once, and rebuilt after the mesh arrays are invalidated."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    bvh = get_mesh_bvh(mesh)
+    assert get_mesh_bvh(mesh) is bvh
+
+    vkey = next(iter(mesh.vertices()))
+    mesh.vertex_attribute(vkey, "z", mesh.vertex_attribute(vkey, "z") + 1.0)
+    invalidate_mesh_arrays(mesh)
+    assert get_mesh_bvh(mesh) is not bvh
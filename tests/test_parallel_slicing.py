@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from compas.datastructures import Mesh
+
+from compas_slicer.config import InterpolationConfig
+from compas_slicer.pre_processing import InterpolationSlicingPreprocessor
+from compas_slicer.slicers import InterpolationSlicer, UVSlicer
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def _uv_slice(workers):
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    xs, zs = mesh.vertices_attribute("x"), mesh.vertices_attribute("z")
+    x_min, z_min = min(xs), min(zs)
+    x_range, z_range = max(xs) - x_min, max(zs) - z_min
+    vkey_to_uv = {
+        vkey: ((data["z"] - z_min) / z_range, (data["x"] - x_min) / x_range) for vkey, data in mesh.vertices(data=True)
+    }
+    slicer = UVSlicer(mesh, vkey_to_uv, no_of_isocurves=6, workers=workers)
+    slicer.generate_paths()
+    return [[(path.is_closed, [list(pt) for pt in path.points]) for path in layer.paths] for layer in slicer.layers]
+
+
+def test_parallel_uv_slicing_matches_serial():
+    """Tests that contouring in worker processes gives the same layers, in the same order, as serial contouring."""
+    serial = _uv_slice(workers=1)
+    assert sum(len(layer) for layer in serial) > 0
+    assert _uv_slice(workers=3) == serial
+
+
+def _interpolation_slice(workers, tmp_path):
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    mesh.update_default_vertex_attributes({"boundary": 0})
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] < 1.0 else 2 if data["z"] > 70.0 else 0
+    config = InterpolationConfig(avg_layer_height=5.0)
+    preprocessor = InterpolationSlicingPreprocessor(mesh, config, tmp_path)
+    preprocessor.create_compound_targets()
+    slicer = InterpolationSlicer(mesh, preprocessor, config, workers=workers)
+    slicer.generate_paths()
+    return [[(path.is_closed, [list(pt) for pt in path.points]) for path in layer.paths] for layer in slicer.layers]
+
+
+def test_parallel_interpolation_slicing_matches_serial(tmp_path):
+    """Tests that interpolation contouring in worker processes gives the same layers as serial contouring."""
+    serial = _interpolation_slice(1, tmp_path)
+    assert sum(len(layer) for layer in serial) > 1
+    assert _interpolation_slice(3, tmp_path) == serial
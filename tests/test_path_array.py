@@ -0,0 +1,78 @@
+import numpy as np
+from compas.geometry import Point
+
+from compas_slicer.geometry import Path, PathArray
+
+
+def square_path() -> PathArray:
+    coords = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]]
+    return PathArray(np.array(coords, dtype=float), is_closed=True)
+
+
+def test_points_view_compatibility():
+    """Tests that the points view behaves like a list of Points and writes through to the array."""
+    path = square_path()
+    assert isinstance(path, Path)
+    assert len(path.points) == 5
+    assert path.points[1] == Point(1, 0, 0)
+    assert path.points[0] == path.points[-1]
+    assert np.asarray(path.points) is path.coords
+
+    path.points.pop(-1)
+    path.points.append(Point(5, 5, 5))
+    path.points[0] = Point(2, 2, 2)
+    assert path.coords.tolist() == [[2, 2, 2], [1, 0, 0], [1, 1, 0], [0, 1, 0], [5, 5, 5]]
+
+
+def test_roll_and_reverse():
+    """Tests seam shifts of closed paths and zero-copy reversal."""
+    path = square_path()
+    path.roll(-2)
+    assert path.coords.tolist() == [[1, 1, 0], [0, 1, 0], [0, 0, 0], [1, 0, 0], [1, 1, 0]]
+
+    reversed_path = path.reversed()
+    assert np.shares_memory(reversed_path.coords, path.coords)
+    assert reversed_path.points[1] == Point(1, 0, 0)
+
+
+def test_path_array_serialization():
+    """Tests that PathArray serializes to the same format as Path."""
+    path = square_path()
+    data = path.to_data()
+    assert data == path.to_path().to_data()
+    assert PathArray.from_data(data) == path
+    assert Path.from_data(data).points == path.to_path().points
+
+
+if __name__ == "__main__":
+    pass
+
+
+def test_points_view_copies_shared_coords_once():
+    """Tests that writing single points copies an array shared with the caller or other paths only once."""
+    coords = np.zeros((4, 3))
+    path = PathArray(coords)
+    child = path.sliced(0, 2)
+    path.points[0] = [1.0, 1.0, 1.0]
+    owned = path.coords
+    path.points[1] = [2.0, 2.0, 2.0]
+    assert path.coords is owned
+    assert not coords.any() and not child.coords.any()
+    assert path.points[:2] == [Point(1, 1, 1), Point(2, 2, 2)]
+
+
+def test_points_view_items_write_back():
+    """Tests that modifying the returned points in place changes the path, and copies do not."""
+    path = square_path()
+    path.points[1][2] += 2.0
+    path.points[2].z = 3.0
+    point = path.points[-1]
+    point += [1.0, 1.0, 1.0]
+    for point in path.points[:1]:
+        point.x = 4.0
+    assert path.coords.tolist() == [[4, 0, 0], [1, 0, 2], [1, 1, 3], [0, 1, 0], [1, 1, 1]]
+
+    copied = path.points[0].copy()
+    copied.x = 5.0
+    assert type(copied) is Point
+    assert path.coords[0, 0] == 4.0
@@ -126,6 +126,23 @@ def test_planar_add_safety_printpoints_for_horizontal_layers():
         )
 
 
+def test_planar_printpoints_up_vectors_and_frames():
+    """Tests that the batched up vectors match the per-point computation and are used by the frames."""
+
+    for filename in stl_to_test:
+        slicer, print_organizer = create_setup(filename)
+
+        for i, layer in enumerate(slicer.layers):
+            for j, path in enumerate(layer.paths):
+                for k, ppt in enumerate(print_organizer.printpoints[i][j]):
+                    if layer.is_brim or layer.is_raft:
+                        expected = [0.0, 0.0, 1.0]
+                    else:
+                        expected = print_organizer.get_printpoint_up_vector(path, k, ppt.mesh_normal)
+                    assert np.allclose(ppt.up_vector, expected)
+                    assert np.allclose(ppt.frame.xaxis, ppt.get_frame().xaxis)
+
+
 def test_planar_set_linear_velocity_constant_for_horizontal_layers():
     """Tests set_linear_velocity on planar slicer, with constant value."""
     pass
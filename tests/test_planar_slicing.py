@@ -1,10 +1,12 @@
 from pathlib import Path
 
+import numpy as np
 from compas.datastructures import Mesh
 
 from compas_slicer.geometry import Layer
 from compas_slicer.geometry import Path as SlicerPath
 from compas_slicer.slicers import PlanarSlicer
+from compas_slicer.slicers.planar_slicing import FaceIntervalIndex
 
 DATA_PATH = Path(__file__).parent / "tests_data"
 
@@ -34,5 +36,76 @@ def test_planar_slicing_success():
         )
 
 
+def test_planar_slicing_numpy_backend_matches_cgal():
+    """Tests that the numpy backend produces the same layers as the cgal backend."""
+    cgal_slicer = PlanarSlicer(compas_mesh, layer_height=layer_height, backend="cgal")
+    cgal_slicer.generate_paths()
+    numpy_slicer = PlanarSlicer(compas_mesh, layer_height=layer_height, backend="numpy")
+    numpy_slicer.generate_paths()
+
+    assert len(numpy_slicer.layers) == len(cgal_slicer.layers) == no_of_layers
+    for numpy_layer, cgal_layer in zip(numpy_slicer.layers, cgal_slicer.layers):
+        assert len(numpy_layer.paths) == len(cgal_layer.paths)
+        for numpy_path, cgal_path in zip(numpy_layer.paths, cgal_layer.paths):
+            assert numpy_path.is_closed == cgal_path.is_closed
+            assert len(numpy_path.points) == len(cgal_path.points)
+            assert abs(numpy_path.points[0][2] - cgal_path.points[0][2]) < 1e-6
+
+
+def _canonical_paths(layer):
+    """Returns the paths of a layer independent of their order and of the start point of closed paths."""
+    paths = []
+    for path in layer.paths:
+        pts = np.asarray(path.points, dtype=np.float64)
+        if path.is_closed:
+            start = np.lexsort(pts[:-1].T[::-1])[0]  # lexicographically smallest point
+            pts = np.roll(pts[:-1], -start, axis=0)
+        paths.append((path.is_closed, pts.round(9).tolist()))
+    return sorted(paths)
+
+
+def test_planar_slicing_workers_match_serial():
+    """Tests that slicing in parallel bands gives the same layers as serial slicing.
+
+    The numpy backend gives identical layers. CGAL workers only receive the faces of their band, so closed
+    paths may start at another point and the paths of a layer may come in another order.
+    """
+    for backend in ["cgal", "numpy"]:
+        serial = PlanarSlicer(compas_mesh, layer_height=layer_height / 4, backend=backend)
+        serial.generate_paths()
+        parallel = PlanarSlicer(compas_mesh, layer_height=layer_height / 4, backend=backend, workers=3)
+        parallel.generate_paths()
+
+        assert len(parallel.layers) == len(serial.layers)
+        for parallel_layer, serial_layer in zip(parallel.layers, serial.layers):
+            if backend == "numpy":
+                assert [path.points for path in parallel_layer.paths] == [path.points for path in serial_layer.paths]
+            else:
+                assert _canonical_paths(parallel_layer) == _canonical_paths(serial_layer)
+
+
+def test_iter_layers_matches_slice_model():
+    """Tests that streaming the layers gives the same result as slicing the whole model."""
+    slicer = PlanarSlicer(compas_mesh, layer_height=layer_height / 4)
+    slicer.slice_model()
+    streaming_slicer = PlanarSlicer(compas_mesh, layer_height=layer_height / 4)
+    streamed_layers = list(streaming_slicer.iter_layers())
+
+    assert streaming_slicer.layers == [], "Streamed layers should not be stored on the slicer"
+    assert len(streamed_layers) == len(slicer.layers)
+    for streamed_layer, layer in zip(streamed_layers, slicer.layers):
+        assert [path.points for path in streamed_layer.paths] == [path.points for path in layer.paths]
+
+
+def test_face_interval_index_sweep():
+    """Tests that the sweep yields exactly the faces whose z span contains each height."""
+    index = FaceIntervalIndex.from_mesh(compas_mesh)
+    heights = [max_z, min_z, 0.5 * (min_z + max_z), min_z + layer_height]
+    for i, active in index.sweep(heights):
+        h = heights[i]
+        expected = [f for f in range(len(index.F)) if index.face_min[f] <= h < index.face_max[f]]
+        assert sorted(active.tolist()) == expected
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,175 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.pre_processing import InterpolationSlicingPreprocessor
+from compas_slicer.pre_processing.preprocessing_utils import region_split as rs
+from compas_slicer.pre_processing.preprocessing_utils.assign_vertex_distance import (
+    assign_interpolation_distance_to_mesh_vertex,
+    get_interpolation_distances_grid,
+)
+from compas_slicer.pre_processing.preprocessing_utils.compound_target import CompoundTarget
+from compas_slicer.pre_processing.preprocessing_utils.region_split import (
+    _trimesh_cut_mesh,
+    _trimesh_face_components,
+    find_weight_intersecting_distances,
+    find_weight_intersecting_vkey_on_grid,
+    separate_disconnected_components,
+    weld_mesh,
+)
+from compas_slicer.utilities import get_output_directory
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+@pytest.mark.parametrize("union_method, union_params", [("min", []), ("smooth", [10.0])])
+def test_interpolation_distances_grid_matches_single_vertex(tmp_path, union_method, union_params):
+    """Tests that the distances of many vertices and weights at once equal those of every vertex and weight."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] > 190.0 else 2 if data["z"] < 5.0 else 0
+    target_low = CompoundTarget(mesh, "boundary", 1, tmp_path, geodesics_method="heat")
+    target_high = CompoundTarget(mesh, "boundary", 2, tmp_path, union_method, union_params, geodesics_method="heat")
+    target_high.compute_uneven_boundaries_weight_max(target_low)
+    assert target_high.has_uneven_weights
+
+    vkeys, weights = [0, 10, 100, 200], np.linspace(0.001, 0.999, 7)
+    expected = [
+        [assign_interpolation_distance_to_mesh_vertex(vkey, w, target_low, target_high) for w in weights.tolist()]
+        for vkey in vkeys
+    ]
+    assert np.array_equal(get_interpolation_distances_grid(vkeys, weights, target_low, target_high), expected)
+
+
+def test_find_weight_intersecting_distances():
+    weights = np.linspace(0.0, 1.0, 11)
+    assert find_weight_intersecting_distances(weights, 3.0 - 10.0 * weights, threshold=0.02) == pytest.approx(0.3)
+    with pytest.raises(ValueError):
+        find_weight_intersecting_distances(weights, 30.0 - 10.0 * weights, threshold=0.02, vkey=4)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1000])
+def test_find_weight_intersecting_vkey_on_grid_matches_whole_grid(tmp_path, block_size):
+    """Tests that searching the grid of weights in blocks finds the same weights as searching the whole grid."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] > 190.0 else 2 if data["z"] < 5.0 else 0
+    target_low = CompoundTarget(mesh, "boundary", 1, tmp_path, geodesics_method="heat")
+    target_high = CompoundTarget(mesh, "boundary", 2, tmp_path, "smooth", [10.0], geodesics_method="heat")
+    target_high.compute_uneven_boundaries_weight_max(target_low)
+
+    weights = np.linspace(0.001, 0.999, 500)
+    vkeys = list(mesh.vertices())[::10]
+    distances = get_interpolation_distances_grid(vkeys, weights, target_low, target_high)
+    found = 0
+    for vkey, ds in zip(vkeys, distances):
+        try:
+            expected = find_weight_intersecting_distances(weights, ds, threshold=2.0)
+        except ValueError:
+            with pytest.raises(ValueError):
+                find_weight_intersecting_vkey_on_grid(vkey, weights, target_low, target_high, 2.0, block_size)
+        else:
+            found += 1
+            assert (
+                find_weight_intersecting_vkey_on_grid(vkey, weights, target_low, target_high, 2.0, block_size)
+                == expected
+            )
+    assert found > 0
+
+
+def cylinder_with_cut():
+    """Returns the open cylinder with its middle ring of vertices marked as cut 1, a closed loop of 16 vertices."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    mesh.update_default_vertex_attributes({"boundary": 0, "cut": 0})
+    for _vkey, data in mesh.vertices(data=True):
+        if 30.0 < data["z"] < 40.0:
+            data["cut"] = 1
+    return mesh
+
+
+def test_trimesh_cut_mesh_closed_loop():
+    """Tests that cutting along a closed loop duplicates the loop vertices once and separates two pieces."""
+    mesh = cylinder_with_cut()
+    v, f = mesh.to_vertices_and_faces()
+    v, f = np.array(v), np.array(f)
+    on_cut = np.array(mesh.vertices_attribute("cut")) == 1
+    cut_flags = on_cut[f] & on_cut[np.roll(f, -1, axis=1)]
+
+    v_cut, f_cut = _trimesh_cut_mesh(v, f, cut_flags)
+    assert len(v_cut) == len(v) + 16
+    assert sorted(np.bincount(_trimesh_face_components(v_cut, f_cut)).tolist()) == [32, 32]
+
+    v_uncut, f_uncut = _trimesh_cut_mesh(v, f, np.zeros_like(cut_flags))
+    assert len(v_uncut) == len(v) and np.array_equal(f_uncut, f)
+
+
+def test_weld_mesh(tmp_path):
+    """Tests that weld_mesh merges the duplicated vertices of a cut and leaves the input mesh unchanged."""
+    mesh = cylinder_with_cut()
+    v, f = mesh.to_vertices_and_faces()
+    on_cut = np.array(mesh.vertices_attribute("cut")) == 1
+    cut_flags = on_cut[f] & on_cut[np.roll(f, -1, axis=1)]
+    v_cut, f_cut = _trimesh_cut_mesh(np.array(v), np.array(f), cut_flags)
+    cut_mesh = Mesh.from_vertices_and_faces(v_cut.tolist(), f_cut.tolist())
+
+    welded_mesh = weld_mesh(cut_mesh, tmp_path)
+    assert welded_mesh.number_of_vertices() == len(v)
+    assert welded_mesh.number_of_faces() == len(f)
+    assert cut_mesh.number_of_vertices() == len(v_cut)
+
+
+def test_separate_disconnected_components(tmp_path):
+    split_meshes = separate_disconnected_components(cylinder_with_cut(), "cut", [1], tmp_path)
+    assert sorted(split_meshes[i].number_of_faces() for i in range(2)) == [32, 32]
+    for split_mesh in split_meshes:
+        assert split_mesh.number_of_vertices() == 32
+        assert split_mesh.vertices_attribute("cut").count(1) == 16
+
+
+def test_region_split_continues_from_mesh_with_cuts(tmp_path):
+    """Tests that region_split without cutting loads mesh_with_cuts.json when the mesh has no cuts."""
+    preprocessor = InterpolationSlicingPreprocessor(Mesh.from_obj(DATA_PATH / "cylinder.obj"), DATA_PATH=tmp_path)
+    with pytest.raises(ValueError):
+        preprocessor.region_split(cut_mesh=False, topological_sorting=False, save_split_meshes=False)
+
+    cylinder_with_cut().to_json(str(get_output_directory(tmp_path) / "mesh_with_cuts.json"))
+    for _ in range(2):  # the second run loads the split meshes from the checkpoint
+        preprocessor = InterpolationSlicingPreprocessor(Mesh.from_obj(DATA_PATH / "cylinder.obj"), DATA_PATH=tmp_path)
+        preprocessor.region_split(cut_mesh=False, topological_sorting=False, save_split_meshes=False)
+        assert sorted(m.number_of_faces() for m in preprocessor.split_meshes) == [32, 32]
+    assert len(list((get_output_directory(tmp_path) / "checkpoints").glob("separate_*.npz"))) == 1
+
+
+def cylinder_with_boundaries():
+    """Returns the open cylinder with its lower ring as boundary 1 and its upper ring as boundary 2."""
+    mesh = Mesh.from_obj(DATA_PATH / "cylinder.obj")
+    mesh.update_default_vertex_attributes({"boundary": 0})
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] < 1.0 else 2 if data["z"] > 70.0 else 0
+    return mesh
+
+
+def test_region_split_cut_checkpoint_assigns_targets(tmp_path, monkeypatch):
+    """Tests that loading the cuts from the checkpoint leaves the targets in the same state as cutting."""
+    runs = []
+
+    def run(mesh_splitter):  # stands in for the slow cut, changing the vertices of the mesh
+        runs.append(mesh_splitter)
+        mesh_splitter.mesh = mesh_splitter.mesh.copy()
+        mesh_splitter.mesh.insert_vertex(next(iter(mesh_splitter.mesh.faces())))
+
+    monkeypatch.setattr(rs.MeshSplitter, "run", run)
+    distances = []
+    for _ in range(2):  # the second run loads the cuts from the checkpoint
+        preprocessor = InterpolationSlicingPreprocessor(cylinder_with_boundaries(), DATA_PATH=tmp_path)
+        preprocessor.create_compound_targets()
+        preprocessor.region_split(separate_neighborhoods=False, topological_sorting=False, save_split_meshes=False)
+        targets = [preprocessor.target_LOW, preprocessor.target_HIGH]
+        assert all(preprocessor.mesh.number_of_vertices() == target.VN for target in targets)
+        distances.append([target.get_all_distances_array() for target in targets])
+
+    assert len(runs) == 1
+    assert distances[0][0].shape[1] == cylinder_with_boundaries().number_of_vertices() + 1
+    assert all(np.array_equal(first, second) for first, second in zip(*distances))
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.pre_processing import GradientEvaluation
+from compas_slicer.slicers.slice_utilities import ScalarFieldContours
+from compas_slicer.utilities import ScalarField
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+def test_scalar_field_matches_mesh_attribute_path(tmp_path):
+    """Tests that contours and gradients of a ScalarField equal those of the 'scalar_field' vertex attribute."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_v_closed_low_res.obj")
+    scalar_field = ScalarField(mesh, [data["z"] - 100.0 + 0.1 * data["x"] for _vkey, data in mesh.vertices(data=True)])
+    with pytest.raises(ValueError):
+        ScalarField(mesh, scalar_field.values[:-1])
+    with pytest.raises(ValueError):
+        ScalarField.from_mesh_attribute(mesh)
+
+    contours = ScalarFieldContours(mesh, scalar_field)
+    contours.compute()
+    g_evaluation = GradientEvaluation(mesh, tmp_path, scalar_field.values)
+    g_evaluation.compute_gradient()
+    g_evaluation.find_critical_points()
+    assert "scalar_field" not in mesh.vertex_attributes(0)
+
+    scalar_field.to_mesh_attribute()
+    assert np.array_equal(ScalarField.from_mesh_attribute(mesh).values, scalar_field.values)
+    attribute_contours = ScalarFieldContours(mesh)
+    attribute_contours.compute()
+    attribute_g_evaluation = GradientEvaluation(mesh, tmp_path)
+    attribute_g_evaluation.compute_gradient()
+    attribute_g_evaluation.find_critical_points()
+
+    assert contours.sorted_point_clusters == attribute_contours.sorted_point_clusters
+    assert len(contours.sorted_point_clusters) > 0
+    assert np.array_equal(g_evaluation.face_gradient, attribute_g_evaluation.face_gradient)
+    assert (g_evaluation.minima, g_evaluation.maxima, g_evaluation.saddles) == (
+        attribute_g_evaluation.minima,
+        attribute_g_evaluation.maxima,
+        attribute_g_evaluation.saddles,
+    )
+
+
+def test_critical_points_match_one_ring_loop(tmp_path):
+    """Tests that the vectorized critical points equal those of the per-vertex sign change count."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    rng = np.random.default_rng(0)
+    values = np.round(rng.random(mesh.number_of_vertices()), 1)  # rounded, so that some neighbors are equal
+    g_evaluation = GradientEvaluation(mesh, tmp_path, values)
+    g_evaluation.find_critical_points()
+
+    minima, maxima, saddles = [], [], []
+    for i, vkey in enumerate(mesh.vertices()):
+        neighbors = mesh.vertex_neighbors(vkey, ordered=True)
+        if len(neighbors) == 0:
+            continue
+        neighbors.append(neighbors[0])
+        ring = [values[i] - g_evaluation.scalar_field.value(n) for n in neighbors]
+        ring = [d for d in ring if abs(d) > 0.0]
+        sgc = sum(d0 * d1 < 0 for d0, d1 in zip(ring[:-1], ring[1:]))
+        if sgc == 0:
+            (maxima if values[i] > g_evaluation.scalar_field.value(neighbors[0]) else minima).append(vkey)
+        if sgc > 2 and sgc % 2 == 0:
+            saddles.append(vkey)
+
+    assert len(saddles) > 0
+    assert (g_evaluation.minima, g_evaluation.maxima, g_evaluation.saddles) == (minima, maxima, saddles)
@@ -0,0 +1,75 @@
+import itertools
+
+import pytest
+
+from compas_slicer.pre_processing.preprocessing_utils.topological_sorting import DirectedGraph
+
+
+class _EdgesDirectedGraph(DirectedGraph):
+    """DirectedGraph of given edges, where the cost of a transition is the distance between node positions."""
+
+    def __init__(self, n, edges, positions):
+        self.n, self.edges, self.positions = n, edges, positions
+        DirectedGraph.__init__(self)
+
+    def find_roots(self):
+        return [i for i in range(self.n) if all(child != i for _, child in self.edges)]
+
+    def find_ends(self):
+        return [i for i in range(self.n) if all(parent != i for parent, _ in self.edges)]
+
+    def create_graph_nodes(self):
+        for i in range(self.n):
+            self.G.add_node(i)
+
+    def get_children_of_node(self, root):
+        children = [child for parent, child in self.edges if parent == root]
+        return children, [None for _ in children]
+
+    def travel_distance(self, i, j):
+        return abs(self.positions[j] - self.positions[i])
+
+
+@pytest.fixture
+def graph():
+    # two roots, each carrying a chain of segments, that can be interleaved in many ways
+    edges = [(0, 2), (2, 4), (4, 6), (1, 3), (3, 5), (5, 7), (6, 8), (7, 8)]
+    positions = [0.0, 10.0, 9.0, 1.0, 2.0, 8.0, 7.0, 3.0, 5.0]
+    return _EdgesDirectedGraph(9, edges, positions)
+
+
+def _brute_force_best_cost(graph):
+    is_valid = lambda order: all(order.index(i) < order.index(j) for i, j in graph.edges)  # noqa: E731
+    orders = [list(order) for order in itertools.permutations(range(graph.n)) if is_valid(list(order))]
+    costs = [sum(graph.travel_distance(i, j) for i, j in zip(order[:-1], order[1:])) for order in orders]
+    return len(orders), min(costs)
+
+
+def test_topological_orders_are_yielded_lazily_in_order(graph):
+    """Tests that the lazy orders match the enumerated orders, and that they leave the graph unchanged."""
+    in_degree = list(graph.in_degree)
+    first = next(graph.iter_topological_orders())
+    assert graph.in_degree == in_degree
+
+    all_orders = graph.get_all_topological_orders()
+    assert all_orders[0] == first
+    assert list(graph.iter_topological_orders()) == all_orders
+    assert len(all_orders) == _brute_force_best_cost(graph)[0]
+
+
+def test_best_topological_order_minimizes_travel_distance(graph):
+    """Tests that branch and bound finds an optimal order, and that beam search finds a valid order."""
+    best_cost = _brute_force_best_cost(graph)[1]
+
+    def order_cost(order):
+        return sum(graph.travel_distance(i, j) for i, j in zip(order[:-1], order[1:]))
+
+    best_order = graph.get_best_topological_order()
+    assert best_order in graph.get_all_topological_orders()
+    assert order_cost(best_order) == best_cost
+
+    beam_order = graph.get_best_topological_order(beam_width=3)
+    assert beam_order in graph.all_orders
+    assert order_cost(beam_order) >= best_cost
+
+    assert graph.get_best_topological_order(cost=lambda i, j: 0.0) == graph.all_orders[0]
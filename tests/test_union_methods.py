@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from compas.datastructures import Mesh
+
+from compas_slicer.pre_processing.preprocessing_utils.compound_target import (
+    CompoundTarget,
+    blend_union_list,
+    chamfer_union_list,
+    stairs_union_list,
+    union_array,
+)
+
+DATA_PATH = Path(__file__).parent / "tests_data"
+
+
+@pytest.mark.parametrize(
+    "union_method, union_params, union_list",
+    [
+        ("smooth", [5.0], blend_union_list),
+        ("chamfer", [5.0], chamfer_union_list),
+        ("stairs", [5.0, 3], stairs_union_list),
+    ],
+)
+def test_union_arrays_match_union_lists(union_method, union_params, union_list):
+    """Tests that the union of the distances of all vertices at once equals the union of every vertex."""
+    rng = np.random.default_rng(0)
+    distances = rng.uniform(-20.0, 100.0, (4, 500))
+    distances[:, :50] = distances[0, :50] + rng.uniform(-3.0, 3.0, (4, 50))  # within the blend radius
+
+    expected = [union_list(distances[:, i].tolist(), *union_params) for i in range(distances.shape[1])]
+    assert np.array_equal(union_array(distances, union_method, union_params), expected)
+
+
+def test_union_array_unknown_method():
+    with pytest.raises(ValueError):
+        union_array(np.zeros((2, 3)), "unknown", [])
+
+
+def test_compound_target_memoizes_union(tmp_path):
+    """Tests that the union of a CompoundTarget is computed once, and recomputed when its distances change."""
+    mesh = Mesh.from_obj(DATA_PATH / "distorted_a_closed_low_res.obj")
+    for _vkey, data in mesh.vertices(data=True):
+        data["boundary"] = 1 if data["z"] < 5.0 else 2 if data["z"] > 190.0 else 0
+    target_low = CompoundTarget(mesh, "boundary", 1, tmp_path, "smooth", [10.0], geodesics_method="heat")
+    target_high = CompoundTarget(mesh, "boundary", 2, tmp_path, geodesics_method="heat")
+    assert target_low.number_of_boundaries == 2
+
+    distances = target_low.get_all_distances()
+    assert target_low.get_all_distances() is distances
+    assert not distances.flags.writeable
+    assert target_low.get_distance(3) == blend_union_list(target_low.get_all_distances_for_vkey(3), 10.0)
+    expected = np.average([distances[vkey] for vkey in target_high.all_target_vkeys])
+    assert target_low.get_avg_distances_from_other_target(target_high) == expected
+    assert target_high.get_boundaries_rel_dist_from_other_target(target_low, "mean") == [
+        pytest.approx(np.mean(distances[vkeys])) for vkeys in target_high.clustered_vkeys
+    ]
+
+    target_low.update_distances_lists((target_low.get_all_distances_array() * 2.0).tolist())
+    assert target_low.get_all_distances() is not distances
+    assert target_low.get_max_dist() == np.max(target_low.get_all_distances_array())
+    target_low.union_method = "min"
+    assert np.array_equal(target_low.get_all_distances(), target_low.get_all_distances_array().min(axis=0))
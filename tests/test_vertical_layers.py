@@ -0,0 +1,33 @@
+import math
+
+from compas.geometry import Point
+
+from compas_slicer.geometry import Path, VerticalLayersManager
+
+
+def _circle(cx, cy, z, radius=1.0, n=16):
+    return Path(
+        [
+            Point(cx + radius * math.cos(2 * math.pi * k / n), cy + radius * math.sin(2 * math.pi * k / n), z)
+            for k in range(n)
+        ],
+        is_closed=True,
+    )
+
+
+def test_paths_are_added_to_the_closest_head():
+    """Tests that the paths of interleaved columns are grouped per column, and that the heads are updated."""
+    manager = VerticalLayersManager(avg_layer_height=1.0)
+    columns = [(0.0, 0.0), (20.0, 0.0), (0.0, 20.0)]
+    for z in range(10):
+        for cx, cy in columns:
+            manager.add(_circle(cx + 0.1 * z, cy, float(z)))
+    manager.add(_circle(100.0, 100.0, 0.0))
+
+    assert len(manager.layers) == len(columns) + 1
+    for layer, (cx, cy) in zip(manager.layers, columns):
+        assert len(layer.paths) == 10
+        assert all(abs(path.points[0][1] - cy) < 1e-9 for path in layer.paths)
+        assert layer.min_max_z_height == (0.0, 9.0)
+        assert math.isclose(layer.head_centroid[0], cx + 0.9)
+    assert len(manager.layers[-1].paths) == 1